@@ -18,6 +18,7 @@ __version_str__ = ".".join(map(str, __version__))
 from quadrants import (
     ad,
     algorithms,
+    cache,
     experimental,
     interop,  # noqa: F401
     linalg,
@@ -73,6 +74,7 @@ __all__ = [
     "Tensor",
     "ad",
     "algorithms",
+    "cache",
     "experimental",
     "linalg",
     "math",
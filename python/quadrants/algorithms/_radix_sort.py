@@ -44,6 +44,13 @@ order by an in-place twiddle (first top-level ``for``) and restored by the inver
 participation); histogram ``atomic_add`` and the scatter store are gated on ``i < N`` so sentinels never pollute the
 histogram or write past the output.
 
+**CPU backends.** ``block.radix_rank_match_atomic_or`` and the shared-memory histograms have no CPU lowering, so on
+``x64`` / ``arm64`` (see ``_reduce._is_cpu_arch``) each tile of ``BLOCK_DIM`` keys is owned by one loop iteration,
+spread across the CPU threads: the histogram phase counts the tile's digits serially into its own column of the
+digit-major ``scratch`` (a per-thread histogram, no atomics), the same scan staircase turns the counts into offsets,
+and the scatter phase walks the tile in order, bumping its column's offset for each key. Walking each tile in order
+keeps the sort stable, and the scratch layout, hence :func:`sort_scratch_slots`, is unchanged.
+
 **Scratch.** The sort needs a **caller-owned** 1-D ``u32`` ``scratch`` buffer of :func:`sort_scratch_slots`
 ``(N, log256_max_n)`` slots (tile histograms + scan partials; ``u32`` regardless of key width, so 8-byte-key sorts
 have the same footprint as 4-byte ones). There is **no** module-level shared-scratch fallback - the caller always
@@ -59,7 +66,7 @@ from quadrants.lang.simt import block as _block
 from quadrants.types.annotations import template
 from quadrants.types.primitive_types import f32, f64, i32, i64, u32, u64
 
-from ._reduce import BLOCK_DIM, _at_least_one, _validate_log256_max_n
+from ._reduce import BLOCK_DIM, _at_least_one, _is_cpu_arch, _validate_log256_max_n
 from ._scan import _emit_exclusive_scan_add
 
 RADIX_BITS = 8
@@ -141,35 +148,49 @@ def _radix_hist(keys: template(), scratch: template(), n: i32, num_blocks: i32,
     """Per-block histogram of digit ``(key >> bit_start) & 0xFF`` into ``scratch`` (digit-major: ``d*num_blocks+b``).
 
     Tile histograms are ``u32`` regardless of key width (each count <= ``BLOCK_DIM`` = 256). ``key_width`` selects the
-    32- vs 64-bit digit extraction.
+    32- vs 64-bit digit extraction. On CPU backends each iteration counts one tile serially into its own column.
     """
-    loop_config(block_dim=BLOCK_DIM)
-    total_threads = num_blocks * BLOCK_DIM
-    for i in range(total_threads):
-        tid = i % BLOCK_DIM
-        block_id = i // BLOCK_DIM
-        # One extra "dump" slot (index RADIX_DIGITS) absorbs the increments of out-of-range lanes so the shared
-        # atomic_add below runs in *uniform* control flow. A guarded `if i < n: atomic_add(...)` would put the atomic
-        # - and the acquire-release memory barrier the codegen emits in front of every native atomic - inside
-        # thread-divergent control flow; on Metal / MoltenVK spirv-cross lowers that barrier to a full
-        # threadgroup_barrier, which is undefined behaviour when only some lanes of the tail block reach it and
-        # silently drops histogram counts. Keeping the atomic unconditional sidesteps that entirely.
-        hist = _block.SharedArray((RADIX_DIGITS + 1,), i32)
-        hist[tid] = i32(0)
-        if tid == 0:
-            hist[RADIX_DIGITS] = i32(0)
-        _block.sync()
-        digit = i32(RADIX_DIGITS)  # default to the dump slot for out-of-range lanes (unconditional first assignment)
-        if i < n:
-            if static(key_width == 32):
-                key32 = bit_cast(keys[i], u32)
-                digit = i32((key32 >> u32(bit_start)) & u32(RADIX_DIGITS - 1))
-            else:
-                key64 = bit_cast(keys[i], u64)
-                digit = i32((key64 >> u64(bit_start)) & u64(RADIX_DIGITS - 1))
-        atomic_add(hist[digit], i32(1))
-        _block.sync()
-        scratch[tid * num_blocks + block_id] = bit_cast(hist[tid], u32)
+    if static(_is_cpu_arch()):
+        for block_id in range(num_blocks):
+            for d in range(RADIX_DIGITS):
+                scratch[d * num_blocks + block_id] = u32(0)
+            for i in range(block_id * BLOCK_DIM, min((block_id + 1) * BLOCK_DIM, n)):
+                if static(key_width == 32):
+                    digit = i32((bit_cast(keys[i], u32) >> u32(bit_start)) & u32(RADIX_DIGITS - 1))
+                else:
+                    digit = i32((bit_cast(keys[i], u64) >> u64(bit_start)) & u64(RADIX_DIGITS - 1))
+                slot = digit * num_blocks + block_id
+                # The column is owned by this iteration: a plain increment, where ``+=`` would emit an atomic.
+                scratch[slot] = scratch[slot] + u32(1)
+    else:
+        loop_config(block_dim=BLOCK_DIM)
+        total_threads = num_blocks * BLOCK_DIM
+        for i in range(total_threads):
+            tid = i % BLOCK_DIM
+            block_id = i // BLOCK_DIM
+            # One extra "dump" slot (index RADIX_DIGITS) absorbs the increments of out-of-range lanes so the shared
+            # atomic_add below runs in *uniform* control flow. A guarded `if i < n: atomic_add(...)` would put the
+            # atomic - and the acquire-release memory barrier the codegen emits in front of every native atomic -
+            # inside thread-divergent control flow; on Metal / MoltenVK spirv-cross lowers that barrier to a full
+            # threadgroup_barrier, which is undefined behaviour when only some lanes of the tail block reach it and
+            # silently drops histogram counts. Keeping the atomic unconditional sidesteps that entirely.
+            hist = _block.SharedArray((RADIX_DIGITS + 1,), i32)
+            hist[tid] = i32(0)
+            if tid == 0:
+                hist[RADIX_DIGITS] = i32(0)
+            _block.sync()
+            # Default to the dump slot for out-of-range lanes (unconditional first assignment).
+            digit = i32(RADIX_DIGITS)
+            if i < n:
+                if static(key_width == 32):
+                    key32 = bit_cast(keys[i], u32)
+                    digit = i32((key32 >> u32(bit_start)) & u32(RADIX_DIGITS - 1))
+                else:
+                    key64 = bit_cast(keys[i], u64)
+                    digit = i32((key64 >> u64(bit_start)) & u64(RADIX_DIGITS - 1))
+            atomic_add(hist[digit], i32(1))
+            _block.sync()
+            scratch[tid * num_blocks + block_id] = bit_cast(hist[tid], u32)
 
 
 @_func
@@ -191,52 +212,70 @@ def _radix_scatter(
 
     For 64-bit keys the rank primitive only consumes the 8-bit digit, so we pre-extract the digit into a ``u32`` and
     feed it at ``bit_start=0``; the full-width key is what gets scattered.
+
+    On CPU backends each iteration walks one tile in order, taking each key's destination from the tile's scanned
+    offset for its digit and bumping that offset (the tile's column of ``scratch`` is only used by this iteration, and
+    the next pass's histogram phase overwrites it).
     """
-    loop_config(block_dim=BLOCK_DIM)
-    total_threads = num_blocks * BLOCK_DIM
-    for i in range(total_threads):
-        tid = i % BLOCK_DIM
-        block_id = i // BLOCK_DIM
-        bins = _block.SharedArray((RADIX_DIGITS,), i32)
-        excl_prefix = _block.SharedArray((RADIX_DIGITS,), i32)
-        block_offsets = _block.SharedArray((RADIX_DIGITS,), i32)
-        if static(key_width == 32):
-            key = u32(0xFFFFFFFF)
-            if i < n:
-                key = bit_cast(keys_in[i], u32)
-            rank = _block.radix_rank_match_atomic_or(
-                key, BLOCK_DIM, RADIX_BITS, bit_start, RADIX_BITS, bins, excl_prefix
-            )
-            digit = i32((key >> u32(bit_start)) & u32(RADIX_DIGITS - 1))
-            if tid < RADIX_DIGITS:
-                global_off = bit_cast(scratch[tid * num_blocks + block_id], i32)
-                # Subtract the block-local exclusive prefix: rebases rank from "position among all keys in this
-                # block" to "position among only this digit's keys in this block" (the intra-digit base offset).
-                block_offsets[tid] = global_off - excl_prefix[tid]
-            _block.sync()
-            if i < n:
-                dst = block_offsets[digit] + rank
-                keys_out[dst] = bit_cast(key, key_dtype)
-                if static(has_values):
-                    values_out[dst] = values_in[i]
-        else:
-            key = u64(0xFFFFFFFFFFFFFFFF)
-            if i < n:
-                key = bit_cast(keys_in[i], u64)
-            digit_only_u32 = u32((key >> u64(bit_start)) & u64(RADIX_DIGITS - 1))
-            rank = _block.radix_rank_match_atomic_or(
-                digit_only_u32, BLOCK_DIM, RADIX_BITS, 0, RADIX_BITS, bins, excl_prefix
-            )
-            digit = i32(digit_only_u32)
-            if tid < RADIX_DIGITS:
-                global_off = bit_cast(scratch[tid * num_blocks + block_id], i32)
-                block_offsets[tid] = global_off - excl_prefix[tid]
-            _block.sync()
-            if i < n:
-                dst = block_offsets[digit] + rank
-                keys_out[dst] = bit_cast(key, key_dtype)
+    if static(_is_cpu_arch()):
+        for block_id in range(num_blocks):
+            for i in range(block_id * BLOCK_DIM, min((block_id + 1) * BLOCK_DIM, n)):
+                if static(key_width == 32):
+                    digit = i32((bit_cast(keys_in[i], u32) >> u32(bit_start)) & u32(RADIX_DIGITS - 1))
+                else:
+                    digit = i32((bit_cast(keys_in[i], u64) >> u64(bit_start)) & u64(RADIX_DIGITS - 1))
+                slot = digit * num_blocks + block_id
+                dst = bit_cast(scratch[slot], i32)
+                scratch[slot] = bit_cast(dst + 1, u32)
+                keys_out[dst] = keys_in[i]
                 if static(has_values):
                     values_out[dst] = values_in[i]
+    else:
+        loop_config(block_dim=BLOCK_DIM)
+        total_threads = num_blocks * BLOCK_DIM
+        for i in range(total_threads):
+            tid = i % BLOCK_DIM
+            block_id = i // BLOCK_DIM
+            bins = _block.SharedArray((RADIX_DIGITS,), i32)
+            excl_prefix = _block.SharedArray((RADIX_DIGITS,), i32)
+            block_offsets = _block.SharedArray((RADIX_DIGITS,), i32)
+            if static(key_width == 32):
+                key = u32(0xFFFFFFFF)
+                if i < n:
+                    key = bit_cast(keys_in[i], u32)
+                rank = _block.radix_rank_match_atomic_or(
+                    key, BLOCK_DIM, RADIX_BITS, bit_start, RADIX_BITS, bins, excl_prefix
+                )
+                digit = i32((key >> u32(bit_start)) & u32(RADIX_DIGITS - 1))
+                if tid < RADIX_DIGITS:
+                    global_off = bit_cast(scratch[tid * num_blocks + block_id], i32)
+                    # Subtract the block-local exclusive prefix: rebases rank from "position among all keys in this
+                    # block" to "position among only this digit's keys in this block" (the intra-digit base offset).
+                    block_offsets[tid] = global_off - excl_prefix[tid]
+                _block.sync()
+                if i < n:
+                    dst = block_offsets[digit] + rank
+                    keys_out[dst] = bit_cast(key, key_dtype)
+                    if static(has_values):
+                        values_out[dst] = values_in[i]
+            else:
+                key = u64(0xFFFFFFFFFFFFFFFF)
+                if i < n:
+                    key = bit_cast(keys_in[i], u64)
+                digit_only_u32 = u32((key >> u64(bit_start)) & u64(RADIX_DIGITS - 1))
+                rank = _block.radix_rank_match_atomic_or(
+                    digit_only_u32, BLOCK_DIM, RADIX_BITS, 0, RADIX_BITS, bins, excl_prefix
+                )
+                digit = i32(digit_only_u32)
+                if tid < RADIX_DIGITS:
+                    global_off = bit_cast(scratch[tid * num_blocks + block_id], i32)
+                    block_offsets[tid] = global_off - excl_prefix[tid]
+                _block.sync()
+                if i < n:
+                    dst = block_offsets[digit] + rank
+                    keys_out[dst] = bit_cast(key, key_dtype)
+                    if static(has_values):
+                        values_out[dst] = values_in[i]
 
 
 def _emit_pass(
@@ -11,10 +11,16 @@ depth as a compile-time ``log256_max_n``, so one captured graph replays for any
 The per-block partials stage through a **caller-owned** scratch buffer (``u32`` for 4-byte element dtypes, ``u64`` for
 8-byte ones; ``~N / BLOCK_DIM`` slots) sized via :func:`reduce_scratch_slots`; the monoid identity (e.g. ``+inf`` for
 ``min`` over ``f32``) is derived in-kernel from the element dtype, so no runtime identity arg is needed.
+
+On CPU backends (see :func:`_is_cpu_arch`) the same staircase is emitted, with the same scratch layout, but each
+phase iteration reduces a whole ``BLOCK_DIM`` tile serially instead of one element per thread: the tiles of a phase are
+spread across the CPU threads, and the upper levels of the staircase are a small carry pass over the per-tile partials.
 """
 
 import struct
 
+from quadrants._lib import core as _qd_core
+from quadrants.lang import impl
 from quadrants.lang.expr import make_constant_expr
 from quadrants.lang.impl import static
 from quadrants.lang.kernel_impl import func as _func
@@ -82,6 +88,18 @@ def _validate_log256_max_n(log256_max_n):
         )
 
 
+def _is_cpu_arch() -> bool:
+    """Whether the kernel being compiled targets a CPU backend (``x64`` / ``arm64``).
+
+    Trace-time helper, used as ``static(_is_cpu_arch())`` by the phases of every device op to pick their CPU body:
+    the block-tier primitives of the GPU bodies (``block.reduce`` / ``block.exclusive_scan`` / shared arrays /
+    ``block.sync``) have no CPU lowering. The CPU bodies keep the phase signatures and the scratch layout, so the
+    ``*_scratch_slots`` helpers and the staircase drivers are shared by both.
+    """
+    arch = impl.current_cfg().arch
+    return arch == _qd_core.x64 or arch == _qd_core.arm64
+
+
 def _level_partials_slots(n, start_cursor=0):
     """Scratch slots consumed by the per-level partials of a reduce/scan over ``n`` elements, counting from
     ``start_cursor``.
@@ -394,31 +412,51 @@ def _reduce_phase(
     ``-extremum``), derived in-kernel from ``dtype`` so no runtime identity arg is needed. ``v`` is initialised to that
     identity *before* any branch (Quadrants requires a variable's first assignment at the outer scope; later ``if``
     branches only reassign it).
+
+    On CPU backends each iteration folds one whole tile serially (``total_threads // BLOCK_DIM`` iterations, spread
+    across the CPU threads), writing the same per-tile aggregates.
     """
-    loop_config(block_dim=BLOCK_DIM)
-    for i in range(total_threads):
-        # Iteration-boundary barrier so a wrapped grid-stride loop does not let the next iteration's block-reduce
-        # overwrite the shared-scratch slots while this iteration's reads are still in flight (WAR data race; UB on
-        # all backends, corrupts on Metal / MoltenVK). See _scan._scan_downsweep_phase for the full rationale.
-        _block.sync()
-        tid = i % BLOCK_DIM
-        block_id = i // BLOCK_DIM
-        v = _typed_zero_expr(dtype)  # typed additive identity; unconditional first assignment
-        if static(op == _OP_MIN):
-            v = _typed_min_identity(v)
-        elif static(op == _OP_MAX):
-            v = _typed_max_identity(v)
-        if i < n:
-            if static(src_wide):
-                v = bit_cast(src[src_off + i], dtype)
-            else:
-                v = src[src_off + i]
-        agg = _block.reduce(v, BLOCK_DIM, op_bin, dtype)
-        if tid == 0:
+    if static(_is_cpu_arch()):
+        for block_id in range(total_threads // BLOCK_DIM):
+            agg = _typed_zero_expr(dtype)
+            if static(op == _OP_MIN):
+                agg = _typed_min_identity(agg)
+            elif static(op == _OP_MAX):
+                agg = _typed_max_identity(agg)
+            for i in range(block_id * BLOCK_DIM, min((block_id + 1) * BLOCK_DIM, n)):
+                if static(src_wide):
+                    agg = op_bin(agg, bit_cast(src[src_off + i], dtype))
+                else:
+                    agg = op_bin(agg, src[src_off + i])
             if static(dst_wide):
                 dst[dst_off + block_id] = bit_cast(agg, wide)
             else:
                 dst[dst_off + block_id] = agg
+    else:
+        loop_config(block_dim=BLOCK_DIM)
+        for i in range(total_threads):
+            # Iteration-boundary barrier so a wrapped grid-stride loop does not let the next iteration's block-reduce
+            # overwrite the shared-scratch slots while this iteration's reads are still in flight (WAR data race; UB
+            # on all backends, corrupts on Metal / MoltenVK). See _scan._scan_downsweep_phase for the full rationale.
+            _block.sync()
+            tid = i % BLOCK_DIM
+            block_id = i // BLOCK_DIM
+            v = _typed_zero_expr(dtype)  # typed additive identity; unconditional first assignment
+            if static(op == _OP_MIN):
+                v = _typed_min_identity(v)
+            elif static(op == _OP_MAX):
+                v = _typed_max_identity(v)
+            if i < n:
+                if static(src_wide):
+                    v = bit_cast(src[src_off + i], dtype)
+                else:
+                    v = src[src_off + i]
+            agg = _block.reduce(v, BLOCK_DIM, op_bin, dtype)
+            if tid == 0:
+                if static(dst_wide):
+                    dst[dst_off + block_id] = bit_cast(agg, wide)
+                else:
+                    dst[dst_off + block_id] = agg
 
 
 def _emit_reduce_rec(src, src_off, src_wide, scratch, cursor, out, n, phases_remaining, dtype, wide, op, op_bin):
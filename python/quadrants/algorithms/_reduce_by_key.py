@@ -35,6 +35,9 @@ parent - with the live count ``n`` as a device ``Expr`` and the compile-time ``l
 This first-land scope supports only the ``add`` reduction. ``min`` / ``max`` variants would need ``atomic_min`` /
 ``atomic_max``, which have spottier cross-backend support for ``f32`` - defer to a follow-up gated on real qipc usage.
 
+On CPU backends the scan phases run tile by tile (see :mod:`._scan`) and the other passes are plain loops, so
+``reduce_by_key_add`` runs there unchanged, with the same scratch.
+
 **Scratch.** A **caller-owned** 1-D ``u32`` buffer of :func:`reduce_by_key_scratch_slots` ``(N)`` slots
 (``positions = scratch[0:N]`` plus the scan partials above them, ≈ ``1.004 * N``). There is no module-level shared
 scratch - the caller always owns the buffer.
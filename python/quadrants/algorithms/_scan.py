@@ -14,6 +14,10 @@ device ``Expr`` and the recursion depth as a compile-time ``log256_max_n``, so o
 **caller-owned** scratch buffer (``u32`` for 4-byte element dtypes, ``u64`` for 8-byte ones; ``0`` slots for
 ``n <= BLOCK_DIM``) sized via :func:`exclusive_scan_scratch_slots`.
 
+On CPU backends the phases scan whole tiles serially - pass 1 folds each tile, the partials scan is a small carry
+pass, and pass 3 rescans each tile from its carried-in prefix - with the same scratch layout (see
+``_reduce._is_cpu_arch``).
+
 The ``PrefixSumExecutor`` class in ``_algorithms.py`` predates this work and is kept for backward compat. ``sort``
 reuses the private ``u32`` / add staircase (:func:`_emit_exclusive_scan_add`, at the bottom of this module) for its
 digit-histogram scan.
@@ -41,6 +45,7 @@ from ._reduce import (
     BLOCK_DIM,
     _at_least_one,
     _dtype_width_bytes,
+    _is_cpu_arch,
     _level_partials_slots,
     _reduce_depth_for_n,
     _reduce_pass,
@@ -387,22 +392,39 @@ def _scan_tile_phase(
 
     The recursion base / single-tile case. ``src_wide`` / ``dst_wide`` switch between the ``bit_cast``-through-``wide``
     scratch path and the direct caller-tensor path. ``v`` is seeded with the monoid identity *before* the load branch
-    (Quadrants requires a variable's first assignment at the outer scope)."""
-    loop_config(block_dim=BLOCK_DIM)
-    for i in range(BLOCK_DIM):
-        ident = _scan_identity(dtype, op)
-        v = ident
-        if i < n:
-            if static(src_wide):
-                v = bit_cast(src[src_off + i], dtype)
-            else:
-                v = src[src_off + i]
-        prefix = _block.exclusive_scan(v, BLOCK_DIM, op_bin, ident, dtype)
-        if i < n:
-            if static(dst_wide):
-                dst[dst_off + i] = bit_cast(prefix, wide)
-            else:
-                dst[dst_off + i] = prefix
+    (Quadrants requires a variable's first assignment at the outer scope).
+
+    On CPU backends a single iteration scans the tile serially; each element is read before its slot is written, so
+    ``dst`` may alias ``src``."""
+    if static(_is_cpu_arch()):
+        for _ in range(1):
+            prefix = _scan_identity(dtype, op)
+            for i in range(n):
+                if static(src_wide):
+                    v = bit_cast(src[src_off + i], dtype)
+                else:
+                    v = src[src_off + i]
+                if static(dst_wide):
+                    dst[dst_off + i] = bit_cast(prefix, wide)
+                else:
+                    dst[dst_off + i] = prefix
+                prefix = op_bin(prefix, v)
+    else:
+        loop_config(block_dim=BLOCK_DIM)
+        for i in range(BLOCK_DIM):
+            ident = _scan_identity(dtype, op)
+            v = ident
+            if i < n:
+                if static(src_wide):
+                    v = bit_cast(src[src_off + i], dtype)
+                else:
+                    v = src[src_off + i]
+            prefix = _block.exclusive_scan(v, BLOCK_DIM, op_bin, ident, dtype)
+            if i < n:
+                if static(dst_wide):
+                    dst[dst_off + i] = bit_cast(prefix, wide)
+                else:
+                    dst[dst_off + i] = prefix
 
 
 @_func
@@ -428,32 +450,50 @@ def _scan_downsweep_phase(
     ``prefixes`` is always the ``wide`` scratch (the scanned partials from a lower level). ``src`` / ``dst`` switch
     between the caller tensors (``src_wide`` / ``dst_wide`` False) and the ``wide`` scratch (in-place partials scan).
     ``dst`` may alias ``src``; the per-thread read-modify-write and ``block.exclusive_scan``'s internal barrier keep a
-    block's tile consistent, and blocks write disjoint tiles."""
-    loop_config(block_dim=BLOCK_DIM)
-    for i in range(total_threads):
-        # When this grid-strided loop wraps (total_threads > the codegen grid-stride cap), the block-collective
-        # below reuses the same threadgroup-shared scratch every iteration. The collective only barriers between its
-        # own shared write and read, not at the iteration boundary, so iteration k+1's shared writes would race
-        # iteration k's shared reads (a WAR data race - UB on every backend, observed as corruption on Metal /
-        # MoltenVK). This boundary barrier retires the previous iteration's shared reads before they are overwritten.
-        _block.sync()
-        tid = i % BLOCK_DIM
-        block_id = i // BLOCK_DIM
-        ident = _scan_identity(dtype, op)
-        v = ident
-        if i < n:
-            if static(src_wide):
-                v = bit_cast(src[src_off + i], dtype)
-            else:
-                v = src[src_off + i]
-        tile_prefix = _block.exclusive_scan(v, BLOCK_DIM, op_bin, ident, dtype)
-        block_prefix = bit_cast(prefixes[prefixes_off + block_id], dtype)
-        if i < n:
-            scanned = op_bin(block_prefix, tile_prefix)
-            if static(dst_wide):
-                dst[dst_off + i] = bit_cast(scanned, wide)
-            else:
-                dst[dst_off + i] = scanned
+    block's tile consistent, and blocks write disjoint tiles.
+
+    On CPU backends each iteration scans one whole tile serially, starting from its prefix (``total_threads //
+    BLOCK_DIM`` iterations, spread across the CPU threads)."""
+    if static(_is_cpu_arch()):
+        for block_id in range(total_threads // BLOCK_DIM):
+            scanned = bit_cast(prefixes[prefixes_off + block_id], dtype)
+            for i in range(block_id * BLOCK_DIM, min((block_id + 1) * BLOCK_DIM, n)):
+                if static(src_wide):
+                    v = bit_cast(src[src_off + i], dtype)
+                else:
+                    v = src[src_off + i]
+                if static(dst_wide):
+                    dst[dst_off + i] = bit_cast(scanned, wide)
+                else:
+                    dst[dst_off + i] = scanned
+                scanned = op_bin(scanned, v)
+    else:
+        loop_config(block_dim=BLOCK_DIM)
+        for i in range(total_threads):
+            # When this grid-strided loop wraps (total_threads > the codegen grid-stride cap), the block-collective
+            # below reuses the same threadgroup-shared scratch every iteration. The collective only barriers between
+            # its own shared write and read, not at the iteration boundary, so iteration k+1's shared writes would
+            # race iteration k's shared reads (a WAR data race - UB on every backend, observed as corruption on Metal /
+            # MoltenVK). This boundary barrier retires the previous iteration's shared reads before they are
+            # overwritten.
+            _block.sync()
+            tid = i % BLOCK_DIM
+            block_id = i // BLOCK_DIM
+            ident = _scan_identity(dtype, op)
+            v = ident
+            if i < n:
+                if static(src_wide):
+                    v = bit_cast(src[src_off + i], dtype)
+                else:
+                    v = src[src_off + i]
+            tile_prefix = _block.exclusive_scan(v, BLOCK_DIM, op_bin, ident, dtype)
+            block_prefix = bit_cast(prefixes[prefixes_off + block_id], dtype)
+            if i < n:
+                scanned = op_bin(block_prefix, tile_prefix)
+                if static(dst_wide):
+                    dst[dst_off + i] = bit_cast(scanned, wide)
+                else:
+                    dst[dst_off + i] = scanned
 
 
 def _emit_scan_inplace(buf, off, n, levels_remaining, dtype, wide, op, op_bin):
@@ -546,51 +586,77 @@ def _graph_scan_reduce(buf: template(), in_off: i32, out_off: i32, n: i32, total
     """Tile-reduce ``buf[in_off:in_off+n]`` -> per-tile sums ``buf[out_off:out_off+ceil(n/BLOCK_DIM)]`` (u32 / add).
 
     One tile per block; out-of-range lanes contribute ``0``. ``@qd.func`` phase of :func:`_emit_exclusive_scan_add` -
-    its single top-level ``for`` becomes its own offloaded GPU launch (and graph node) when inlined into a kernel.
+    its single top-level ``for`` becomes its own offloaded GPU launch (and graph node) when inlined into a kernel. On
+    CPU backends, one tile per iteration, summed serially.
     """
-    loop_config(block_dim=BLOCK_DIM)
-    for i in range(total_threads):
-        _block.sync()  # iteration-boundary barrier: see _scan_downsweep_phase (shared-scratch WAR hazard on wrap)
-        tid = i % BLOCK_DIM
-        block_id = i // BLOCK_DIM
-        v = u32(0)
-        if i < n:
-            v = buf[in_off + i]
-        agg = _block.reduce_add(v, BLOCK_DIM, u32)
-        if tid == 0:
+    if static(_is_cpu_arch()):
+        for block_id in range(total_threads // BLOCK_DIM):
+            agg = u32(0)
+            for i in range(block_id * BLOCK_DIM, min((block_id + 1) * BLOCK_DIM, n)):
+                agg = agg + buf[in_off + i]
             buf[out_off + block_id] = agg
+    else:
+        loop_config(block_dim=BLOCK_DIM)
+        for i in range(total_threads):
+            _block.sync()  # iteration-boundary barrier: see _scan_downsweep_phase (shared-scratch WAR hazard on wrap)
+            tid = i % BLOCK_DIM
+            block_id = i // BLOCK_DIM
+            v = u32(0)
+            if i < n:
+                v = buf[in_off + i]
+            agg = _block.reduce_add(v, BLOCK_DIM, u32)
+            if tid == 0:
+                buf[out_off + block_id] = agg
 
 
 @_func
 def _graph_scan_base(buf: template(), off: i32, n_valid: i32):
     """Single-block in-place exclusive scan of ``buf[off:off+n_valid]`` (``n_valid <= BLOCK_DIM``); recursion base of
-    the staircase. u32 / add specialization of :func:`_scan_block_inplace_u32`."""
-    loop_config(block_dim=BLOCK_DIM)
-    for i in range(BLOCK_DIM):
-        v = u32(0)
-        if i < n_valid:
-            v = buf[off + i]
-        prefix = _block.exclusive_scan(v, BLOCK_DIM, _bin_add, u32(0), u32)
-        if i < n_valid:
-            buf[off + i] = prefix
+    the staircase. u32 / add specialization of :func:`_scan_block_inplace_u32`. On CPU backends, scanned serially by
+    a single iteration."""
+    if static(_is_cpu_arch()):
+        for _ in range(1):
+            prefix = u32(0)
+            for i in range(n_valid):
+                v = buf[off + i]
+                buf[off + i] = prefix
+                prefix = prefix + v
+    else:
+        loop_config(block_dim=BLOCK_DIM)
+        for i in range(BLOCK_DIM):
+            v = u32(0)
+            if i < n_valid:
+                v = buf[off + i]
+            prefix = _block.exclusive_scan(v, BLOCK_DIM, _bin_add, u32(0), u32)
+            if i < n_valid:
+                buf[off + i] = prefix
 
 
 @_func
 def _graph_scan_downsweep(buf: template(), off: i32, part_off: i32, n: i32, total_threads: i32):
     """Downsweep: per-tile exclusive scan of ``buf[off:off+n]`` plus the scanned per-tile prefix at
-    ``buf[part_off + block_id]``, written back in place (u32 / add, ``src == dst == buf``)."""
-    loop_config(block_dim=BLOCK_DIM)
-    for i in range(total_threads):
-        _block.sync()  # iteration-boundary barrier: see _scan_downsweep_phase (shared-scratch WAR hazard on wrap)
-        tid = i % BLOCK_DIM
-        block_id = i // BLOCK_DIM
-        v = u32(0)
-        if i < n:
-            v = buf[off + i]
-        tile_prefix = _block.exclusive_scan(v, BLOCK_DIM, _bin_add, u32(0), u32)
-        block_prefix = buf[part_off + block_id]
-        if i < n:
-            buf[off + i] = block_prefix + tile_prefix
+    ``buf[part_off + block_id]``, written back in place (u32 / add, ``src == dst == buf``). On CPU backends, one tile
+    per iteration, scanned serially from its prefix."""
+    if static(_is_cpu_arch()):
+        for block_id in range(total_threads // BLOCK_DIM):
+            prefix = buf[part_off + block_id]
+            for i in range(block_id * BLOCK_DIM, min((block_id + 1) * BLOCK_DIM, n)):
+                v = buf[off + i]
+                buf[off + i] = prefix
+                prefix = prefix + v
+    else:
+        loop_config(block_dim=BLOCK_DIM)
+        for i in range(total_threads):
+            _block.sync()  # iteration-boundary barrier: see _scan_downsweep_phase (shared-scratch WAR hazard on wrap)
+            tid = i % BLOCK_DIM
+            block_id = i // BLOCK_DIM
+            v = u32(0)
+            if i < n:
+                v = buf[off + i]
+            tile_prefix = _block.exclusive_scan(v, BLOCK_DIM, _bin_add, u32(0), u32)
+            block_prefix = buf[part_off + block_id]
+            if i < n:
+                buf[off + i] = block_prefix + tile_prefix
 
 
 def _emit_exclusive_scan_add(buf, off, n, levels_remaining: int):
@@ -26,6 +26,9 @@ per-field for struct dtypes without any scratch reinterpretation.
 This is why ``select`` works on any element dtype Quadrants supports for field assignment - scalars (``i32`` / ``u32`` /
 ``f32`` / ``i64`` / ``u64`` / ``f64``) and structs (libuipc ``Vector{2,3,4}i``, ``LinearBVHAABB``, etc.).
 
+On CPU backends the scan phases run tile by tile (see :mod:`._scan`) and the scatter and tail phases are plain loops,
+so ``select`` runs there unchanged, with the same scratch.
+
 **Scratch.** ``select`` needs a **caller-owned** 1-D ``u32`` scratch buffer of :func:`select_scratch_slots` ``(N)``
 slots (the per-element indices ``scratch[0:N]`` plus the scan partials above them). ``u32`` regardless of the element
 dtype (the scan operates on flags-as-counts). There is no module-level shared scratch - the caller always owns the
@@ -0,0 +1,7 @@
+# type: ignore
+
+from quadrants.lang._fast_caching.bundle import (  # noqa: F401
+    export_bundle,
+    import_bundle,
+)
+from quadrants.lang._fast_caching.cache_stats import reset_stats, stats  # noqa: F401
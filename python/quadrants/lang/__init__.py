@@ -1,9 +1,13 @@
 # type: ignore
 
 from quadrants.lang import impl, simt  # noqa: F401
+from quadrants.lang._fast_caching.cache_writer import sync_cache  # noqa: F401
 from quadrants.lang._fast_caching.function_hasher import pure  # noqa: F401
+from quadrants.lang._fuse import fuse  # noqa: F401
+from quadrants.lang._kernel_future import KernelFuture  # noqa: F401
 from quadrants.lang._ndarray import *
 from quadrants.lang._ndrange import ndrange  # noqa: F401
+from quadrants.lang._tiered_compilation import sync_tiered_compilation  # noqa: F401
 from quadrants.lang.buffer_view import *
 from quadrants.lang.exception import *
 from quadrants.lang.field import *
@@ -20,7 +24,8 @@ from quadrants.lang.stream import *
 from quadrants.lang.struct import *
 from quadrants.types.enums import DeviceCapability, Format, Layout  # noqa: F401
 
-from ._perf_dispatch import perf_dispatch  # noqa: F401
+from ._perf_dispatch import perf_dispatch, perf_dispatch_report  # noqa: F401
+from ._precompile import precompile  # noqa: F401
 
 __all__ = [
     s
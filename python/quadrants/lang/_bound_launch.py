@@ -0,0 +1,252 @@
+import operator
+from typing import Any, Callable, Iterable
+
+from quadrants._lib.core.quadrants_python import Arch, KernelLaunchContext
+from quadrants.types import primitive_types
+from quadrants.types.utils import is_signed
+
+from . import impl, runtime_ops
+from ._kernel_future import KernelFuture
+from ._precompile import _materialize, _resolve_kernel
+from .exception import handle_exception_from_cpp
+from .kernel import _GRAPH_ENABLED, Kernel
+from .util import cook_dtype
+
+
+class BoundLaunch:
+    """
+    A kernel bound once and for all to its arguments, as returned by ``kernel.bind(*args)``.
+
+    Binding resolves the specialization and compiled kernel of the arguments, and sets them up on a launch context,
+    which is kept. ``launch()`` then only clones that context and launches it, in a single call into C++, skipping the
+    argument processing, template mapping and argument hashing of a regular ``kernel(*args)`` call.
+
+    Everything about the arguments is frozen at bind time, including the ndarrays held by structs and the values of
+    scalars, except for the scalar parameters listed in ``mutable``, whose new values are passed to ``launch()``.
+    Reassigning an ndarray member of a struct argument, for instance, requires binding again.
+
+    A bound ``@qd.kernel(async_return=True)`` kernel returns a ``KernelFuture``, as a regular launch does. Bound
+    launches raise inside ``qd.ad.Tape`` and forward-mode autodiff, which would not record them, and become invalid on
+    ``qd.reset()`` / ``qd.init()``.
+    """
+
+    def __init__(
+        self,
+        kernel: Kernel,
+        key: Any,
+        args: tuple[Any, ...],
+        frozen_ctx: KernelLaunchContext,
+        setters: list[tuple[Callable[[int, Any], None], int, Callable[[Any], Any]]],
+    ) -> None:
+        self.kernel = kernel
+        self._key = key
+        # Keeps the ndarrays frozen_ctx points to alive.
+        self._args = args
+        self._frozen_ctx = frozen_ctx
+        self._setters = setters
+        self._compiled_kernel_data_by_key = kernel.compiled_kernel_data_by_key
+        self._runtime = impl.get_runtime()
+        self._prog = self._runtime.prog
+        self._has_return_or_print = bool(kernel.return_type) or kernel.has_print
+
+    def launch(self, *mutable_values: Any) -> Any:
+        """Launches the kernel. Takes one value per ``mutable`` parameter, in order, or none to reuse the last ones."""
+        kernel = self.kernel
+        if kernel.compiled_kernel_data_by_key is not self._compiled_kernel_data_by_key:
+            raise RuntimeError(f"Kernel {kernel.func.__name__} was bound before qd.reset(); bind it again")
+        if self._runtime.target_tape or self._runtime.fwd_mode_manager:
+            raise RuntimeError(f"Bound launches are not recorded by autodiff; call {kernel.func.__name__} instead")
+        if mutable_values:
+            if len(mutable_values) != len(self._setters):
+                raise TypeError(f"launch() takes {len(self._setters)} mutable values, got {len(mutable_values)}")
+            for (setter, index, convert), value in zip(self._setters, mutable_values):
+                setter(index, convert(value))
+        # Looked up on each launch, so that the optimized build of a tiered kernel is picked up once swapped in.
+        compiled_kernel_data = self._compiled_kernel_data_by_key[self._key]
+        try:
+            launch_ctx = self._prog.launch_kernel_frozen(compiled_kernel_data, self._frozen_ctx)
+        except Exception as e:
+            e = handle_exception_from_cpp(e)
+            if impl.get_runtime().print_full_traceback:
+                raise e
+            raise e from None
+        if not self._has_return_or_print:
+            return None
+        return_type = kernel.return_type
+        if kernel.has_print or not kernel.async_return:
+            runtime_ops.sync()
+        if not return_type:
+            return None
+        if kernel.async_return:
+            # The results are read back, waiting for the kernel, by KernelFuture.result().
+            return KernelFuture(kernel, launch_ctx)
+        if len(return_type) == 1:
+            return kernel.construct_kernel_ret(launch_ctx, return_type[0], (0,))
+        return tuple(kernel.construct_kernel_ret(launch_ctx, ret_type, (i,)) for i, ret_type in enumerate(return_type))
+
+    __call__ = launch
+
+
+def _get_setter(
+    kernel: Kernel, frozen_ctx: KernelLaunchContext, param_index: int
+) -> tuple[Callable[[int, Any], None], Callable[[Any], Any]]:
+    arg_meta = kernel.arg_metas[param_index]
+    annotation = arg_meta.annotation
+    if id(annotation) in primitive_types.real_type_ids:
+        return frozen_ctx.set_arg_float, float
+    if id(annotation) in primitive_types.integer_type_ids:
+        if is_signed(cook_dtype(annotation)):
+            return frozen_ctx.set_arg_int, operator.index
+        return frozen_ctx.set_arg_uint, operator.index
+    raise ValueError(
+        f"Mutable parameter {arg_meta.name!r} of kernel {kernel.func.__name__} is not a scalar; only scalar parameters "
+        "can be passed to launch(). Bind the kernel again to change other arguments."
+    )
+
+
+def _freeze(
+    primal: Kernel, py_args: tuple[Any, ...], api_name: str
+) -> tuple[Any, tuple[Any, ...], KernelLaunchContext, dict[int, int], bool]:
+    """Compiles primal for py_args if need be, and sets them up on a new launch context, which is left unlaunched.
+
+    Returns the specialization key, the args as launched, the launch context, the index of the first kernel arg of each
+    non-template parameter, and whether the launch context stays valid for as long as the args are alive.
+    """
+    key, py_args = _materialize(primal, py_args)
+    t_kernel = primal.materialized_kernels[key]
+    prog = impl.get_runtime().prog
+    try:
+        compiled_kernel_data = primal.compiled_kernel_data_by_key.get(key)
+        if not compiled_kernel_data:
+            compiled_kernel_data = primal._compile(key, t_kernel, prog)
+            if not primal.compiled_kernel_data_by_key.get(key):
+                primal.compiled_kernel_data_by_key[key] = compiled_kernel_data
+    except Exception as e:
+        raise handle_exception_from_cpp(e) from None
+
+    frozen_ctx = t_kernel.make_launch_context()
+    callbacks: list[Callable[[], None]] = []
+    arg_index_by_param: dict[int, int] = {}
+    _launch_ctx_buffer, cacheable = primal._set_launch_ctx_args(key, py_args, frozen_ctx, callbacks, arg_index_by_param)
+    if callbacks:
+        raise RuntimeError(
+            f"{api_name} does not support arguments that are copied back after each launch, such as numpy arrays, "
+            f"as passed to kernel {primal.func.__name__}. Pass qd.ndarray arguments instead."
+        )
+    frozen_ctx.use_graph = primal.use_graph and _GRAPH_ENABLED
+    if primal.async_return:
+        frozen_ctx.async_result = True
+    for level in primal.graph_do_while_levels:
+        frozen_ctx.add_graph_do_while_level(level.cond_cpp_arg_id, level.parent_id)
+    # ndarray members of structs are resolved once, so reassigning them is not picked up.
+    cacheable = cacheable and not primal._struct_ndarray_launch_info_by_key.get(key)
+    return key, py_args, frozen_ctx, arg_index_by_param, cacheable
+
+
+def bind(kernel: Any, args: tuple[Any, ...], mutable: Iterable[str] = ()) -> BoundLaunch:
+    """Binds kernel to args, compiling it first if need be. See BoundLaunch."""
+    runtime = impl.get_runtime()
+    if runtime._arch == Arch.python:
+        raise RuntimeError("kernel.bind() is not supported on the python backend")
+    primal, py_args = _resolve_kernel(kernel, tuple(args))
+    if primal.use_checkpoints:
+        raise RuntimeError(f"kernel.bind() does not support @qd.kernel(checkpoints=True) kernel {primal.func.__name__}")
+    param_index_by_name = {arg_meta.name: i for i, arg_meta in enumerate(primal.arg_metas)}
+    mutable = list(mutable)
+    for name in mutable:
+        if name not in param_index_by_name:
+            raise ValueError(f"Kernel {primal.func.__name__} has no parameter {name!r}")
+
+    key, py_args, frozen_ctx, arg_index_by_param, _cacheable = _freeze(primal, py_args, "kernel.bind()")
+    setters = []
+    for name in mutable:
+        param_index = param_index_by_name[name]
+        setter, convert = _get_setter(primal, frozen_ctx, param_index)
+        setters.append((setter, arg_index_by_param[param_index], convert))
+    return BoundLaunch(primal, key, py_args, frozen_ctx, setters)
+
+
+class _LaunchBatch:
+    """Frozen launch contexts of a launch_many call, reused by the next calls with the same argument objects."""
+
+    def __init__(
+        self,
+        args_ids: tuple[tuple[int, ...], ...],
+        arg_tuples: list[tuple[Any, ...]],
+        keys: list[Any],
+        frozen_ctxs: list[KernelLaunchContext],
+        compiled_kernel_data_by_key: dict,
+    ) -> None:
+        self.args_ids = args_ids
+        # Keeps the args alive, so that their ids cannot be reused by other objects.
+        self.arg_tuples = arg_tuples
+        self.keys = keys
+        self.frozen_ctxs = frozen_ctxs
+        self.compiled_kernel_data_by_key = compiled_kernel_data_by_key
+
+
+def launch_many(kernel: Any, arg_tuples: Iterable[tuple[Any, ...]], qd_stream: Any = None) -> None:
+    """Launches kernel once per tuple of arg_tuples, in order, submitting every launch in a single call into C++.
+
+    The launch contexts of the batch are kept, and reused by the next launch_many call passing the very same argument
+    objects (typically the same ndarrays every step), which then skips argument processing altogether. Batches with
+    arguments that can change behind the same object, e.g. float scalars or non-frozen dataclasses, are set up again on
+    each call.
+    """
+    runtime = impl.get_runtime()
+    primal, prefix = _resolve_kernel(kernel, ())
+    if primal.return_type:
+        raise RuntimeError(f"kernel.launch_many() does not support kernel {primal.func.__name__} returning values")
+    arg_tuples = list(arg_tuples)
+    if runtime._arch == Arch.python or runtime.target_tape or runtime.fwd_mode_manager or primal.use_checkpoints:
+        # Launches have to go through Kernel.__call__, one by one, to be recorded or resumable.
+        for args in arg_tuples:
+            primal(*prefix, *args, qd_stream=qd_stream)
+        return
+    if qd_stream is not None and primal.use_graph:
+        raise RuntimeError(
+            "qd_stream is not compatible with graph=True kernels. See docs/source/user_guide/streams.md for details."
+        )
+
+    args_ids = tuple(tuple(map(id, args)) for args in arg_tuples)
+    batch: _LaunchBatch | None = primal.launch_many_cache
+    if (
+        batch is None
+        or batch.args_ids != args_ids
+        or batch.compiled_kernel_data_by_key is not primal.compiled_kernel_data_by_key
+    ):
+        keys = []
+        frozen_ctxs = []
+        cacheable = True
+        for args in arg_tuples:
+            key, _py_args, frozen_ctx, _arg_index_by_param, cacheable_ = _freeze(
+                primal, (*prefix, *args), "kernel.launch_many()"
+            )
+            keys.append(key)
+            frozen_ctxs.append(frozen_ctx)
+            cacheable &= cacheable_
+        batch = _LaunchBatch(args_ids, arg_tuples, keys, frozen_ctxs, primal.compiled_kernel_data_by_key)
+        primal.launch_many_cache = batch if cacheable else None
+
+    compiled_kernel_data_by_key = batch.compiled_kernel_data_by_key
+    # Looked up on each launch, so that the optimized builds of tiered kernels are picked up once swapped in.
+    compiled_kernel_datas = [compiled_kernel_data_by_key[key] for key in batch.keys]
+    prog = runtime.prog
+    stream_handle = qd_stream.handle if qd_stream is not None else 0
+    try:
+        if stream_handle:
+            prog.set_current_cuda_stream(stream_handle)
+        try:
+            prog.launch_kernels_frozen(compiled_kernel_datas, batch.frozen_ctxs)
+        finally:
+            if stream_handle:
+                prog.set_current_cuda_stream(0)
+    except Exception as e:
+        e = handle_exception_from_cpp(e)
+        if runtime.print_full_traceback:
+            raise e
+        raise e from None
+    if primal.has_print:
+        if qd_stream is not None:
+            qd_stream.synchronize()
+        runtime_ops.sync()
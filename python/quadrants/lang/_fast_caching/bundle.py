@@ -0,0 +1,148 @@
+import dataclasses
+import json
+import os
+import re
+import tempfile
+import warnings
+import zipfile
+
+import quadrants
+
+from .. import impl
+from . import cache_writer, src_hasher
+
+BUNDLE_FORMAT = "quadrants-cache-bundle-v1"
+
+_MANIFEST_NAME = "manifest.json"
+_FASTCACHE_PREFIX = "python_side_cache/"
+_KERNELS_PREFIX = "kernels/"
+_KERNEL_FILE_SUFFIX = ".qdc"
+# Mirrors the cache_dir_ and kCacheFilenameFormat of KernelCompilationManager.
+_KERNEL_CACHE_FOLDER_NAME = "kernel_compilation_manager"
+
+# Keys are hashes. Anything else in a bundle is rejected, so that a bundle cannot write outside of the cache folder.
+_KEY_PATTERN = re.compile(r"[0-9A-Za-z_\-]+")
+
+
+@dataclasses.dataclass
+class CacheBundleInfo:
+    """Number of entries written to (export_bundle) or read from (import_bundle) a cache bundle."""
+
+    path: str
+    num_fastcache_entries: int = 0
+    num_kernels: int = 0
+
+
+def _get_kernel_cache_folder() -> str:
+    return os.path.join(impl.get_runtime().prog.config().offline_cache_file_path, _KERNEL_CACHE_FOLDER_NAME)
+
+
+def _write_file_atomic(filepath: str, data: bytes) -> None:
+    folder, filename = os.path.split(filepath)
+    fd, tmp_path = tempfile.mkstemp(dir=folder, prefix=f"{filename}.", suffix=".tmp")
+    with os.fdopen(fd, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, filepath)
+
+
+def export_bundle(path: str) -> CacheBundleInfo:
+    """Writes every kernel used so far by this process to a single compressed archive at path.
+
+    The bundle holds the fastcache entries of those kernels, and their compiled artifacts from the offline cache, so
+    it only contains compiled kernels when the offline cache is enabled (the default). Typically called at the end of
+    a warm-up run, after every kernel was launched (or compiled with qd.precompile) once.
+
+    Kernels compiled by this process are written to the offline cache first, rather than at exit.
+    """
+    prog = impl.get_runtime().prog
+    cache_writer.sync_cache()
+    prog.dump_cache_data_to_disk()
+
+    info = CacheBundleInfo(path=path)
+    python_side_cache = src_hasher._get_python_side_cache()
+    kernel_cache_folder = _get_kernel_cache_folder()
+    fastcache_keys = []
+    kernel_keys = []
+    folder = os.path.dirname(os.path.abspath(path))
+    os.makedirs(folder, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=folder, prefix=f"{os.path.basename(path)}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f, zipfile.ZipFile(f, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+            for fast_cache_key in sorted(src_hasher.used_fast_cache_keys):
+                value = python_side_cache.try_load(fast_cache_key)
+                if value is None:
+                    continue
+                zf.writestr(f"{_FASTCACHE_PREFIX}{fast_cache_key}", value)
+                fastcache_keys.append(fast_cache_key)
+            for kernel_key in sorted(src_hasher.used_kernel_keys):
+                filepath = os.path.join(kernel_cache_folder, f"{kernel_key}{_KERNEL_FILE_SUFFIX}")
+                if not os.path.isfile(filepath):
+                    # not written to the offline cache, e.g. offline_cache=False
+                    continue
+                zf.write(filepath, f"{_KERNELS_PREFIX}{kernel_key}{_KERNEL_FILE_SUFFIX}")
+                kernel_keys.append(kernel_key)
+            manifest = {
+                "format": BUNDLE_FORMAT,
+                "quadrants_version": quadrants.__version_str__,
+                "arch": str(prog.config().arch),
+                "fastcache_keys": fastcache_keys,
+                "kernel_keys": kernel_keys,
+            }
+            zf.writestr(_MANIFEST_NAME, json.dumps(manifest, indent=1))
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+    info.num_fastcache_entries = len(fastcache_keys)
+    info.num_kernels = len(kernel_keys)
+    return info
+
+
+def import_bundle(path: str) -> CacheBundleInfo:
+    """Adds the kernels of a bundle written by export_bundle to the caches of this machine.
+
+    Call it after qd.init, before the first kernel launch. Kernels of the bundle then start from the fastcache and
+    offline cache as if they had been compiled on this machine, as long as the machine has the same Quadrants version,
+    backend and device, and the kernels' source files are at the same paths.
+
+    Entries already present in the local caches are kept as they are. A bundle written by another Quadrants version, or
+    for another arch, is ignored, with a warning.
+    """
+    prog = impl.get_runtime().prog
+    info = CacheBundleInfo(path=path)
+    with zipfile.ZipFile(path, "r") as zf:
+        manifest = json.loads(zf.read(_MANIFEST_NAME))
+        if manifest.get("format") != BUNDLE_FORMAT:
+            raise ValueError(f"{path} is not a Quadrants cache bundle")
+        if manifest.get("quadrants_version") != quadrants.__version_str__:
+            warnings.warn(
+                f"Ignoring cache bundle {path}, written by Quadrants {manifest.get('quadrants_version')}, "
+                f"while this is Quadrants {quadrants.__version_str__}"
+            )
+            return info
+        arch = str(impl.current_cfg().arch)
+        if manifest.get("arch") != arch:
+            warnings.warn(
+                f"Ignoring cache bundle {path}, written for arch {manifest.get('arch')}, while this is {arch}"
+            )
+            return info
+
+        kernel_cache_folder = _get_kernel_cache_folder()
+        os.makedirs(kernel_cache_folder, exist_ok=True)
+        kernel_keys = [key for key in manifest.get("kernel_keys", []) if _KEY_PATTERN.fullmatch(key)]
+        for kernel_key in kernel_keys:
+            filepath = os.path.join(kernel_cache_folder, f"{kernel_key}{_KERNEL_FILE_SUFFIX}")
+            if not os.path.exists(filepath):
+                _write_file_atomic(filepath, zf.read(f"{_KERNELS_PREFIX}{kernel_key}{_KERNEL_FILE_SUFFIX}"))
+        info.num_kernels = prog.register_offline_cache_files(kernel_keys)
+
+        python_side_cache = src_hasher._get_python_side_cache()
+        items = []
+        for fast_cache_key in manifest.get("fastcache_keys", []):
+            if not _KEY_PATTERN.fullmatch(fast_cache_key) or python_side_cache.try_load(fast_cache_key) is not None:
+                continue
+            items.append((fast_cache_key, zf.read(f"{_FASTCACHE_PREFIX}{fast_cache_key}").decode("utf-8")))
+        if items:
+            python_side_cache.store_many(items)
+        info.num_fastcache_entries = len(items)
+    return info
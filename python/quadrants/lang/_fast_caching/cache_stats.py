@@ -0,0 +1,108 @@
+import dataclasses
+import json
+import threading
+
+from .args_hasher import FastcacheSkip
+
+
+@dataclasses.dataclass
+class KernelCacheStats:
+    """Cache outcomes of one kernel, summed over every specialization compiled by this process. Times are in seconds."""
+
+    name: str
+    # Specializations loaded through fastcache, so neither transformed nor compiled.
+    fastcache_hits: int = 0
+    # Specializations with a fastcache key, but no valid entry for it.
+    fastcache_misses: int = 0
+    # Specializations fastcache could not build a key for, by FastcacheSkip value.
+    fastcache_skips: dict[str, int] = dataclasses.field(default_factory=dict)
+    # Specializations compiled by C++, found (hit) or not (miss) in the offline cache.
+    offline_cache_hits: int = 0
+    offline_cache_misses: int = 0
+    # Building fastcache keys, i.e. hashing the arguments and kernel source.
+    hashing_time: float = 0.0
+    # Validating fastcache entries and loading the compiled kernels they point to.
+    load_time: float = 0.0
+    # C++ compilation, or offline cache load, of specializations that missed fastcache.
+    compile_time: float = 0.0
+
+    def record_fastcache_skip(self, reason: FastcacheSkip) -> None:
+        self.fastcache_skips[reason.value] = self.fastcache_skips.get(reason.value, 0) + 1
+
+    def record_compile(self, cache_hit: bool, compile_time: float) -> None:
+        if cache_hit:
+            self.offline_cache_hits += 1
+        else:
+            self.offline_cache_misses += 1
+        self.compile_time += compile_time
+
+    def _add(self, other: "KernelCacheStats") -> None:
+        for field in dataclasses.fields(self):
+            if field.name == "name":
+                continue
+            if field.name == "fastcache_skips":
+                for reason, count in other.fastcache_skips.items():
+                    self.fastcache_skips[reason] = self.fastcache_skips.get(reason, 0) + count
+                continue
+            setattr(self, field.name, getattr(self, field.name) + getattr(other, field.name))
+
+
+@dataclasses.dataclass
+class CacheStats:
+    """Snapshot of the cache outcomes of every kernel compiled by this process, as returned by qd.cache.stats()."""
+
+    kernels: list[KernelCacheStats]
+    total: KernelCacheStats
+
+    def to_dict(self) -> dict:
+        return dataclasses.asdict(self)
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict(), indent=1)
+
+
+_lock = threading.Lock()
+_stats_by_name: dict[str, KernelCacheStats] = {}
+
+
+def get_kernel_stats(name: str) -> KernelCacheStats:
+    """Returns the live stats of the kernel called name. Kernels sharing a name share their stats."""
+    with _lock:
+        kernel_stats = _stats_by_name.get(name)
+        if kernel_stats is None:
+            kernel_stats = _stats_by_name[name] = KernelCacheStats(name=name)
+        return kernel_stats
+
+
+def stats(json_path: str | None = None) -> CacheStats:
+    """Returns fastcache and offline cache hits, misses and timings of each kernel, since the start of the process.
+
+    Kernels are listed by ``module.qualname``, with the autodiff mode appended for gradient kernels. Kernels that were
+    never materialized are left out. If ``json_path`` is given, the stats are also written there, as JSON, e.g. for
+    tracking cold starts on a dashboard.
+
+    Stats are kept across ``qd.init()``; call ``qd.cache.reset_stats()`` to clear them.
+    """
+    total = KernelCacheStats(name="total")
+    kernels = []
+    with _lock:
+        for kernel_stats in _stats_by_name.values():
+            if kernel_stats == KernelCacheStats(name=kernel_stats.name):
+                continue
+            snapshot = dataclasses.replace(kernel_stats, fastcache_skips=dict(kernel_stats.fastcache_skips))
+            kernels.append(snapshot)
+            total._add(snapshot)
+    kernels.sort(key=lambda kernel_stats: kernel_stats.name)
+    result = CacheStats(kernels=kernels, total=total)
+    if json_path is not None:
+        with open(json_path, "w", encoding="utf-8") as f:
+            f.write(result.to_json())
+    return result
+
+
+def reset_stats() -> None:
+    """Clears the stats returned by qd.cache.stats()."""
+    with _lock:
+        for name, kernel_stats in _stats_by_name.items():
+            # Cleared in place, since kernels hold on to their stats.
+            vars(kernel_stats).update(vars(KernelCacheStats(name=name)))
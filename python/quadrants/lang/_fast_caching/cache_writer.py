@@ -0,0 +1,95 @@
+import atexit
+import queue
+import threading
+import warnings
+from typing import TypeAlias
+
+from .. import impl
+from .packed_cache import PackedPythonSideCache
+from .python_side_cache import PythonSideCache
+
+_BatchStorableCache: TypeAlias = PythonSideCache | PackedPythonSideCache
+
+
+class BackgroundCacheWriter:
+    """
+    Writes fastcache entries from a background thread, so that the first launch of a kernel does not wait on disk.
+
+    Enabled with qd.init(src_ll_cache_async_store=True). Stores are queued by enqueue(), and the writer thread drains
+    everything that is queued at the time it wakes up, as one batch per cache folder. A store that fails, for whatever
+    reason, is reported as a warning and dropped, so that the writer thread keeps serving, and flush() never hangs.
+
+    flush() blocks until everything enqueued so far is on disk. It is called by qd.sync_cache(), on qd.reset() (and
+    hence on qd.init()), and at interpreter exit, so that nothing is lost on a clean shutdown.
+    """
+
+    def __init__(self) -> None:
+        self._queue: "queue.Queue[tuple[_BatchStorableCache, str, str]]" = queue.Queue()
+        self._thread: threading.Thread | None = None
+        self._thread_lock = threading.Lock()
+
+    def _ensure_thread(self) -> None:
+        with self._thread_lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._run, name="qd-fastcache-writer", daemon=True)
+            self._thread.start()
+            atexit.register(self.flush)
+
+    def enqueue(self, cache: _BatchStorableCache, fast_cache_key: str, value: str) -> None:
+        self._ensure_thread()
+        self._queue.put((cache, fast_cache_key, value))
+
+    def flush(self) -> None:
+        if self._thread is None:
+            return
+        self._queue.join()
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self._write_batch(batch)
+            except Exception as e:  # pylint: disable=broad-except
+                warnings.warn(f"Failed to write {len(batch)} entries to cache {e}")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    @staticmethod
+    def _write_batch(batch: list[tuple[_BatchStorableCache, str, str]]) -> None:
+        # A batch can span several cache folders (e.g. after a qd.init with another offline_cache_file_path), and both
+        # backends. Entries of the same folder and backend are written together; a later entry for the same key wins.
+        items_by_cache: dict[tuple[type, str], tuple[_BatchStorableCache, dict[str, str]]] = {}
+        for cache, fast_cache_key, value in batch:
+            _cache, items = items_by_cache.setdefault((type(cache), cache.cache_folder), (cache, {}))
+            items[fast_cache_key] = value
+        for cache, items in items_by_cache.values():
+            try:
+                cache.store_many(list(items.items()))
+            except Exception as e:  # pylint: disable=broad-except
+                warnings.warn(f"Failed to write {len(items)} entries to cache at {cache.cache_folder} {e}")
+
+
+_writer = BackgroundCacheWriter()
+
+
+def enqueue(cache: _BatchStorableCache, fast_cache_key: str, value: str) -> None:
+    _writer.enqueue(cache, fast_cache_key, value)
+
+
+def sync_cache() -> None:
+    """Blocks until every fastcache entry queued by ``qd.init(src_ll_cache_async_store=True)`` is written to disk.
+
+    This also happens automatically on ``qd.reset()`` / ``qd.init()`` and at interpreter exit. It is a no-op when
+    asynchronous stores are disabled.
+    """
+    _writer.flush()
+
+
+impl.on_reset(sync_cache)
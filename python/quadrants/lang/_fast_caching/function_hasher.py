@@ -4,6 +4,7 @@ from typing import TYPE_CHECKING, Iterable
 
 from ..._test_tools import warnings_helper
 from .._wrap_inspect import FunctionSourceInfo
+from . import source_hash_memo
 from .fast_caching_types import HashedFunctionSourceInfo
 from .hash_utils import hash_iterable_strings
 
@@ -29,10 +30,14 @@ def _read_file(function_info: FunctionSourceInfo) -> list[str]:
         )
 
 
-def _hash_function(function_info: FunctionSourceInfo) -> str:
+def _hash_source(function_info: FunctionSourceInfo) -> str:
     return hash_iterable_strings(_read_file(function_info))
 
 
+def _hash_function(function_info: FunctionSourceInfo) -> str:
+    return source_hash_memo.get_memo().hash_function(function_info, _hash_source)
+
+
 def hash_functions(function_infos: Iterable[FunctionSourceInfo]) -> list[HashedFunctionSourceInfo]:
     results = []
     for f_info in function_infos:
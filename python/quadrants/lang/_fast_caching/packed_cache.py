@@ -0,0 +1,242 @@
+import mmap
+import os
+import struct
+import tempfile
+import threading
+import warnings
+import zlib
+
+from .. import impl
+from .python_side_cache import get_cache_folder
+
+PACK_FILENAME = "python_side_cache.pack"
+
+# Each record is: magic, key length, value length, crc32 of key + value, then the key and value bytes (utf-8).
+_RECORD_MAGIC = b"QDPK"
+_RECORD_HEADER = struct.Struct("<4sIII")
+
+# Compact the pack on load once stale records (keys that were stored again later) take up more than half of the file,
+# and the file is big enough for it to matter.
+_COMPACT_MIN_BYTES = 1 << 20
+
+
+def _encode_record(key: bytes, value: bytes) -> bytes:
+    crc = zlib.crc32(value, zlib.crc32(key))
+    return _RECORD_HEADER.pack(_RECORD_MAGIC, len(key), len(value), crc) + key + value
+
+
+class _PackIndex:
+    """
+    In-memory view of one pack file: a read-only mmap of the file plus a hash index from key to the location and
+    checksum of its latest value in that mmap.
+
+    Shared by all PackedPythonSideCache objects of a process pointing at the same pack file, so that the pack is
+    mapped and indexed once, at the first lookup.
+    """
+
+    def __init__(self, pack_path: str) -> None:
+        self.pack_path = pack_path
+        self.lock = threading.Lock()
+        self._mmap: mmap.mmap | None = None
+        self._mapped_size = 0
+        # (st_dev, st_ino) of the mapped file, to tell appends to it from its replacement by another process.
+        self._file_id: tuple[int, int] | None = None
+        # Key -> (value offset, value length, record checksum).
+        self._value_loc_by_key: dict[str, tuple[int, int, int]] = {}
+        # Values stored by this process after the file was mapped. Checked before the mmap.
+        self._stored_by_key: dict[str, str] = {}
+        self._live_bytes = 0
+        self._load()
+        if self._mapped_size > _COMPACT_MIN_BYTES and 2 * self._live_bytes < self._mapped_size:
+            self._compact()
+
+    def _load(self) -> None:
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        self._value_loc_by_key.clear()
+        self._live_bytes = 0
+        self._mapped_size = 0
+        self._file_id = None
+        try:
+            with open(self.pack_path, "rb") as f:
+                st = os.fstat(f.fileno())
+                self._file_id = (st.st_dev, st.st_ino)
+                if st.st_size == 0:
+                    return
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except FileNotFoundError:
+            return
+        self._mapped_size = len(self._mmap)
+        self._scan(0)
+
+    def _scan(self, offset: int) -> None:
+        """
+        Indexes every record from offset to the end of the mapping.
+
+        A record that is truncated, or whose checksum does not match, was torn by a crash or by a concurrent writer.
+        It is skipped by resynchronizing on the next record magic, so that one bad record only loses itself.
+        """
+        buf = self._mmap
+        assert buf is not None
+        end = len(buf)
+        header_size = _RECORD_HEADER.size
+        while offset + header_size <= end:
+            magic, key_len, value_len, crc = _RECORD_HEADER.unpack_from(buf, offset)
+            key_start = offset + header_size
+            value_start = key_start + key_len
+            value_end = value_start + value_len
+            if magic != _RECORD_MAGIC or value_end > end:
+                offset = self._find_next_record(offset + 1)
+                continue
+            key = buf[key_start:value_start]
+            if zlib.crc32(buf[value_start:value_end], zlib.crc32(key)) != crc:
+                offset = self._find_next_record(offset + 1)
+                continue
+            key_str = key.decode("utf-8")
+            previous = self._value_loc_by_key.get(key_str)
+            if previous is not None:
+                self._live_bytes -= header_size + len(key) + previous[1]
+            self._value_loc_by_key[key_str] = (value_start, value_len, crc)
+            self._live_bytes += header_size + key_len + value_len
+            offset = value_end
+
+    def _find_next_record(self, offset: int) -> int:
+        assert self._mmap is not None
+        found = self._mmap.find(_RECORD_MAGIC, offset)
+        return len(self._mmap) if found < 0 else found
+
+    def _refresh(self) -> bool:
+        """
+        Picks up records appended by other processes since the file was mapped. Returns whether anything changed.
+        """
+        try:
+            st = os.stat(self.pack_path)
+        except FileNotFoundError:
+            return False
+        if (st.st_dev, st.st_ino) != self._file_id or st.st_size < self._mapped_size:
+            # The pack was replaced, e.g. compacted by another process: the old offsets mean nothing in the new file.
+            self._load()
+            return True
+        if st.st_size == self._mapped_size:
+            return False
+        old_size = self._mapped_size
+        with open(self.pack_path, "rb") as f:
+            st = os.fstat(f.fileno())
+            replaced = (st.st_dev, st.st_ino) != self._file_id
+            if not replaced:
+                if self._mmap is not None:
+                    self._mmap.close()
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if replaced:
+            # Replaced between the stat and the open.
+            self._load()
+            return True
+        self._mapped_size = len(self._mmap)
+        self._scan(old_size)
+        return True
+
+    def _compact(self) -> None:
+        """
+        Rewrites the pack with only the latest record of each key.
+
+        A process appending concurrently keeps writing to the replaced file, so its record is lost. That is only ever
+        a cache miss, and the entry will be stored again.
+        """
+        assert self._mmap is not None
+        folder = os.path.dirname(self.pack_path)
+        fd, tmp_path = tempfile.mkstemp(dir=folder, prefix=f"{PACK_FILENAME}.", suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            for key, (value_start, value_len, _crc) in self._value_loc_by_key.items():
+                f.write(_encode_record(key.encode("utf-8"), self._mmap[value_start : value_start + value_len]))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.pack_path)
+        self._load()
+
+    def get(self, key: str) -> str | None:
+        with self.lock:
+            value = self._stored_by_key.get(key)
+            if value is not None:
+                return value
+            loc = self._value_loc_by_key.get(key)
+            if loc is None and self._refresh():
+                loc = self._value_loc_by_key.get(key)
+            if loc is None:
+                return None
+            assert self._mmap is not None
+            value_start, value_len, crc = loc
+            value_bytes = self._mmap[value_start : value_start + value_len]
+            if zlib.crc32(value_bytes, zlib.crc32(key.encode("utf-8"))) != crc:
+                # Overwritten in place since it was indexed, e.g. by a writer that does not go through os.replace.
+                del self._value_loc_by_key[key]
+                return None
+            return value_bytes.decode("utf-8")
+
+    def put(self, key: str, value: str) -> None:
+        self.put_many([(key, value)], fsync=False)
+
+    def put_many(self, items: list[tuple[str, str]], fsync: bool) -> None:
+        data = b"".join(_encode_record(key.encode("utf-8"), value.encode("utf-8")) for key, value in items)
+        with self.lock:
+            # O_APPEND, plus a single write per batch, so that records from concurrent processes never interleave.
+            # fsync is optional: a record torn by a crash fails its checksum on the next load, and is just a cache miss.
+            fd = os.open(self.pack_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0), 0o644)
+            try:
+                os.write(fd, data)
+                if fsync:
+                    os.fsync(fd)
+            finally:
+                os.close(fd)
+            for key, value in items:
+                self._stored_by_key[key] = value
+
+
+_pack_index_lock = threading.Lock()
+_pack_index_by_path: dict[str, _PackIndex] = {}
+
+
+def _get_pack_index(pack_path: str) -> _PackIndex:
+    with _pack_index_lock:
+        pack_index = _pack_index_by_path.get(pack_path)
+        if pack_index is None:
+            pack_index = _PackIndex(pack_path)
+            _pack_index_by_path[pack_path] = pack_index
+        return pack_index
+
+
+class PackedPythonSideCache:
+    """
+    Alternative backend of PythonSideCache, selected with qd.init(src_ll_cache_backend="packed").
+
+    Instead of one file per cache key, all entries are appended to a single pack file, which is memory-mapped and
+    indexed once per process. A cold start then costs one open and one mmap, rather than one open/read/utime per
+    kernel, and a store costs one append, rather than a mkstemp/fsync/rename.
+
+    Same interface as PythonSideCache, and equally cheap to construct.
+
+    The pack does not track access times, so the src_ll_cache_max_bytes / src_ll_cache_max_entries LRU budgets do not
+    apply to it. Instead, superseded records are dropped by compacting the pack when they make up most of it.
+    """
+
+    def __init__(self) -> None:
+        _cache_parent_folder = impl.get_runtime().prog.config().offline_cache_file_path
+        self.cache_folder = get_cache_folder(_cache_parent_folder)
+        os.makedirs(self.cache_folder, exist_ok=True)
+        self.pack_path = os.path.join(self.cache_folder, PACK_FILENAME)
+
+    def store(self, fast_cache_key: str, value: str) -> None:
+        _get_pack_index(self.pack_path).put(fast_cache_key, value)
+
+    def store_many(self, items: list[tuple[str, str]]) -> None:
+        """
+        Appends a batch of (fast_cache_key, value) pairs with one write, and one fsync.
+        """
+        _get_pack_index(self.pack_path).put_many(items, fsync=True)
+
+    def try_load(self, fast_cache_key: str) -> str | None:
+        try:
+            return _get_pack_index(self.pack_path).get(fast_cache_key)
+        except (OSError, ValueError, UnicodeDecodeError) as e:
+            warnings.warn(f"Failed to read from cache at {self.pack_path} {e}")
+        return None
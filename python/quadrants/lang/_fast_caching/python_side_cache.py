@@ -1,12 +1,149 @@
+import dataclasses
 import json
 import os
 import tempfile
+import threading
 import warnings
 
 import pydantic
 
 from .. import impl
 
+CACHE_FOLDER_NAME = "python_side_cache"
+CACHE_FILE_SUFFIX = ".cache.txt"
+
+
+@dataclasses.dataclass
+class PythonSideCacheUsage:
+    """Snapshot of the on-disk footprint of a python side cache folder."""
+
+    cache_folder: str
+    num_entries: int = 0
+    total_bytes: int = 0
+    oldest_mtime: float | None = None
+    newest_mtime: float | None = None
+
+
+@dataclasses.dataclass
+class PythonSideCacheEviction:
+    """Outcome of one LRU eviction pass over a python side cache folder."""
+
+    num_removed: int = 0
+    bytes_removed: int = 0
+    num_remaining: int = 0
+    bytes_remaining: int = 0
+
+
+def get_cache_folder(offline_cache_file_path: str) -> str:
+    return os.path.join(offline_cache_file_path, CACHE_FOLDER_NAME)
+
+
+def _scan_entries(cache_folder: str) -> list[tuple[float, int, str]]:
+    """
+    Returns (mtime, size, path) for every cache entry in cache_folder.
+
+    Entries can be removed concurrently, by another process, or by another eviction pass, so any entry that vanishes
+    between listing and stat-ing is silently skipped.
+    """
+    entries = []
+    try:
+        it = os.scandir(cache_folder)
+    except FileNotFoundError:
+        return entries
+    with it:
+        for dir_entry in it:
+            if not dir_entry.name.endswith(CACHE_FILE_SUFFIX):
+                continue
+            try:
+                stat = dir_entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, dir_entry.path))
+    return entries
+
+
+def get_usage(cache_folder: str) -> PythonSideCacheUsage:
+    entries = _scan_entries(cache_folder)
+    usage = PythonSideCacheUsage(cache_folder=cache_folder)
+    usage.num_entries = len(entries)
+    usage.total_bytes = sum(size for _, size, _ in entries)
+    if entries:
+        usage.oldest_mtime = min(mtime for mtime, _, _ in entries)
+        usage.newest_mtime = max(mtime for mtime, _, _ in entries)
+    return usage
+
+
+def evict_lru(cache_folder: str, max_bytes: int = 0, max_entries: int = 0) -> PythonSideCacheEviction:
+    """
+    Deletes the least recently used entries of cache_folder, until it holds at most max_bytes bytes and at most
+    max_entries entries. A budget of 0 means unlimited.
+
+    Recency is the file mtime, which is bumped by PythonSideCache.try_load on every hit.
+    """
+    entries = _scan_entries(cache_folder)
+    num_remaining = len(entries)
+    bytes_remaining = sum(size for _, size, _ in entries)
+    result = PythonSideCacheEviction()
+    entries.sort()
+    for _mtime, size, path in entries:
+        over_bytes = max_bytes > 0 and bytes_remaining > max_bytes
+        over_entries = max_entries > 0 and num_remaining > max_entries
+        if not over_bytes and not over_entries:
+            break
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            # Someone else got there first. Either way, it no longer counts towards the budget.
+            pass
+        else:
+            result.num_removed += 1
+            result.bytes_removed += size
+        num_remaining -= 1
+        bytes_remaining -= size
+    result.num_remaining = num_remaining
+    result.bytes_remaining = bytes_remaining
+    return result
+
+
+# Background eviction state, keyed by cache folder. A folder is in _eviction_running while a worker thread is
+# evicting it, and in _eviction_pending if another store landed since that worker started its last pass. This
+# coalesces the burst of stores during a cold start into a handful of directory scans, rather than one per store.
+_eviction_lock = threading.Lock()
+_eviction_running: set[str] = set()
+_eviction_pending: set[str] = set()
+
+
+def _eviction_worker(cache_folder: str, max_bytes: int, max_entries: int) -> None:
+    while True:
+        try:
+            evict_lru(cache_folder, max_bytes=max_bytes, max_entries=max_entries)
+        except OSError as e:
+            warnings.warn(f"Failed to evict entries from cache at {cache_folder} {e}")
+        with _eviction_lock:
+            if cache_folder not in _eviction_pending:
+                _eviction_running.discard(cache_folder)
+                return
+            _eviction_pending.discard(cache_folder)
+
+
+def schedule_eviction(cache_folder: str, max_bytes: int, max_entries: int) -> None:
+    """
+    Runs evict_lru on cache_folder in a background daemon thread, unless one is already running for that folder, in
+    which case that thread is asked to do one more pass once it finishes.
+    """
+    with _eviction_lock:
+        if cache_folder in _eviction_running:
+            _eviction_pending.add(cache_folder)
+            return
+        _eviction_running.add(cache_folder)
+    thread = threading.Thread(
+        target=_eviction_worker,
+        args=(cache_folder, max_bytes, max_entries),
+        name="qd-fastcache-evict",
+        daemon=True,
+    )
+    thread.start()
+
 
 class PythonSideCache:
     """
@@ -22,28 +159,35 @@ class PythonSideCache:
 
     No metadata is associated with the file, making management very lightweight.
 
-    We update the file date/time when we read from a particular file, so we can easily
-    implement an LRU cleaning strategy at some point in the future, based on the file
-    date/times.
+    We update the file date/time when we read from a particular file, and use those
+    date/times to evict the least recently used entries, once the folder grows past the
+    budget given by qd.init(src_ll_cache_max_bytes=..., src_ll_cache_max_entries=...).
+    Eviction runs in a background thread, after a store.
     """
 
     def __init__(self) -> None:
-        _cache_parent_folder = impl.get_runtime().prog.config().offline_cache_file_path
-        self.cache_folder = os.path.join(_cache_parent_folder, "python_side_cache")
+        runtime = impl.get_runtime()
+        self.cache_folder = get_cache_folder(runtime.prog.config().offline_cache_file_path)
+        self.max_bytes = runtime.src_ll_cache_max_bytes
+        self.max_entries = runtime.src_ll_cache_max_entries
         os.makedirs(self.cache_folder, exist_ok=True)
 
     def _get_filepath(self, key: str) -> str:
-        filepath = os.path.join(self.cache_folder, f"{key}.cache.txt")
+        filepath = os.path.join(self.cache_folder, f"{key}{CACHE_FILE_SUFFIX}")
         return filepath
 
     def _touch(self, filepath):
         """
         Updates file date/time.
+
+        Must not re-create the file if it was evicted in the meantime, so we don't use open(filepath, "a") here.
         """
-        with open(filepath, "a"):
+        try:
             os.utime(filepath, None)
+        except FileNotFoundError:
+            pass
 
-    def store(self, fast_cache_key: str, value: str) -> None:
+    def _write_entry(self, fast_cache_key: str, value: str) -> None:
         filepath = self._get_filepath(fast_cache_key)
         tmp_path = None
 
@@ -55,6 +199,30 @@ class PythonSideCache:
             os.fsync(f.fileno())
         os.replace(tmp_path, filepath)
 
+    def _maybe_schedule_eviction(self) -> None:
+        if self.max_bytes > 0 or self.max_entries > 0:
+            schedule_eviction(self.cache_folder, self.max_bytes, self.max_entries)
+
+    def store(self, fast_cache_key: str, value: str) -> None:
+        self._write_entry(fast_cache_key, value)
+        self._maybe_schedule_eviction()
+
+    def store_many(self, items: list[tuple[str, str]]) -> None:
+        """
+        Stores a batch of (fast_cache_key, value) pairs, with a single fsync of the cache folder at the end, rather
+        than one per entry. The data of each entry is still fsynced before it is renamed into place, so that a crash
+        cannot leave a truncated entry behind.
+        """
+        for fast_cache_key, value in items:
+            self._write_entry(fast_cache_key, value)
+        if hasattr(os, "O_DIRECTORY"):
+            dir_fd = os.open(self.cache_folder, os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+        self._maybe_schedule_eviction()
+
     def try_load(self, fast_cache_key: str) -> str | None:
         filepath = self._get_filepath(fast_cache_key)
         if not os.path.isfile(filepath):
@@ -64,6 +232,9 @@ class PythonSideCache:
                 res = f.read()
             self._touch(filepath)
             return res
+        except FileNotFoundError:
+            # Evicted between the isfile check and the open.
+            return None
         except (pydantic.ValidationError, json.JSONDecodeError, UnicodeDecodeError) as e:
             warnings.warn(f"Failed to read from cache at {filepath} {e}")
         return None
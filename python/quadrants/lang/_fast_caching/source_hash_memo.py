@@ -0,0 +1,150 @@
+import atexit
+import json
+import os
+import tempfile
+import threading
+import time
+import warnings
+from typing import Callable
+
+from .. import impl
+from .._wrap_inspect import FunctionSourceInfo
+from .python_side_cache import get_cache_folder
+
+MEMO_FILENAME = "source_hashes.json"
+_MEMO_FORMAT = "quadrants-source-hash-memo-v1"
+
+# A file modified less than this long ago may still be modified again within the same timestamp tick, without its
+# stat signature changing. Its hashes are used, but not memoized.
+_RACY_WINDOW_NS = 2_000_000_000
+
+# Once the memo holds more files than this, entries of files that no longer exist are dropped on flush.
+_PRUNE_MIN_FILES = 4096
+
+
+def _stat_signature(st: os.stat_result) -> list[int]:
+    # ctime is not part of what identifies a file, but unlike mtime it cannot be set back by tools such as cp -p or
+    # tar, so it catches rewrites that keep the size and mtime.
+    return [st.st_size, st.st_mtime_ns, st.st_ino, st.st_ctime_ns]
+
+
+class SourceHashMemo:
+    """
+    On-disk memo of the source hashes of kernels and qd.funcs, so that a new process does not read and hash the
+    source files of every fastcache kernel again to build and validate its cache keys.
+
+    Hashes are memoized per file, keyed by the file's stat signature (size, mtime, inode, ctime), and per line span
+    within that file. Any change to a file changes its signature, which drops all of its memoized hashes.
+
+    The memo is one json file in the python side cache folder. It is read at the first lookup, and written back, if
+    anything was added, on qd.reset() (and hence on qd.init()) and at interpreter exit. Processes writing it
+    concurrently may lose each other's additions, which only costs hashing those files again.
+    """
+
+    def __init__(self, memo_path: str) -> None:
+        self.memo_path = memo_path
+        self._lock = threading.Lock()
+        self._entries = self._read()
+        self._dirty_paths: set[str] = set()
+        self.num_hits = 0
+        self.num_misses = 0
+
+    def _read(self) -> dict[str, dict]:
+        try:
+            with open(self.memo_path, encoding="utf-8") as f:
+                memo = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            warnings.warn(f"Ignoring source hash memo {self.memo_path} {e}")
+            return {}
+        if not isinstance(memo, dict) or memo.get("format") != _MEMO_FORMAT:
+            return {}
+        return memo.get("files", {})
+
+    def hash_function(self, function_info: FunctionSourceInfo, compute: Callable[[FunctionSourceInfo], str]) -> str:
+        """Returns the memoized hash of function_info, or compute(function_info), which is then memoized."""
+        filepath = function_info.filepath
+        try:
+            st = os.stat(filepath)
+        except OSError:
+            # Let compute raise its own error.
+            return compute(function_info)
+        signature = _stat_signature(st)
+        span = f"{function_info.start_lineno}-{function_info.end_lineno}"
+        with self._lock:
+            entry = self._entries.get(filepath)
+            if entry is not None and entry["stat"] == signature:
+                hash_ = entry["hashes"].get(span)
+                if hash_ is not None:
+                    self.num_hits += 1
+                    return hash_
+            self.num_misses += 1
+        # Stat before reading: should the file change in between, the hash is recorded under the old signature, which
+        # no longer matches.
+        hash_ = compute(function_info)
+        if time.time_ns() - max(st.st_mtime_ns, st.st_ctime_ns) < _RACY_WINDOW_NS:
+            return hash_
+        with self._lock:
+            entry = self._entries.get(filepath)
+            if entry is None or entry["stat"] != signature:
+                entry = self._entries[filepath] = {"stat": signature, "hashes": {}}
+            entry["hashes"][span] = hash_
+            self._dirty_paths.add(filepath)
+        return hash_
+
+    def flush(self) -> None:
+        with self._lock:
+            if not self._dirty_paths:
+                return
+            updates = {filepath: self._entries[filepath] for filepath in self._dirty_paths}
+            self._dirty_paths.clear()
+        # Merge with what other processes wrote since this one read the memo.
+        entries = self._read()
+        for filepath, entry in updates.items():
+            existing = entries.get(filepath)
+            if existing is not None and existing["stat"] == entry["stat"]:
+                existing["hashes"].update(entry["hashes"])
+            else:
+                entries[filepath] = entry
+        if len(entries) > _PRUNE_MIN_FILES:
+            entries = {filepath: entry for filepath, entry in entries.items() if os.path.exists(filepath)}
+        folder = os.path.dirname(self.memo_path)
+        os.makedirs(folder, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=folder, prefix=f"{MEMO_FILENAME}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"format": _MEMO_FORMAT, "files": entries}, f)
+            os.replace(tmp_path, self.memo_path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
+
+_memos_lock = threading.Lock()
+_memos: dict[str, SourceHashMemo] = {}
+
+
+def get_memo() -> SourceHashMemo:
+    """Returns the memo of the current offline cache folder."""
+    memo_path = os.path.join(get_cache_folder(impl.get_runtime().prog.config().offline_cache_file_path), MEMO_FILENAME)
+    memo = _memos.get(memo_path)
+    if memo is None:
+        with _memos_lock:
+            memo = _memos.get(memo_path)
+            if memo is None:
+                memo = _memos[memo_path] = SourceHashMemo(memo_path)
+    return memo
+
+
+def flush() -> None:
+    """Writes memoized hashes added by this process to disk."""
+    for memo in list(_memos.values()):
+        try:
+            memo.flush()
+        except OSError as e:
+            warnings.warn(f"Failed to write source hash memo {memo.memo_path} {e}")
+
+
+impl.on_reset(flush)
+atexit.register(flush)
@@ -11,12 +11,15 @@ from pydantic import BaseModel
 import quadrants
 from quadrants import _logging
 
+from .. import impl
 from .._wrap_inspect import FunctionSourceInfo
 from ..kernel_arguments import ArgMetadata
-from . import args_hasher, config_hasher, function_hasher
+from . import args_hasher, cache_writer, config_hasher, function_hasher
 from .args_hasher import FastcacheSkip
+from .cache_stats import KernelCacheStats
 from .fast_caching_types import HashedFunctionSourceInfo
 from .hash_utils import hash_iterable_strings
+from .packed_cache import PackedPythonSideCache
 from .python_side_cache import PythonSideCache
 
 # Bumped whenever the persisted CacheValue schema changes (see create_cache_key). v2 replaced the single
@@ -93,11 +96,28 @@ def _resolve_intenum_member(qualname: str | None, fallback: int | None) -> int |
     return fallback
 
 
+# Keys used by this process, whether stored or loaded, so that qd.cache.export_bundle can ship them to other machines:
+# fastcache keys, and the offline cache keys of the compiled kernels (for fastcache kernels and all others alike).
+used_fast_cache_keys: set[str] = set()
+used_kernel_keys: set[str] = set()
+
+
+def record_kernel_key(frontend_cache_key: str) -> None:
+    used_kernel_keys.add(frontend_cache_key)
+
+
+def _get_python_side_cache() -> PythonSideCache | PackedPythonSideCache:
+    if impl.get_runtime().src_ll_cache_backend == "packed":
+        return PackedPythonSideCache()
+    return PythonSideCache()
+
+
 def create_cache_key(
     raise_on_templated_floats: bool,
     kernel_source_info: FunctionSourceInfo,
     args: Sequence[Any],
     arg_metas: Sequence[ArgMetadata],
+    stats: KernelCacheStats | None = None,
 ) -> str | None:
     """
     cache key takes into account:
@@ -109,6 +129,8 @@ def create_cache_key(
     """
     args_hash = args_hasher.hash_args(raise_on_templated_floats, args, arg_metas)
     if isinstance(args_hash, FastcacheSkip):
+        if stats is not None:
+            stats.record_fastcache_skip(args_hash)
         if args_hash is FastcacheSkip.WARN:
             # the bit in caps at start should not be modified without modifying corresponding text
             # freetext bit can be freely modified
@@ -202,7 +224,7 @@ def store(
     if not fast_cache_key:
         return
     assert frontend_cache_key is not None
-    cache = PythonSideCache()
+    cache = _get_python_side_cache()
     hashed_function_source_infos = function_hasher.hash_functions(function_source_infos)
     labels = checkpoint_user_labels_by_cp_id or []
     enum_qualnames = [_intenum_member_qualname(lbl) for lbl in labels]
@@ -216,11 +238,16 @@ def store(
         checkpoint_user_labels_by_cp_id=labels,
         checkpoint_user_label_enum_qualnames=enum_qualnames,
     )
-    cache.store(fast_cache_key, cache_value_obj.model_dump_json())
+    used_fast_cache_keys.add(fast_cache_key)
+    used_kernel_keys.add(frontend_cache_key)
+    if impl.get_runtime().src_ll_cache_async_store:
+        cache_writer.enqueue(cache, fast_cache_key, cache_value_obj.model_dump_json())
+    else:
+        cache.store(fast_cache_key, cache_value_obj.model_dump_json())
 
 
 def _try_load(cache_key: str) -> CacheValue | None:
-    cache = PythonSideCache()
+    cache = _get_python_side_cache()
     maybe_cache_value_json = cache.try_load(cache_key)
     if maybe_cache_value_json is None:
         return None
@@ -243,6 +270,8 @@ def load(cache_key: str) -> CacheValue | None:
     if cache_value is None:
         return None
     if function_hasher.validate_hashed_function_infos(cache_value.hashed_function_source_infos):
+        used_fast_cache_keys.add(cache_key)
+        used_kernel_keys.add(cache_value.frontend_cache_key)
         return cache_value
     return None
 
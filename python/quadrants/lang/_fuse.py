@@ -0,0 +1,70 @@
+import itertools
+import linecache
+from typing import Any, Callable
+
+from ._quadrants_callable import QuadrantsCallable
+from .exception import QuadrantsSyntaxError
+from .kernel_impl import _kernel_impl, func
+
+_fuse_counter = itertools.count()
+
+
+def _member_function(kernel: Any) -> Callable:
+    """Returns the Python function of kernel, checking that it can be part of a fused kernel."""
+    if not isinstance(kernel, QuadrantsCallable) or not getattr(kernel, "_is_wrapped_kernel", False):
+        raise TypeError(f"qd.fuse expects @qd.kernel functions, got {kernel!r}")
+    if kernel._is_classkernel:
+        raise QuadrantsSyntaxError(f"qd.fuse does not support kernels of qd.data_oriented classes, got {kernel!r}")
+    primal = kernel._primal
+    assert primal is not None
+    if primal.return_type:
+        raise QuadrantsSyntaxError(f"qd.fuse does not support kernels returning values, got {primal.func.__name__}")
+    return primal.func
+
+
+def fuse(*kernels: Any) -> QuadrantsCallable:
+    """Builds a kernel running the given kernels one after the other, in one launch.
+
+    The parameters of the fused kernel are those of the given kernels, in order of first appearance: a parameter name
+    used by several kernels is a single parameter, passed to each of them, and annotated as in the first kernel using
+    it. Calling the fused kernel is equivalent to calling each kernel in turn, except that it only pays the launch
+    overhead of one kernel.
+
+    Adjacent top-level for-loops over the same range are compiled into a single loop, which runs both bodies in each
+    iteration, when this does not change the result, as in any kernel but even with ``qd.init(fuse_loops=False)``.
+    Elementwise kernels over the same fields and ndarrays are then fused into one pass over memory.
+
+    Example::
+
+        >>> step = qd.fuse(apply_forces, integrate, clamp)
+        >>> step(state, dt)
+    """
+    if not kernels:
+        raise TypeError("qd.fuse expects at least one kernel")
+    functions = [_member_function(kernel) for kernel in kernels]
+    name = "fused_" + "_".join(fn.__name__ for fn in functions)
+    filename = f"<qd.fuse-{next(_fuse_counter)}>"
+
+    namespace: dict[str, Any] = {"__name__": __name__}
+    params: list[str] = []
+    calls: list[str] = []
+    seen: set[str] = set()
+    for i, (kernel, fn) in enumerate(zip(kernels, functions)):
+        arg_names = [arg_meta.name for arg_meta in kernel._primal.arg_metas]
+        for arg_meta in kernel._primal.arg_metas:
+            if arg_meta.name not in seen:
+                seen.add(arg_meta.name)
+                annotation_name = f"_qd_annotation_{len(params)}"
+                namespace[annotation_name] = arg_meta.annotation
+                params.append(f"{arg_meta.name}: {annotation_name}")
+        namespace[f"_qd_fused_{i}"] = func(fn)
+        calls.append(f"    _qd_fused_{i}({', '.join(arg_names)})\n")
+    source = f"def {name}({', '.join(params)}):\n" + "".join(calls)
+    # The kernel's source is read back through inspect, which finds it in linecache.
+    linecache.cache[filename] = (len(source), None, source.splitlines(True), filename)
+    exec(compile(source, filename, "exec"), namespace)
+
+    fused = _kernel_impl(namespace[name], level_of_class_stackframe=3)
+    assert fused._primal is not None
+    fused._primal.fuse_loops = True
+    return fused
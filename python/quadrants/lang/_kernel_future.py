@@ -0,0 +1,67 @@
+from typing import TYPE_CHECKING, Any
+
+from quadrants._lib.core.quadrants_python import KernelLaunchContext
+
+from . import impl
+from .exception import handle_exception_from_cpp
+
+if TYPE_CHECKING:
+    from .kernel import Kernel
+
+_NOT_READ = object()
+
+
+class KernelFuture:
+    """
+    The return value of a ``@qd.kernel(async_return=True)`` kernel, as returned by its launch.
+
+    The launch does not wait for the kernel to finish: on backends that support it (CUDA), the results stay on the
+    device, and are only copied back when ``result()`` is called, so that many launches can be enqueued before reading
+    back e.g. the loss of each step. ``result()`` then waits for the kernel, but not for the launches made after it.
+    On other backends the results are read back by the launch, and ``result()`` returns them right away.
+    """
+
+    __slots__ = ("_kernel", "_launch_ctx", "_value")
+
+    def __init__(self, kernel: "Kernel | None", launch_ctx: KernelLaunchContext | None, value: Any = _NOT_READ) -> None:
+        self._kernel = kernel
+        self._launch_ctx = launch_ctx
+        self._value = value
+
+    @classmethod
+    def resolved(cls, value: Any) -> "KernelFuture":
+        """Returns a future whose result is value, for launches that return their results right away."""
+        return cls(None, None, value)
+
+    def done(self) -> bool:
+        """Whether the result has been read back already."""
+        return self._value is not _NOT_READ
+
+    def result(self) -> Any:
+        """Returns the return value of the kernel, as a regular launch would, waiting for the kernel if need be."""
+        if self._value is _NOT_READ:
+            kernel = self._kernel
+            launch_ctx = self._launch_ctx
+            assert kernel is not None and launch_ctx is not None
+            try:
+                launch_ctx.wait_for_result()
+            except Exception as e:
+                e = handle_exception_from_cpp(e)
+                if impl.get_runtime().print_full_traceback:
+                    raise e
+                raise e from None
+            return_type = kernel.return_type
+            if len(return_type) == 1:
+                self._value = kernel.construct_kernel_ret(launch_ctx, return_type[0], (0,))
+            else:
+                self._value = tuple(
+                    kernel.construct_kernel_ret(launch_ctx, ret_type, (i,)) for i, ret_type in enumerate(return_type)
+                )
+            # Releases the launch context, and the buffers it holds.
+            self._kernel = self._launch_ctx = None
+        return self._value
+
+    def __repr__(self) -> str:
+        if self._value is _NOT_READ:
+            return "<KernelFuture pending>"
+        return f"<KernelFuture result={self._value!r}>"
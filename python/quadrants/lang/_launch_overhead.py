@@ -0,0 +1,104 @@
+import dataclasses
+
+# Phases of Kernel.__call__, in launch order. Time outside of them (checks, the autograd tape, callbacks, return
+# values) is reported as "other".
+PHASES = (
+    "fuse_args",
+    "tensor_unwrap",
+    "template_mapping",
+    "args_hashing",
+    "launch_ctx",
+    "compile",
+    "cpp_launch",
+)
+
+
+@dataclasses.dataclass
+class KernelLaunchOverhead:
+    """Host time spent by the launches of one kernel in each phase of a call, summed over launches, in nanoseconds."""
+
+    name: str
+    num_launches: int = 0
+    # Kernel.fuse_args: binding keyword and default arguments to parameters.
+    fuse_args_ns: int = 0
+    # Replacing qd.Tensor wrappers by the ndarrays or fields they wrap.
+    tensor_unwrap_ns: int = 0
+    # Looking the arguments up in the template mapper, and materializing new specializations.
+    template_mapping_ns: int = 0
+    # Hashing the arguments, as the key of the launch context cache.
+    args_hashing_ns: int = 0
+    # Looking the launch context up in its cache, or setting the arguments up on it.
+    launch_ctx_ns: int = 0
+    # Compiling, or loading from the offline cache, on the first launch of each specialization.
+    compile_ns: int = 0
+    # The C++ launch, i.e. Program.launch_kernel.
+    cpp_launch_ns: int = 0
+    total_ns: int = 0
+
+    @property
+    def other_ns(self) -> int:
+        return self.total_ns - sum(getattr(self, f"{phase}_ns") for phase in PHASES)
+
+
+class LaunchOverheadRecorder:
+    """Per-kernel launch overhead recorded while qd.profiler.launch_overhead() is active."""
+
+    def __init__(self) -> None:
+        self.kernels: dict[str, KernelLaunchOverhead] = {}
+
+    def _get(self, name: str) -> KernelLaunchOverhead:
+        overhead = self.kernels.get(name)
+        if overhead is None:
+            overhead = self.kernels[name] = KernelLaunchOverhead(name=name)
+        return overhead
+
+    def record_call(
+        self, name: str, fuse_args_ns: int, tensor_unwrap_ns: int, template_mapping_ns: int, total_ns: int
+    ) -> None:
+        overhead = self._get(name)
+        overhead.num_launches += 1
+        overhead.fuse_args_ns += fuse_args_ns
+        overhead.tensor_unwrap_ns += tensor_unwrap_ns
+        overhead.template_mapping_ns += template_mapping_ns
+        overhead.total_ns += total_ns
+
+    def record_launch(
+        self, name: str, args_hashing_ns: int, launch_ctx_ns: int, compile_ns: int, cpp_launch_ns: int
+    ) -> None:
+        overhead = self._get(name)
+        overhead.args_hashing_ns += args_hashing_ns
+        overhead.launch_ctx_ns += launch_ctx_ns
+        overhead.compile_ns += compile_ns
+        overhead.cpp_launch_ns += cpp_launch_ns
+
+    def table(self) -> str:
+        """Returns the mean time per launch of each phase, in nanoseconds, one row per kernel, slowest first."""
+        columns = ("kernel", "launches", *PHASES, "other", "total")
+        rows = []
+        for overhead in sorted(self.kernels.values(), key=lambda overhead: overhead.total_ns, reverse=True):
+            n = max(overhead.num_launches, 1)
+            times = [getattr(overhead, f"{phase}_ns") for phase in PHASES] + [overhead.other_ns, overhead.total_ns]
+            rows.append((overhead.name, str(overhead.num_launches), *(f"{t / n:.0f}" for t in times)))
+        widths = [max(len(row[i]) for row in [columns, *rows]) for i in range(len(columns))]
+        lines = []
+        for row in [columns, *rows]:
+            cells = [row[0].ljust(widths[0])] + [cell.rjust(width) for cell, width in zip(row[1:], widths[1:])]
+            lines.append("  ".join(cells))
+        return "\n".join(lines)
+
+    def print_info(self) -> None:
+        """Prints table()."""
+        print(self.table())
+
+
+# LaunchOverheadRecorder installed by qd.profiler.launch_overhead(), if any. Read once per launch, so that disabled
+# profiling costs a single attribute lookup and None check per phase.
+recorder: LaunchOverheadRecorder | None = None
+
+
+def set_recorder(new_recorder: LaunchOverheadRecorder | None) -> LaunchOverheadRecorder | None:
+    """Installs new_recorder as the launch overhead recorder of every kernel, and returns the previous one."""
+    global recorder
+    previous = recorder
+    recorder = new_recorder
+    return previous
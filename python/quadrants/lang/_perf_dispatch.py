@@ -1,18 +1,28 @@
+import dataclasses
+import itertools
+import json
+import math
 import os
+import random
+import statistics
 import time
+import weakref
 from collections import defaultdict
 from typing import Any, Callable, Generic, ParamSpec, Type, TypeVar
 
 from .. import _logging
-from . import impl
+from . import _perf_dispatch_store, impl
 from ._exceptions import raise_exception
+from ._fast_caching.hash_utils import hash_iterable_strings
 from ._quadrants_callable import QuadrantsCallable
 from ._signature import get_func_signature
+from ._wrap_inspect import get_source_info_and_src
 from .exception import QuadrantsRuntimeError, QuadrantsSyntaxError
 
 NUM_FIRST_WARMUP: int = 1
 NUM_WARMUP: int = 0
 NUM_ACTIVE: int = 1
+DEFAULT_CONFIDENCE: float = 0.95
 # Internal fallback used when the caller specifies neither repeat_after_count nor repeat_after_seconds.
 DEFAULT_REPEAT_AFTER_COUNT: int = 300
 
@@ -41,27 +51,117 @@ _FORCE_MAP: dict[str, str] = _parse_force_map(_QD_PERFDISPATCH_FORCE_RAW)
 _ANY_FORCE_ACTIVE: bool = bool(_FORCE_MAP)
 
 
+def _confidence_interval(samples: list[float], z: float) -> tuple[float, float]:
+    """Normal approximation of the confidence interval of the mean of samples, as (low, high)."""
+    if len(samples) < 2:
+        return -math.inf, math.inf
+    mean = statistics.fmean(samples)
+    half_width = z * statistics.stdev(samples) / math.sqrt(len(samples))
+    return mean - half_width, mean + half_width
+
+
+@dataclasses.dataclass
+class ImplementationReport:
+    """Timings of one implementation for one geometry, in the last benchmarking cycle and exploring calls."""
+
+    name: str
+    # Calls made while benchmarking, warmup included.
+    num_trials: int
+    # Timed calls, in seconds; exploring calls keep the last max_active (or active) ones.
+    times: list[float]
+    mean: float | None
+
+
+@dataclasses.dataclass
+class GeometryReport:
+    """What a dispatcher chose for one geometry, and what choosing it cost."""
+
+    geometry_hash: int
+    # Name of the implementation in use, None while benchmarking.
+    winner: str | None
+    # Mean time of the fastest other implementation over mean time of the winner.
+    speedup: float | None
+    # Completed benchmarking cycles, and how many of them were restarted by repeat_after_count or
+    # repeat_after_seconds.
+    num_benchmarks: int
+    num_rebenchmarks: int
+    # Time spent in the calls made while benchmarking, including the synchronizations of the timed ones, in seconds.
+    benchmark_seconds: float
+    num_explorations: int
+    exploration_seconds: float
+    implementations: list[ImplementationReport]
+
+
+@dataclasses.dataclass
+class DispatcherReport:
+    """The decisions of one perf_dispatch meta function, see PerformanceDispatcher.report."""
+
+    name: str
+    implementations: list[str]
+    benchmark_seconds: float
+    exploration_seconds: float
+    geometries: list[GeometryReport]
+
+    def to_dict(self) -> dict[str, Any]:
+        return dataclasses.asdict(self)
+
+    def to_json(self, **kwargs) -> str:
+        """Returns the report as a json string; kwargs are passed to json.dumps."""
+        return json.dumps(self.to_dict(), **kwargs)
+
+
 class DispatchImpl:
-    def __init__(self, implementation1: Callable | QuadrantsCallable, is_compatible: Callable | None) -> None:
+    def __init__(
+        self,
+        implementation1: Callable | QuadrantsCallable,
+        is_compatible: Callable | None,
+        config: dict[str, Any] | None = None,
+    ) -> None:
         """
         - underlying1 might be the actual python function, or it might be a python fucntion wrapped in a
         QuadrantsCallable or not.
         - underlying2 should always be the actual python function.
+        - config holds the values of the search space parameters passed to underlying1 on top of the call arguments.
         """
         self.is_compatible: Callable | None = is_compatible
+        self.config: dict[str, Any] = config or {}
         self.__wrapped__: Callable = implementation1
         self._wrapped_type = type(implementation1)
         if self._wrapped_type is QuadrantsCallable:
             self.implementation2 = implementation1.fn  # type: ignore
         else:
             self.implementation2 = implementation1
+        self._source_hash: str | None = None
 
     def __call__(self, *args, **kwargs) -> Any:
+        if self.config:
+            if kwargs and not self.config.keys().isdisjoint(kwargs):
+                overlap = ", ".join(f"'{key}'" for key in self.config if key in kwargs)
+                raise TypeError(f"{self.name} got search_space parameters {overlap} as call arguments too")
+            return self.__wrapped__(*args, **kwargs, **self.config)
         return self.__wrapped__(*args, **kwargs)
 
     def get_implementation2(self) -> Callable:
         return self.implementation2
 
+    @property
+    def name(self) -> str:
+        """Name of the implementation, followed by its config if any, e.g. 'my_impl[block_dim=128;tile=4]'."""
+        name = self.implementation2.__name__
+        if self.config:
+            name += "[" + ";".join(f"{key}={value}" for key, value in self.config.items()) + "]"
+        return name
+
+    def get_source_hash(self) -> str:
+        """Hash of the source of the implementation, not including the functions it calls."""
+        if self._source_hash is None:
+            try:
+                _, src = get_source_info_and_src(self.implementation2)
+            except (OSError, TypeError):
+                src = [self.implementation2.__qualname__]
+            self._source_hash = hash_iterable_strings(src)
+        return self._source_hash
+
 
 P = ParamSpec("P")
 R = TypeVar("R")
@@ -77,6 +177,11 @@ class PerformanceDispatcher(Generic[P, R]):
         num_active: int | None = None,
         repeat_after_count: int | None = None,
         repeat_after_seconds: float | None = None,
+        persist: bool = False,
+        max_active: int | None = None,
+        confidence: float = DEFAULT_CONFIDENCE,
+        explore: float = 0.0,
+        search_space: dict[str, list] | None = None,
     ) -> None:
         self._name: str = fn.__name__  # type: ignore
         self.num_first_warmup = num_first_warmup if num_first_warmup is not None else NUM_FIRST_WARMUP
@@ -89,9 +194,27 @@ class PerformanceDispatcher(Generic[P, R]):
             repeat_after_count = DEFAULT_REPEAT_AFTER_COUNT
         self.repeat_after_count: int | None = repeat_after_count
         self.repeat_after_seconds: float | None = repeat_after_seconds
+        self.persist: bool = persist
+        if not 0.0 < confidence < 1.0:
+            raise ValueError(f"perf_dispatch confidence must be between 0 and 1, got {confidence}")
+        if not 0.0 <= explore <= 1.0:
+            raise ValueError(f"perf_dispatch explore must be between 0 and 1, got {explore}")
+        # max_active > active enables the robust mode: implementations keep being timed, up to max_active times each,
+        # until the confidence interval of the fastest one no longer overlaps any other.
+        self.max_active: int | None = max_active
+        self.confidence: float = confidence
+        self._z: float = statistics.NormalDist().inv_cdf((1.0 + confidence) / 2.0)
+        self.explore: float = explore
+        self._rng = random.Random()
+        self.search_space: dict[str, list] = dict(search_space or {})
+        for param_name, values in self.search_space.items():
+            if not values:
+                raise ValueError(f"perf_dispatch search_space has no values for '{param_name}'")
         sig = get_func_signature(fn)
         self._param_types: dict[str, Any] = {}
         for param_name, param in sig.parameters.items():
+            if param_name in self.search_space:
+                raise ValueError(f"perf_dispatch search_space parameter '{param_name}' is also a prototype parameter")
             self._param_types[param_name] = param.annotation
         self._get_geometry_hash: Callable[P, int] = get_geometry_hash
         self._dispatch_impls: list[DispatchImpl] = []
@@ -107,9 +230,16 @@ class PerformanceDispatcher(Generic[P, R]):
         self._calls_since_last_update_by_geometry_hash: dict[int, int] = defaultdict(int)
         self._last_check_time_by_geometry_hash: dict[int, float] = defaultdict(float)
         self._first_eval_completed: set[int] = set()
+        self._num_benchmarks_by_geometry_hash: dict[int, int] = defaultdict(int)
+        self._num_rebenchmarks_by_geometry_hash: dict[int, int] = defaultdict(int)
+        self._benchmark_seconds_by_geometry_hash: dict[int, float] = defaultdict(float)
+        self._num_explorations_by_geometry_hash: dict[int, int] = defaultdict(int)
+        self._exploration_seconds_by_geometry_hash: dict[int, float] = defaultdict(float)
         self._cached_args: tuple | None = None
         self._cached_kwargs: dict | None = None
         self._cached_impl: DispatchImpl | None = None
+        # Removed from _dispatchers when garbage collected.
+        _dispatchers.append(weakref.ref(self, _dispatchers.remove))
 
     def register(
         self, implementation: Callable | None = None, *, is_compatible: Callable[[dict], bool] | None = None
@@ -132,6 +262,11 @@ class PerformanceDispatcher(Generic[P, R]):
         - the function only runs for certain ranges of dimensions on one or more of the input arguments
             - in this case, check the shape of the argument in question, and return False if out of spec for this
               implementation
+
+        The function may take, on top of the parameters of the prototype, parameters named after keys of the
+        search_space of the meta function. One variant of the function is then registered for each combination of
+        their values, which are passed as keyword arguments, e.g. to qd.template() parameters. The first variant is
+        returned.
         """
 
         def decorator(func: Callable | QuadrantsCallable) -> DispatchImpl:
@@ -140,23 +275,30 @@ class PerformanceDispatcher(Generic[P, R]):
             _logging.debug(log_str)
             if QD_PERFDISPATCH_PRINT_DEBUG or _ANY_FORCE_ACTIVE:
                 print(log_str)
+            search_params = {
+                param_name: values for param_name, values in self.search_space.items() if param_name in sig.parameters
+            }
             for param_name, _param in sig.parameters.items():
-                if param_name not in self._param_types:
+                if param_name not in self._param_types and param_name not in search_params:
                     raise_exception(
                         QuadrantsSyntaxError,
                         msg=f"Signature parameter {param_name} of function not in perf_dispatch function prototype",
                         err_code="PERFDISPATCH_ANNOTATION_SEQUENCE_MISMATCH",
                     )
-            if len(sig.parameters) != len(self._param_types):
+            num_params = len(sig.parameters) - len(search_params)
+            if num_params != len(self._param_types):
                 raise_exception(
                     QuadrantsSyntaxError,
-                    msg=f"Number of function parameters {len(sig.parameters)} doesn't match number of parameters in perf_dispatch function prototype {len(self._param_types)}",
+                    msg=f"Number of function parameters {num_params} doesn't match number of parameters in perf_dispatch function prototype {len(self._param_types)}",
                     err_code="PERFDISPATCH_ANNOTATION_SEQUENCE_MISMATCH",
                 )
 
-            dispatch_impl = DispatchImpl(implementation1=func, is_compatible=is_compatible)
-            self._dispatch_impls.append(dispatch_impl)
-            return dispatch_impl
+            dispatch_impls = [
+                DispatchImpl(implementation1=func, is_compatible=is_compatible, config=dict(zip(search_params, values)))
+                for values in itertools.product(*search_params.values())
+            ]
+            self._dispatch_impls.extend(dispatch_impls)
+            return dispatch_impls[0]
 
         if implementation is not None:
             return decorator(implementation)
@@ -171,7 +313,7 @@ class PerformanceDispatcher(Generic[P, R]):
         if not _ANY_FORCE_ACTIVE:
             return
 
-        available = [d.get_implementation2().__name__ for d in self._dispatch_impls]
+        available = [d.name for d in self._dispatch_impls]
         avail_str = ", ".join(f"'{n}'" for n in available)
         log_str = f"perf_dispatch '{self._name}': available implementations: [{avail_str}]"
         _logging.debug(log_str)
@@ -180,7 +322,7 @@ class PerformanceDispatcher(Generic[P, R]):
         forced_name = _FORCE_MAP.get(self._name)
         if forced_name is not None:
             for d in self._dispatch_impls:
-                if d.get_implementation2().__name__ == forced_name:
+                if d.name == forced_name:
                     self._forced_impl = d
                     print(f"perf_dispatch '{self._name}': forced to '{forced_name}' via QD_PERFDISPATCH_FORCE")
                     return
@@ -219,23 +361,182 @@ class PerformanceDispatcher(Generic[P, R]):
     def _get_min_trials_finished(self, geometry_hash: int) -> int:
         return min(self._trial_count_by_dispatch_impl_by_geometry_hash[geometry_hash].values())
 
+    def _is_robust(self) -> bool:
+        return self.max_active is not None and self.max_active > self.num_active
+
+    def _get_max_samples(self) -> int:
+        return max(self.num_active, self.max_active or 0)
+
+    def _get_contenders(self, geometry_hash: int) -> set[DispatchImpl]:
+        """The implementations whose confidence interval overlaps the one of the fastest implementation."""
+        times_by_dispatch_impl = self._times_by_dispatch_impl_by_geometry_hash[geometry_hash]
+        intervals = {
+            dispatch_impl: _confidence_interval(samples, self._z)
+            for dispatch_impl, samples in times_by_dispatch_impl.items()
+        }
+        fastest = min(times_by_dispatch_impl, key=lambda d: statistics.fmean(times_by_dispatch_impl[d]))
+        fastest_high = intervals[fastest][1]
+        return {dispatch_impl for dispatch_impl, (low, _high) in intervals.items() if low <= fastest_high}
+
+    def _get_candidates(self, compatible_set: set[DispatchImpl], geometry_hash: int) -> set[DispatchImpl]:
+        """The implementations to time next: in the robust mode, once each was timed active times, the contenders
+        that are still within budget."""
+        trial_counts = self._trial_count_by_dispatch_impl_by_geometry_hash[geometry_hash]
+        warmup = self._get_effective_warmup(geometry_hash)
+        if (
+            not self._is_robust()
+            or len(trial_counts) < len(compatible_set)
+            or min(trial_counts.values()) < warmup + self.num_active
+        ):
+            return compatible_set
+        assert self.max_active is not None
+        return {d for d in self._get_contenders(geometry_hash) if trial_counts[d] < warmup + self.max_active}
+
     def _compute_are_trials_finished(self, geometry_hash: int, num_compatible: int) -> bool:
         trial_counts = self._trial_count_by_dispatch_impl_by_geometry_hash[geometry_hash]
         if len(trial_counts) < num_compatible:
             return False
 
         min_trials = min(trial_counts.values())
-        return min_trials >= self._get_effective_warmup(geometry_hash) + self.num_active
+        warmup = self._get_effective_warmup(geometry_hash)
+        if min_trials < warmup + self.num_active:
+            return False
+        if not self._is_robust():
+            return True
+        assert self.max_active is not None
+        contenders = self._get_contenders(geometry_hash)
+        return len(contenders) == 1 or all(trial_counts[d] >= warmup + self.max_active for d in contenders)
 
     def _compute_and_update_fastest(self, geometry_hash: int) -> None:
         times_by_dispatch_impl = self._times_by_dispatch_impl_by_geometry_hash[geometry_hash]
         fastest_dispatch, _ = min(times_by_dispatch_impl.items(), key=lambda x: sum(x[1]) / len(x[1]))
         self._fastest_dispatch_impl_by_geometry_hash[geometry_hash] = fastest_dispatch
-        underlying = fastest_dispatch.get_implementation2()
-        log_str = f"perf_dispatch '{self._name}': chose '{underlying.__name__}' out of {len(self._dispatch_impls)} registered functions."
+        log_str = f"perf_dispatch '{self._name}': chose '{fastest_dispatch.name}' out of {len(self._dispatch_impls)} registered functions."
         _logging.debug(log_str)
         if QD_PERFDISPATCH_PRINT_DEBUG:
             print(log_str)
+        if self._persists():
+            store = _perf_dispatch_store.get_store()
+            store.set_winner(self._get_dispatcher_key(), geometry_hash, fastest_dispatch.name)
+
+    def _timed_call(self, dispatch_impl: DispatchImpl, args: tuple, kwargs: dict) -> tuple[Any, float]:
+        """Calls dispatch_impl, and returns its result and how long it ran, in seconds."""
+        runtime = impl.get_runtime()
+        runtime.sync()
+        start = time.perf_counter_ns()
+        res = dispatch_impl(*args, **kwargs)
+        runtime.sync()
+        return res, (time.perf_counter_ns() - start) * 1e-9
+
+    def _explore(self, geometry_hash: int, args: tuple, kwargs: dict) -> Any:
+        """Times an implementation picked at random, possibly the fastest one, and switches to another implementation
+        if it has become faster on average."""
+        compatible_set = self._get_compatible_functions(*args, **kwargs)
+        # In registration order, so that a seeded _rng picks reproducibly.
+        compatible = [d for d in self._dispatch_impls if d in compatible_set]
+        dispatch_impl = self._rng.choice(compatible)
+        res, elapsed = self._timed_call(dispatch_impl, args, kwargs)
+        self._num_explorations_by_geometry_hash[geometry_hash] += 1
+        self._exploration_seconds_by_geometry_hash[geometry_hash] += elapsed
+        times_by_dispatch_impl = self._times_by_dispatch_impl_by_geometry_hash[geometry_hash]
+        samples = times_by_dispatch_impl[dispatch_impl]
+        samples.append(elapsed)
+        del samples[: -self._get_max_samples()]
+        if all(times_by_dispatch_impl.get(d) for d in compatible):
+            fastest = min(compatible, key=lambda d: statistics.fmean(times_by_dispatch_impl[d]))
+            if fastest is not self._fastest_dispatch_impl_by_geometry_hash.get(geometry_hash):
+                self._compute_and_update_fastest(geometry_hash)
+        return res
+
+    def _persists(self) -> bool:
+        # The qd.python backend has neither an offline cache folder nor device capabilities.
+        return self.persist and not impl.is_python_backend()
+
+    def _get_dispatcher_key(self) -> str:
+        impl_names_and_hashes = [
+            (dispatch_impl.name, dispatch_impl.get_source_hash()) for dispatch_impl in self._dispatch_impls
+        ]
+        return _perf_dispatch_store.get_dispatcher_key(self._name, impl_names_and_hashes)
+
+    def _restore_fastest(self, geometry_hash: int, compatible_set: set[DispatchImpl]) -> DispatchImpl | None:
+        """Makes the winner recorded by a previous process for this geometry the fastest, if it is compatible."""
+        winner_name = _perf_dispatch_store.get_store().get_winner(self._get_dispatcher_key(), geometry_hash)
+        if winner_name is None:
+            return None
+        dispatch_impl = next(
+            (d for d in compatible_set if d.name == winner_name),
+            None,
+        )
+        if dispatch_impl is None:
+            return None
+        self._fastest_dispatch_impl_by_geometry_hash[geometry_hash] = dispatch_impl
+        self._first_eval_completed.add(geometry_hash)
+        self._last_check_time_by_geometry_hash[geometry_hash] = time.time()
+        log_str = f"perf_dispatch '{self._name}': chose '{winner_name}', as recorded by a previous run."
+        _logging.debug(log_str)
+        if QD_PERFDISPATCH_PRINT_DEBUG:
+            print(log_str)
+        return dispatch_impl
+
+    def _report_geometry(self, geometry_hash: int) -> GeometryReport:
+        trial_counts = self._trial_count_by_dispatch_impl_by_geometry_hash.get(geometry_hash, {})
+        times_by_dispatch_impl = self._times_by_dispatch_impl_by_geometry_hash.get(geometry_hash, {})
+        implementations = []
+        means: dict[DispatchImpl, float] = {}
+        for dispatch_impl in self._dispatch_impls:
+            times = list(times_by_dispatch_impl.get(dispatch_impl, []))
+            if dispatch_impl not in trial_counts and not times:
+                continue
+            mean = statistics.fmean(times) if times else None
+            if mean is not None:
+                means[dispatch_impl] = mean
+            implementations.append(
+                ImplementationReport(
+                    name=dispatch_impl.name, num_trials=trial_counts.get(dispatch_impl, 0), times=times, mean=mean
+                )
+            )
+        fastest = self._fastest_dispatch_impl_by_geometry_hash.get(geometry_hash)
+        speedup = None
+        other_means = [mean for dispatch_impl, mean in means.items() if dispatch_impl is not fastest]
+        if fastest in means and other_means and means[fastest] > 0.0:
+            speedup = min(other_means) / means[fastest]
+        return GeometryReport(
+            geometry_hash=geometry_hash,
+            winner=fastest.name if fastest is not None else None,
+            speedup=speedup,
+            num_benchmarks=self._num_benchmarks_by_geometry_hash.get(geometry_hash, 0),
+            num_rebenchmarks=self._num_rebenchmarks_by_geometry_hash.get(geometry_hash, 0),
+            benchmark_seconds=self._benchmark_seconds_by_geometry_hash.get(geometry_hash, 0.0),
+            num_explorations=self._num_explorations_by_geometry_hash.get(geometry_hash, 0),
+            exploration_seconds=self._exploration_seconds_by_geometry_hash.get(geometry_hash, 0.0),
+            implementations=implementations,
+        )
+
+    def report(self) -> DispatcherReport:
+        """
+        Returns, for each geometry seen so far, the implementation in use, the timings it was chosen on, and the time
+        spent benchmarking and exploring. Timings are those of the last benchmarking cycle, and of the exploring calls
+        since.
+        """
+        geometry_hashes = dict.fromkeys(
+            [*self._trial_count_by_dispatch_impl_by_geometry_hash, *self._fastest_dispatch_impl_by_geometry_hash]
+        )
+        geometries = [self._report_geometry(geometry_hash) for geometry_hash in geometry_hashes]
+        return DispatcherReport(
+            name=self._name,
+            implementations=[dispatch_impl.name for dispatch_impl in self._dispatch_impls],
+            benchmark_seconds=sum(geometry.benchmark_seconds for geometry in geometries),
+            exploration_seconds=sum(geometry.exploration_seconds for geometry in geometries),
+            geometries=geometries,
+        )
+
+    def get_best_config(self, *args: P.args, **kwargs: P.kwargs) -> dict[str, Any] | None:
+        """
+        Returns the search space values of the implementation chosen for the geometry of these arguments, or None if
+        none was chosen yet.
+        """
+        fastest = self._fastest_dispatch_impl_by_geometry_hash.get(self._get_geometry_hash(*args, **kwargs))
+        return dict(fastest.config) if fastest is not None else None
 
     def __call__(self, *args: P.args, **kwargs: P.kwargs):
         """
@@ -251,8 +552,9 @@ class PerformanceDispatcher(Generic[P, R]):
         - if we didn't sync before, we'd be measuring also the time for all the existing gpu function that
           have already been queued up, are processing. So we sync to make sure those have finished first.
 
-        We collect a single sample from each implementation, and compare that single sample with the samples from the
-        other implementations.
+        By default, we collect `active` samples from each implementation, and compare their means. In the robust mode,
+        enabled by max_active > active, we keep collecting samples from the implementations whose confidence interval
+        overlaps the one of the fastest implementation, until none does or each of them has max_active samples.
 
         We are comparing algorithms based on empirical runtime.
 
@@ -260,10 +562,9 @@ class PerformanceDispatcher(Generic[P, R]):
         geometries, otherwise the comparison between runtimes might not be fair, and an inappropriate implementation
         function might be selected.
 
-        We are not implementing an epsilon-greedy algorithm to keep sampling non-fastest variants just in case the
-        distribution is shifting over time.
-
-        It is not possible for you to control exploration vs exploitation.
+        Once the fastest implementation is chosen, a fraction `explore` of the calls (0 by default) runs and times an
+        implementation picked at random, epsilon-greedy, which switches to another implementation if the distribution
+        shifts over time.
         """
         self._resolve_force()
         if self._forced_impl is not None:
@@ -294,15 +595,17 @@ class PerformanceDispatcher(Generic[P, R]):
                 if elapsed >= self.repeat_after_seconds:
                     restart_measurements = True
             if not restart_measurements:
+                if self.explore > 0.0 and self._rng.random() < self.explore:
+                    return self._explore(geometry_hash, args, kwargs)
                 return fastest(*args, **kwargs)
 
             self._times_by_dispatch_impl_by_geometry_hash[geometry_hash].clear()
             self._trial_count_by_dispatch_impl_by_geometry_hash[geometry_hash].clear()
             del self._fastest_dispatch_impl_by_geometry_hash[geometry_hash]
             self._calls_since_last_update_by_geometry_hash[geometry_hash] = 0
+            self._num_rebenchmarks_by_geometry_hash[geometry_hash] += 1
 
         res = None
-        runtime = impl.get_runtime()
         compatible_set = self._get_compatible_functions(*args, **kwargs)
         if len(compatible_set) == 0:
             raise QuadrantsRuntimeError("No suitable functions were found.")
@@ -313,7 +616,7 @@ class PerformanceDispatcher(Generic[P, R]):
             self._last_check_time_by_geometry_hash[geometry_hash] = time.time()
             self._cached_args, self._cached_kwargs, self._cached_impl = args, kwargs, dispatch_impl_
             log_str = (
-                f"perf_dispatch '{self._name}': chose '{dispatch_impl_.get_implementation2().__name__}' "
+                f"perf_dispatch '{self._name}': chose '{dispatch_impl_.name}' "
                 f"out of {len(self._dispatch_impls)} registered functions. Only 1 was compatible."
             )
             _logging.debug(log_str)
@@ -321,30 +624,55 @@ class PerformanceDispatcher(Generic[P, R]):
                 print(log_str)
             return dispatch_impl_(*args, **kwargs)
 
+        if (
+            self._persists()
+            and geometry_hash not in self._first_eval_completed
+            and not self._trial_count_by_dispatch_impl_by_geometry_hash[geometry_hash]
+        ):
+            restored = self._restore_fastest(geometry_hash, compatible_set)
+            if restored is not None:
+                return restored(*args, **kwargs)
+
         effective_warmup = self._get_effective_warmup(geometry_hash)
         min_trial_count, dispatch_impl = self._get_next_dispatch_impl(
-            compatible_set=compatible_set, geometry_hash=geometry_hash
+            compatible_set=self._get_candidates(compatible_set, geometry_hash), geometry_hash=geometry_hash
         )
         trial_count_by_dispatch_impl = self._trial_count_by_dispatch_impl_by_geometry_hash[geometry_hash]
         trial_count_by_dispatch_impl[dispatch_impl] += 1
         in_warmup = min_trial_count < effective_warmup
-        start = 0
-        if not in_warmup:
-            runtime.sync()
-            start = time.time()
-        res = dispatch_impl(*args, **kwargs)
-        if not in_warmup:
-            runtime.sync()
-            end = time.time()
-            elapsed = end - start
+        if in_warmup:
+            start = time.perf_counter_ns()
+            res = dispatch_impl(*args, **kwargs)
+            self._benchmark_seconds_by_geometry_hash[geometry_hash] += (time.perf_counter_ns() - start) * 1e-9
+        else:
+            res, elapsed = self._timed_call(dispatch_impl, args, kwargs)
+            self._benchmark_seconds_by_geometry_hash[geometry_hash] += elapsed
             self._times_by_dispatch_impl_by_geometry_hash[geometry_hash][dispatch_impl].append(elapsed)
             if self._compute_are_trials_finished(geometry_hash=geometry_hash, num_compatible=len(compatible_set)):
                 self._compute_and_update_fastest(geometry_hash)
+                self._num_benchmarks_by_geometry_hash[geometry_hash] += 1
                 self._first_eval_completed.add(geometry_hash)
                 self._last_check_time_by_geometry_hash[geometry_hash] = time.time()
         return res
 
 
+_dispatchers: list[weakref.ref[PerformanceDispatcher]] = []
+
+
+def perf_dispatch_report() -> list[DispatcherReport]:
+    """
+    Returns the report of each perf_dispatch meta function still alive, in creation order, see
+    PerformanceDispatcher.report.
+
+    Example::
+
+        >>> with open("perf_dispatch.json", "w") as f:
+        ...     json.dump([report.to_dict() for report in qd.perf_dispatch_report()], f)
+    """
+    # Copied first, since the weakref callbacks may remove dispatchers while the reports are made.
+    return [dispatcher.report() for ref in list(_dispatchers) if (dispatcher := ref()) is not None]
+
+
 def perf_dispatch(
     *,
     get_geometry_hash: Callable,
@@ -353,6 +681,11 @@ def perf_dispatch(
     active: int = NUM_ACTIVE,
     repeat_after_count: int | None = None,
     repeat_after_seconds: float | None = None,
+    persist: bool = False,
+    max_active: int | None = None,
+    confidence: float = DEFAULT_CONFIDENCE,
+    explore: float = 0.0,
+    search_space: dict[str, list] | None = None,
 ):
     """
     This annotation designates a meta-function that can have one or more functions registered with it.
@@ -380,6 +713,23 @@ def perf_dispatch(
         A None trigger means "choose a suitable value for me": if the other trigger is given an explicit
         value, the None one is left off; if both are None, perf_dispatch re-benchmarks every 300 calls
         with no time-based trigger.
+        persist: Record the winner of each geometry next to the offline cache, so that later processes start
+            directly on it instead of benchmarking again (default: False). Recorded winners are only reused with
+            the same implementation sources, arch and device. get_geometry_hash must then return the same value for
+            the same geometry in every process, e.g. the hash of a tuple of ints such as a shape, unlike the hashes of
+            strings, which Python salts per process, or of objects, which are based on their ids.
+        max_active: Enables the robust mode when greater than active: implementations whose timings cannot yet be
+            told apart from the fastest one keep being timed, up to max_active times each, until the confidence
+            interval of the mean time of the fastest one no longer overlaps any other (default: None).
+        confidence: Confidence level of the intervals compared in the robust mode (default: 0.95).
+        explore: Fraction of the calls, once the fastest implementation is chosen, that time an implementation picked
+            at random, and switch to it when it has become faster on average, using the last max_active (or active)
+            timings of each implementation (default: 0).
+        search_space: Values to try for parameters that registered functions take on top of the prototype ones, which
+            must not share their names, e.g.
+            {"block_dim": [64, 128, 256], "tile": [4, 8]}. Each registered function taking some of these parameters
+            is registered once per combination of their values, and the variants are benchmarked as any other
+            implementation (default: None). See get_best_config.
 
     Example usage:
 
@@ -448,9 +798,14 @@ def perf_dispatch(
             num_active=active,
             repeat_after_count=repeat_after_count,
             repeat_after_seconds=repeat_after_seconds,
+            persist=persist,
+            max_active=max_active,
+            confidence=confidence,
+            explore=explore,
+            search_space=search_space,
         )
 
     return decorator
 
 
-__all__ = ["perf_dispatch"]
+__all__ = ["perf_dispatch", "perf_dispatch_report"]
@@ -0,0 +1,152 @@
+import atexit
+import contextlib
+import json
+import os
+import tempfile
+import threading
+import warnings
+
+if os.name == "nt":
+    import msvcrt
+else:
+    import fcntl
+
+from . import impl
+from ._fast_caching.config_hasher import hash_device_caps
+from ._fast_caching.hash_utils import hash_iterable_strings
+
+STORE_FILENAME = "perf_dispatch_winners.json"
+_STORE_FORMAT = "quadrants-perf-dispatch-winners-v1"
+# Geometry hashes that are not stable across processes add new entries on every run, so only the ones recorded most
+# recently are kept.
+MAX_GEOMETRIES_PER_DISPATCHER = 1024
+
+
+@contextlib.contextmanager
+def _lock_file(lock_path: str):
+    """Holds an exclusive lock on lock_path, across processes. The OS releases it if the process dies."""
+    with open(lock_path, "a+b") as f:
+        if os.name == "nt":
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+def get_dispatcher_key(dispatcher_name: str, impl_names_and_hashes: list[tuple[str, str]]) -> str:
+    """
+    Identifies a dispatcher on the current device: its name, the names and source hashes of its implementations, the
+    arch and the device capabilities. A winner recorded under this key is only reused while none of these change.
+    """
+    strings = [dispatcher_name, str(impl.current_cfg().arch), hash_device_caps()]
+    for name, source_hash in impl_names_and_hashes:
+        strings += [name, source_hash]
+    return hash_iterable_strings(strings, separator="\n")
+
+
+class PerfDispatchStore:
+    """
+    On-disk record of the implementation chosen by each persistent perf_dispatch dispatcher for each geometry, so that
+    a new process starts directly on the winner measured by a previous one.
+
+    Winners are keyed by dispatcher key, see get_dispatcher_key, then by geometry hash. The store is one json file in
+    the offline cache folder. It is read when first used, and written back, if anything was recorded, on qd.reset()
+    (and hence on qd.init()) and at interpreter exit, merged with what other processes wrote meanwhile, under a lock
+    file next to the store.
+    """
+
+    def __init__(self, store_path: str) -> None:
+        self.store_path = store_path
+        self._lock = threading.Lock()
+        self._winners = self._read()
+        self._updates: dict[str, dict[str, str]] = {}
+
+    def _read(self) -> dict[str, dict[str, str]]:
+        try:
+            with open(self.store_path, encoding="utf-8") as f:
+                store = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            warnings.warn(f"Ignoring perf_dispatch store {self.store_path} {e}")
+            return {}
+        if not isinstance(store, dict) or store.get("format") != _STORE_FORMAT:
+            return {}
+        return store.get("winners", {})
+
+    def get_winner(self, dispatcher_key: str, geometry_hash: int) -> str | None:
+        """Returns the name of the implementation recorded for this geometry, if any."""
+        with self._lock:
+            return self._winners.get(dispatcher_key, {}).get(str(geometry_hash))
+
+    def set_winner(self, dispatcher_key: str, geometry_hash: int, impl_name: str) -> None:
+        with self._lock:
+            self._winners.setdefault(dispatcher_key, {})[str(geometry_hash)] = impl_name
+            self._updates.setdefault(dispatcher_key, {})[str(geometry_hash)] = impl_name
+
+    def flush(self) -> None:
+        with self._lock:
+            if not self._updates:
+                return
+            updates = self._updates
+            self._updates = {}
+        folder = os.path.dirname(self.store_path)
+        os.makedirs(folder, exist_ok=True)
+        # Held from the read to the replace, so that processes flushing at the same time do not drop each other's
+        # winners.
+        with _lock_file(f"{self.store_path}.lock"):
+            winners = self._read()
+            for dispatcher_key, winner_by_geometry in updates.items():
+                merged = winners.setdefault(dispatcher_key, {})
+                for geometry_hash, impl_name in winner_by_geometry.items():
+                    # Moved to the end, so that the entries are ordered from least to most recently recorded.
+                    merged.pop(geometry_hash, None)
+                    merged[geometry_hash] = impl_name
+                for geometry_hash in list(merged)[:-MAX_GEOMETRIES_PER_DISPATCHER]:
+                    del merged[geometry_hash]
+            fd, tmp_path = tempfile.mkstemp(dir=folder, prefix=f"{STORE_FILENAME}.", suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump({"format": _STORE_FORMAT, "winners": winners}, f)
+                os.replace(tmp_path, self.store_path)
+            except BaseException:
+                os.remove(tmp_path)
+                raise
+
+
+_stores_lock = threading.Lock()
+_stores: dict[str, PerfDispatchStore] = {}
+
+
+def get_store() -> PerfDispatchStore:
+    """Returns the store of the current offline cache folder."""
+    store_path = os.path.join(impl.get_runtime().prog.config().offline_cache_file_path, STORE_FILENAME)
+    store = _stores.get(store_path)
+    if store is None:
+        with _stores_lock:
+            store = _stores.get(store_path)
+            if store is None:
+                store = _stores[store_path] = PerfDispatchStore(store_path)
+    return store
+
+
+def flush() -> None:
+    """Writes the winners recorded by this process to disk."""
+    for store in list(_stores.values()):
+        try:
+            store.flush()
+        except OSError as e:
+            warnings.warn(f"Failed to write perf_dispatch store {store.store_path} {e}")
+
+
+impl.on_reset(flush)
+atexit.register(flush)
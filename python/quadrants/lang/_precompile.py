@@ -0,0 +1,222 @@
+import concurrent.futures
+import dataclasses
+import threading
+import time
+from typing import Any, Iterable
+
+from quadrants._lib.core.quadrants_python import Arch
+from quadrants._tensor_wrapper import _TENSOR_WRAPPER_TYPES
+from quadrants.types.enums import AutodiffMode
+
+from .. import _logging
+from . import impl
+from ._fast_caching import src_hasher
+from ._kernel_types import CompiledKernelKeyType
+from ._quadrants_callable import BoundQuadrantsCallable, QuadrantsCallable
+from .exception import handle_exception_from_cpp
+from .kernel import Kernel
+from .kernel_impl import _BoundedDifferentiableMethod
+
+
+@dataclasses.dataclass
+class PrecompiledKernel:
+    """Outcome of qd.precompile for one (kernel, example_args) item. Times are in seconds."""
+
+    name: str
+    # Python AST transformation and C++ front-end IR, on the calling thread.
+    materialize_time: float = 0.0
+    # C++ compilation (or offline cache load), on the compile thread pool.
+    compile_time: float = 0.0
+    # Loaded through fastcache, so nothing was left to compile.
+    src_ll_cache_hit: bool = False
+    # Loaded from the offline cache.
+    fe_ll_cache_hit: bool = False
+
+
+def _resolve_kernel(kernel: Any, args: tuple[Any, ...]) -> tuple[Kernel, tuple[Any, ...]]:
+    """Returns the primal Kernel behind kernel, and args with the owning instance prepended for bound class kernels."""
+    if isinstance(kernel, Kernel):
+        return kernel, args
+    if isinstance(kernel, _BoundedDifferentiableMethod):
+        assert kernel._primal is not None
+        return kernel._primal, (kernel._kernel_owner, *args)
+    if isinstance(kernel, BoundQuadrantsCallable):
+        primal = kernel.quadrants_callable._primal
+        if primal is not None:
+            return primal, (kernel.instance, *args)
+    if isinstance(kernel, QuadrantsCallable) and kernel._primal is not None:
+        return kernel._primal, args
+    raise TypeError(f"qd.precompile expects @qd.kernel functions, got {kernel!r}")
+
+
+def _materialize(kernel: Kernel, py_args: tuple[Any, ...]) -> tuple[CompiledKernelKeyType, tuple[Any, ...]]:
+    """Same steps as Kernel.__call__ up to ensure_compiled, without launching. Also returns the args as launched."""
+    config = impl.current_cfg()
+    kernel.raise_on_templated_floats = config.raise_on_templated_floats
+    py_args = kernel.fuse_args(is_func=False, is_pyfunc=False, py_args=py_args, kwargs={}, global_context=None)
+    py_args = tuple(arg._impl if type(arg) in _TENSOR_WRAPPER_TYPES else arg for arg in py_args)
+    if kernel.autodiff_mode != AutodiffMode.NONE and config.opt_level == 0:
+        _logging.warn("""opt_level = 1 is enforced to enable gradient computation.""")
+        config.opt_level = 1
+    return kernel.ensure_compiled(*py_args), py_args
+
+
+def precompile(items: Iterable[tuple[Any, tuple[Any, ...]]], num_threads: int | None = None) -> list[PrecompiledKernel]:
+    """Compiles a set of kernels ahead of their first launch, compiling several of them at once.
+
+    Each item is a ``(kernel, example_args)`` pair, where ``example_args`` are arguments the kernel will be called
+    with, e.g. the ndarrays of the real run, or ndarrays of the same dtype and ndim. Kernels are compiled for the
+    specialization those arguments select, exactly as the first ``kernel(*example_args)`` call would, but nothing is
+    launched.
+
+    The Python side of compilation (AST transformation) runs on the calling thread, one kernel after the other. The
+    C++ side, which usually dominates, then runs on ``num_threads`` threads (``qd.init(num_compile_threads=...)`` by
+    default). Only the LLVM backends (CPU, CUDA, AMDGPU) compile concurrently; the other backends compile one kernel
+    after the other.
+
+    Kernels found in fastcache, or already compiled, are not compiled again. Fastcache entries of newly compiled
+    kernels are stored as on a first launch.
+
+    Returns one PrecompiledKernel per item, in order.
+    """
+    runtime = impl.get_runtime()
+    items = list(items)
+    results = [PrecompiledKernel(name=getattr(kernel, "__name__", repr(kernel))) for kernel, _args in items]
+    if runtime._arch == Arch.python:
+        return results
+
+    # (kernel, key, fast_checksum, index of the first item resolving to that key)
+    pending: list[tuple[Kernel, CompiledKernelKeyType, str | None, int]] = []
+    pending_keys: set[tuple[int, CompiledKernelKeyType]] = set()
+    for i, (kernel, args) in enumerate(items):
+        primal, py_args = _resolve_kernel(kernel, tuple(args))
+        results[i].name = primal.func.__name__
+        start = time.perf_counter()
+        key, _py_args = _materialize(primal, py_args)
+        results[i].materialize_time = time.perf_counter() - start
+        # materialize() sets fast_checksum only when it actually materialized key; otherwise it is None, as on a launch.
+        fast_checksum = primal.fast_checksum
+        if primal.compiled_kernel_data_by_key.get(key):
+            # Either loaded through fastcache just now, or compiled by an earlier launch or precompile.
+            results[i].src_ll_cache_hit = fast_checksum is not None
+            continue
+        if (id(primal), key) in pending_keys:
+            continue
+        pending_keys.add((id(primal), key))
+        pending.append((primal, key, fast_checksum, i))
+
+    if not pending:
+        return results
+
+    prog = runtime.prog
+    try:
+        compile_results = prog.compile_kernels(
+            prog.config(),
+            prog.get_device_caps(),
+            [primal.materialized_kernels[key] for primal, key, _fast_checksum, _i in pending],
+            num_threads or 0,
+        )
+    except Exception as e:
+        e = handle_exception_from_cpp(e)
+        if runtime.print_full_traceback:
+            raise e
+        raise e from None
+
+    for (primal, key, fast_checksum, i), compile_result in zip(pending, compile_results):
+        primal.compiled_kernel_data_by_key[key] = compile_result.compiled_kernel_data
+        results[i].compile_time = compile_result.compile_time
+        src_hasher.record_kernel_key(compile_result.cache_key)
+        primal.cache_stats.record_compile(compile_result.cache_hit, compile_result.compile_time)
+        if compile_result.cache_hit:
+            primal.fe_ll_cache_observations.cache_hit = True
+            results[i].fe_ll_cache_hit = True
+        if fast_checksum:
+            primal.store_in_fastcache(key, fast_checksum, compile_result.cache_key)
+    return results
+
+
+_executor_lock = threading.Lock()
+_executor: concurrent.futures.ThreadPoolExecutor | None = None
+_pending_futures: set["concurrent.futures.Future[PrecompiledKernel]"] = set()
+
+
+def _get_executor() -> concurrent.futures.ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="qd-compile-async")
+        return _executor
+
+
+def _completed(result: PrecompiledKernel) -> "concurrent.futures.Future[PrecompiledKernel]":
+    future: "concurrent.futures.Future[PrecompiledKernel]" = concurrent.futures.Future()
+    future.set_result(result)
+    return future
+
+
+def compile_async(kernel: Any, args: tuple[Any, ...]) -> "concurrent.futures.Future[PrecompiledKernel]":
+    """Starts compiling kernel for the specialization args select, and returns without waiting for it.
+
+    The Python side of compilation (AST transformation) runs on the calling thread, before returning. The C++ side,
+    which usually dominates, runs on a background thread, one kernel after the other, while the calling thread goes on
+    launching kernels that are already compiled. Use qd.precompile instead to compile a known set of kernels as fast as
+    possible.
+
+    The returned future resolves to a PrecompiledKernel once the kernel can be launched without compiling, or raises
+    the compilation error. A launch of the same specialization before then waits for the background compile, rather
+    than compiling the kernel a second time. Kernels found in fastcache, or already compiled, return a future that is
+    already done.
+
+    Compiles that have not started yet are cancelled on qd.reset() (and hence on qd.init()).
+    """
+    runtime = impl.get_runtime()
+    primal, py_args = _resolve_kernel(kernel, tuple(args))
+    result = PrecompiledKernel(name=primal.func.__name__)
+    if runtime._arch == Arch.python:
+        return _completed(result)
+
+    start = time.perf_counter()
+    key, _py_args = _materialize(primal, py_args)
+    result.materialize_time = time.perf_counter() - start
+    fast_checksum = primal.fast_checksum
+    if primal.compiled_kernel_data_by_key.get(key):
+        result.src_ll_cache_hit = fast_checksum is not None
+        return _completed(result)
+    future = primal.pending_compiles.get(key)
+    if future is not None:
+        return future
+
+    prog = runtime.prog
+    compile_config = prog.config()
+    device_caps = prog.get_device_caps()
+    t_kernel = primal.materialized_kernels[key]
+    fastcache_store_kwargs = primal._get_fastcache_store_kwargs(key) if fast_checksum else None
+
+    def compile_kernel() -> PrecompiledKernel:
+        try:
+            compile_result = prog.compile_kernel(compile_config, device_caps, t_kernel)
+        except Exception as e:
+            raise handle_exception_from_cpp(e) from None
+        primal._record_compile_result(compile_result, fast_checksum, fastcache_store_kwargs)
+        primal.compiled_kernel_data_by_key[key] = compile_result.compiled_kernel_data
+        primal.pending_compiles.pop(key, None)
+        result.compile_time = compile_result.compile_time
+        result.fe_ll_cache_hit = compile_result.cache_hit
+        return result
+
+    future = _get_executor().submit(compile_kernel)
+    primal.pending_compiles[key] = future
+    _pending_futures.add(future)
+    future.add_done_callback(_pending_futures.discard)
+    return future
+
+
+def _cancel_pending_compiles() -> None:
+    futures = list(_pending_futures)
+    for future in futures:
+        future.cancel()
+    # Compiles already running cannot be cancelled, and must be done before the program is finalized.
+    concurrent.futures.wait(futures)
+
+
+impl.on_finalize(_cancel_pending_compiles)
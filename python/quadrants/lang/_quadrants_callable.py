@@ -1,8 +1,12 @@
 # Must import 'partial' directly instead of the entire module to avoid attribute lookup overhead.
 from functools import update_wrapper
-from typing import TYPE_CHECKING, Any, Callable
+from typing import TYPE_CHECKING, Any, Callable, Iterable
 
 if TYPE_CHECKING:
+    import concurrent.futures
+
+    from ._bound_launch import BoundLaunch
+    from ._precompile import PrecompiledKernel
     from .kernel import Kernel
 
 
@@ -138,6 +142,47 @@ class QuadrantsCallable:
         # looks at kwargs.
         return self.wrapper.__call__(*args, _qd_from_checkpoint=from_checkpoint, **kwargs)
 
+    def launch_many(self, arg_tuples: Iterable[tuple], qd_stream=None) -> None:
+        """Launches this kernel once per tuple of arguments in ``arg_tuples``, in order, in a single call into C++.
+
+        The launch contexts are kept, so that calling ``launch_many`` again with the very same argument objects, e.g.
+        the same ndarrays every step, skips argument processing altogether. Kernels returning values are not supported.
+        """
+        from ._bound_launch import (  # pylint: disable=import-outside-toplevel
+            launch_many,
+        )
+
+        launch_many(self, arg_tuples, qd_stream)
+
+    def compile_async(self, *args) -> "concurrent.futures.Future[PrecompiledKernel]":
+        """Starts compiling this kernel for the specialization ``args`` select, and returns without launching it.
+
+        The AST transformation runs before returning, and the C++ compilation on a background thread. The returned
+        ``concurrent.futures.Future`` resolves to a ``PrecompiledKernel`` (as returned by ``qd.precompile``) once the
+        kernel can be launched without compiling. A launch of the same specialization in the meantime waits for the
+        background compile.
+        """
+        from ._precompile import (  # pylint: disable=import-outside-toplevel
+            compile_async,
+        )
+
+        return compile_async(self, args)
+
+    def bind(self, *args, mutable: Iterable[str] = ()) -> "BoundLaunch":
+        """Binds this kernel to ``args`` once, for launching it many times at the lowest per-launch cost.
+
+        Returns a ``BoundLaunch``, whose ``launch()`` skips the argument processing of a regular call. Arguments are
+        frozen at bind time, except for the scalar parameters named in ``mutable``, whose values are passed to
+        ``launch()``, in order::
+
+            step_bound = step.bind(state, 0.0, mutable=["dt"])
+            for _ in range(n_steps):
+                step_bound.launch(dt)
+        """
+        from ._bound_launch import bind  # pylint: disable=import-outside-toplevel
+
+        return bind(self, args, mutable)
+
     def __get__(self, instance, owner):
         if instance is None:
             return self
@@ -168,6 +213,22 @@ class BoundQuadrantsCallable:
         assert self.quadrants_callable._adjoint is not None
         return self.quadrants_callable._adjoint(self.instance, *args, **kwargs)
 
+    def bind(self, *args, mutable: Iterable[str] = ()) -> "BoundLaunch":
+        """Bound-method form of `QuadrantsCallable.bind` (see that docstring)."""
+        return self.quadrants_callable.bind(self.instance, *args, mutable=mutable)
+
+    def launch_many(self, arg_tuples: Iterable[tuple], qd_stream=None) -> None:
+        """Bound-method form of `QuadrantsCallable.launch_many` (see that docstring)."""
+        from ._bound_launch import (  # pylint: disable=import-outside-toplevel
+            launch_many,
+        )
+
+        launch_many(self, arg_tuples, qd_stream)
+
+    def compile_async(self, *args) -> "concurrent.futures.Future[PrecompiledKernel]":
+        """Bound-method form of `QuadrantsCallable.compile_async` (see that docstring)."""
+        return self.quadrants_callable.compile_async(self.instance, *args)
+
     def resume(self, *args, from_checkpoint, **kwargs):
         """Bound-method form of `QuadrantsCallable.resume` (see that docstring)."""
         return self.quadrants_callable.resume(self.instance, *args, from_checkpoint=from_checkpoint, **kwargs)
@@ -5,7 +5,7 @@ from weakref import ReferenceType
 from quadrants.lang import impl
 from quadrants.lang.impl import Program
 from quadrants.lang.kernel_arguments import ArgMetadata
-from quadrants.lang.util import is_data_oriented
+from quadrants.lang.util import is_data_oriented, is_dataclass_instance
 
 from .._test_tools import warnings_helper
 from ._kernel_types import ArgsHash
@@ -34,9 +34,59 @@ def _classify_for_args_hash(arg: Any) -> "list[tuple] | None":
     paths = _struct_nd_paths_for(arg)
     if not paths:
         return None
+    _nd_paths_tracked_by_type[type(arg)] = _track_nd_paths(arg, paths)
     return paths
 
 
+# Identity fast path of ``TemplateMapper.lookup`` for args holding ndarrays through data_oriented containers. Rather
+# than walking the attribute chains of such args on every call to fold the ids of their ndarrays into the cache key,
+# the ``__setattr__`` of every data_oriented class along the chains is hooked once, so that reassigning any attribute
+# named like a chain member bumps ``_nd_attr_generation``. Identity cache entries record the generation they were
+# computed at, and are only served while it is unchanged. This is per-type, like ``_arg_nd_paths_or_none``, and chains
+# going through any container other than a data_oriented class or a frozen dataclass are walked on every call as
+# before.
+_nd_attr_generation = [0]
+_nd_attr_names: set[str] = set()
+_setattr_tracked_types: set[type] = set()
+_nd_paths_tracked_by_type: "dict[type, bool]" = {}
+
+
+def _track_setattr(cls: type) -> bool:
+    if cls in _setattr_tracked_types:
+        return True
+    base_setattr = cls.__setattr__
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in _nd_attr_names:
+            _nd_attr_generation[0] += 1
+        base_setattr(self, name, value)
+
+    try:
+        cls.__setattr__ = __setattr__  # type: ignore[method-assign]
+    except (AttributeError, TypeError):
+        return False
+    _setattr_tracked_types.add(cls)
+    return True
+
+
+def _track_nd_paths(arg: Any, paths: list[tuple]) -> bool:
+    """Hooks the containers along paths, from arg down to the parents of its ndarrays, so that rebinding any of them
+    bumps ``_nd_attr_generation``. Returns False if a container can neither be hooked nor is a frozen dataclass, e.g. a
+    mutable dataclass, whether hashable or not."""
+    for chain in paths:
+        _nd_attr_names.update(chain)
+        v = arg
+        for a in (None, *chain[:-1]):
+            if a is not None:
+                v = getattr(v, a)
+            if is_data_oriented(v):
+                if not _track_setattr(type(v)):
+                    return False
+            elif not (is_dataclass_instance(v) and type(v).__dataclass_params__.frozen):
+                return False
+    return True
+
+
 Key: TypeAlias = tuple[Any, ...]
 
 
@@ -45,6 +95,7 @@ def _destroy_callback(template_mapper_ref: ReferenceType["TemplateMapper"], ref:
     if maybe_template_mapper is not None:
         maybe_template_mapper._mapping_cache.clear()
         maybe_template_mapper._mapping_cache_tracker.clear()
+        maybe_template_mapper._identity_cache.clear()
         maybe_template_mapper._prog_weakref = None
 
 
@@ -67,6 +118,8 @@ class TemplateMapper:
         self.mapping: dict[Key, int] = {}
         self._mapping_cache: dict[ArgsHash, tuple[int, Key]] = {}
         self._mapping_cache_tracker: dict[ArgsHash, list[ReferenceType | None]] = {}
+        # ``id`` of each arg -> (cache tracker, ``_nd_attr_generation`` or None if no ndarray ids were folded, result).
+        self._identity_cache: dict[ArgsHash, tuple[list[ReferenceType | None], int | None, tuple[int, Key]]] = {}
         self._prog_weakref: ReferenceType[Program] | None = None
 
     def extract(self, raise_on_templated_floats: bool, args: tuple[Any, ...]) -> Key:
@@ -97,7 +150,15 @@ class TemplateMapper:
         # extra effort is made to do otherwise (this behavior is referring to as "interning"). Avoiding special
         # branching for primitive types dramatically improve performance of hash computation.
         mapping_cache_tracker: list[ReferenceType | None] | None = None
-        args_hash: ArgsHash = tuple([id(arg) for arg in args])
+        args_ids: ArgsHash = tuple([id(arg) for arg in args])
+        # Steady-state loops passing the very same objects every call are served by a single lookup, keyed by the ids
+        # of the args alone. See ``_nd_attr_generation`` for args whose ndarray ids would otherwise be folded in.
+        identity_entry = self._identity_cache.get(args_ids)
+        if identity_entry is not None and identity_entry[0]:
+            generation = identity_entry[1]
+            if generation is None or generation == _nd_attr_generation[0]:
+                return identity_entry[2]
+        args_hash = args_ids
         # ``@qd.data_oriented`` containers can have their member ndarrays reassigned between calls on the same instance
         # (``state.x = other_ndarray``). The id(arg) alone does not capture that, so the spec-key cache below would
         # serve a stale entry and the new ndarray's dtype/ndim would be wrong. Fold the reachable ndarray ids into the
@@ -113,6 +174,7 @@ class TemplateMapper:
         # ``None`` to skip — one ``dict.get`` per candidate per call after warmup, replacing the previous unconditional
         # ``is_data_oriented`` + ``__dict__.get`` chain that cost ~15% FPS on small-step CPU benches.
         nd_ids: list = []
+        nd_paths_tracked = True
         for i in self.template_slot_locations:
             arg = args[i]
             cls = type(arg)
@@ -123,6 +185,7 @@ class TemplateMapper:
                 _arg_nd_paths_or_none[cls] = paths
             if paths is None:
                 continue
+            nd_paths_tracked = nd_paths_tracked and _nd_paths_tracked_by_type.get(cls, False)
             for chain in paths:
                 v = arg
                 for a in chain:
@@ -135,7 +198,11 @@ class TemplateMapper:
         except KeyError:
             pass
         if mapping_cache_tracker:
-            return self._mapping_cache[args_hash]
+            result = self._mapping_cache[args_hash]
+            if nd_paths_tracked:
+                generation = _nd_attr_generation[0] if nd_ids else None
+                self._identity_cache[args_ids] = (mapping_cache_tracker, generation, result)
+            return result
 
         key = self.extract(raise_on_templated_floats, args)
         try:
@@ -149,10 +216,11 @@ class TemplateMapper:
 
         # Clear the tracker (original invalidation) and also remove the stale
         # dict entries so they do not accumulate indefinitely.
-        def _evict_callback(ref, _tracker=mapping_cache_tracker_, _self=self, _hash=args_hash):
+        def _evict_callback(ref, _tracker=mapping_cache_tracker_, _self=self, _hash=args_hash, _ids=args_ids):
             _tracker.clear()
             _self._mapping_cache.pop(_hash, None)
             _self._mapping_cache_tracker.pop(_hash, None)
+            _self._identity_cache.pop(_ids, None)
 
         try:
             # Note that it is necessary to handle primitive types separately because it does not make sense to use
@@ -163,6 +231,9 @@ class TemplateMapper:
             ]
             self._mapping_cache_tracker[args_hash] = mapping_cache_tracker_
             self._mapping_cache[args_hash] = (count, key)
+            if nd_paths_tracked:
+                generation = _nd_attr_generation[0] if nd_ids else None
+                self._identity_cache[args_ids] = (mapping_cache_tracker_, generation, (count, key))
         except TypeError as e:
             warnings_helper.warn_once(f"{e}. Template mapper caching disabled.")
 
@@ -0,0 +1,114 @@
+import atexit
+import queue
+import threading
+import warnings
+from typing import TYPE_CHECKING, Any, Callable
+
+from quadrants._lib.core.quadrants_python import CompileResult
+
+from . import impl
+
+if TYPE_CHECKING:
+    from .kernel import Kernel
+
+
+class BackgroundKernelCompiler:
+    """
+    Compiles the optimized builds of kernels from a background thread, for tiered compilation.
+
+    Enabled with qd.init(tiered_compilation=True), or per kernel with @qd.kernel(tiered=True). On a cache miss, the
+    kernel is launched right away with a quick build from Program.compile_kernel_quick, and its optimized build is
+    enqueued here. Once compiled (and written to the caches, as any other build), the optimized build replaces the
+    quick one in Kernel.compiled_kernel_data_by_key, so later launches pick it up.
+
+    Jobs are compiled one at a time, in the order they were enqueued. flush() blocks until every job enqueued so far
+    is done; it is called by qd.sync_tiered_compilation(). On qd.reset() (and hence on qd.init()) and at interpreter
+    exit, pending jobs are dropped instead, and only the running one is waited for, since the program it compiles for
+    is about to be finalized.
+    """
+
+    def __init__(self) -> None:
+        self._queue: "queue.Queue[Callable[[], None]]" = queue.Queue()
+        self._thread: threading.Thread | None = None
+        self._thread_lock = threading.Lock()
+
+    def _ensure_thread(self) -> None:
+        with self._thread_lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._run, name="qd-tiered-compile", daemon=True)
+            self._thread.start()
+            atexit.register(self.cancel_and_wait)
+
+    def enqueue(
+        self,
+        kernel: "Kernel",
+        key: Any,
+        t_kernel: Any,
+        fast_checksum: str | None,
+        fastcache_store_kwargs: dict[str, Any] | None,
+    ) -> None:
+        prog = impl.get_runtime().prog
+        compile_config = prog.config()
+        device_caps = prog.get_device_caps()
+
+        def compile_optimized() -> None:
+            try:
+                compile_result: CompileResult = prog.compile_kernel(compile_config, device_caps, t_kernel)
+            except Exception as e:  # pylint: disable=broad-except
+                warnings.warn(f"Optimized build of {kernel.func.__qualname__} failed, keeping its quick build {e}")
+                return
+            kernel._record_compile_result(compile_result, fast_checksum, fastcache_store_kwargs)
+            kernel.compiled_kernel_data_by_key[key] = compile_result.compiled_kernel_data
+
+        self._ensure_thread()
+        self._queue.put(compile_optimized)
+
+    def flush(self) -> None:
+        if self._thread is None:
+            return
+        self._queue.join()
+
+    def cancel_and_wait(self) -> None:
+        if self._thread is None:
+            return
+        while True:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                break
+            self._queue.task_done()
+        self._queue.join()
+
+    def _run(self) -> None:
+        while True:
+            job = self._queue.get()
+            try:
+                job()
+            finally:
+                self._queue.task_done()
+
+
+_compiler = BackgroundKernelCompiler()
+
+
+def enqueue(
+    kernel: "Kernel",
+    key: Any,
+    t_kernel: Any,
+    fast_checksum: str | None,
+    fastcache_store_kwargs: dict[str, Any] | None,
+) -> None:
+    _compiler.enqueue(kernel, key, t_kernel, fast_checksum, fastcache_store_kwargs)
+
+
+def sync_tiered_compilation() -> None:
+    """Blocks until the optimized builds of every kernel launched so far with tiered compilation are swapped in.
+
+    It is a no-op when tiered compilation is disabled. Pending optimized builds are dropped on ``qd.reset()`` /
+    ``qd.init()``, and kernels then start from their quick builds again in the new program.
+    """
+    _compiler.flush()
+
+
+impl.on_finalize(_compiler.cancel_and_wait)
@@ -431,6 +431,11 @@ class PyQuadrants:
         self.short_circuit_operators: bool = False
         self.unrolling_limit: int = 0
         self.src_ll_cache: bool = True
+        self.src_ll_cache_max_bytes: int = 0
+        self.src_ll_cache_max_entries: int = 0
+        self.src_ll_cache_backend: str = "files"
+        self.src_ll_cache_async_store: bool = False
+        self.tiered_compilation: bool = False
 
     @property
     def compiling_callable(self) -> KernelCxx | Kernel | Function:
@@ -622,6 +627,7 @@ def get_runtime() -> PyQuadrants:
 
 
 _reset_hooks: list[Callable[[], None]] = []
+_finalize_hooks: list[Callable[[], None]] = []
 
 
 def on_reset(hook: Callable[[], None]) -> None:
@@ -629,8 +635,16 @@ def on_reset(hook: Callable[[], None]) -> None:
     _reset_hooks.append(hook)
 
 
+def on_finalize(hook: Callable[[], None]) -> None:
+    """Register a callback to be invoked on ``reset()``, before the program is finalized, e.g. to wait for background
+    work that still uses it."""
+    _finalize_hooks.append(hook)
+
+
 def reset():
     global pyquadrants
+    for hook in _finalize_hooks:
+        hook()
     old_ndarrays = pyquadrants.ndarrays
     old_kernels = pyquadrants.kernels
     pyquadrants.clear()
@@ -1,4 +1,5 @@
 import ast
+import concurrent.futures
 import dataclasses
 import json
 import os
@@ -10,6 +11,12 @@ from dataclasses import _FIELDS  # type: ignore[reportAttributeAccessIssue]
 
 # Must import 'partial' directly instead of the entire module to avoid attribute lookup overhead.
 from functools import partial
+
+# Must import 'attrgetter' directly instead of the entire module to avoid attribute lookup overhead.
+from operator import attrgetter
+
+# Must import 'perf_counter_ns' directly instead of the entire module to avoid attribute lookup overhead.
+from time import perf_counter_ns
 from typing import Any, Callable
 
 # Must import 'ReferenceType' directly instead of the entire module to avoid attribute lookup overhead.
@@ -36,13 +43,19 @@ from quadrants._lib.core.quadrants_python import (
 )
 from quadrants._tensor_wrapper import _TENSOR_WRAPPER_TYPES
 from quadrants._tensor_wrapper import Tensor as _TensorClass
-from quadrants.lang import _kernel_impl_dataclass, impl, runtime_ops
+from quadrants.lang import (
+    _kernel_impl_dataclass,
+    _launch_overhead,
+    _tiered_compilation,
+    impl,
+    runtime_ops,
+)
 
 # `qd.checkpoint` pause / resume model helpers. See `kernel_checkpoint.py` for the full extracted surface; `Kernel`
 # delegates the resume-cookie validation, label translation, per-launch yield_on= arg-id table build, and GraphStatus
 # construction to those free functions so this hot file doesn't accrete checkpoint-feature-specific blocks.
 from quadrants.lang import kernel_checkpoint as _checkpoint_helpers
-from quadrants.lang._fast_caching import src_hasher
+from quadrants.lang._fast_caching import cache_stats, src_hasher
 from quadrants.lang._template_mapper_hotpath import chain_has_mutable_container
 from quadrants.lang._wrap_inspect import FunctionSourceInfo, get_source_info_and_src
 from quadrants.lang.ast import (
@@ -70,6 +83,7 @@ from quadrants.types.enums import AutodiffMode
 from quadrants.types.utils import is_signed
 
 from ._func_base import FuncBase
+from ._kernel_future import KernelFuture
 from ._kernel_types import (
     ArgsHash,
     CompiledKernelKeyType,
@@ -87,6 +101,42 @@ _NONE, _VALIDATION = AutodiffMode.NONE, AutodiffMode.VALIDATION
 _FLOAT, _INT, _UINT, _QD_ARRAY, _QD_ARRAY_WITH_GRAD = KernelBatchedArgType
 _ARCH_PYTHON = Arch.python
 
+# (template arg index, getter returning the leaves of its entries, its entries), see _make_struct_leaf_getters.
+StructLeafGetters = list[tuple[int, Callable[[Any], tuple], list[tuple]]]
+
+
+def _walk_attr_chains(attr_chains: tuple[tuple[str, ...], ...], obj: Any) -> tuple:
+    leaves = []
+    for attr_chain in attr_chains:
+        leaf = obj
+        for attr_name in attr_chain:
+            leaf = getattr(leaf, attr_name)
+        leaves.append(leaf)
+    return tuple(leaves)
+
+
+def _make_struct_leaf_getters(launch_info: list[tuple]) -> StructLeafGetters:
+    """Groups the entries of a struct launch info by template arg, each entry being (arg_id, template_arg_idx,
+    attr_chain, ...), and returns a getter per template arg, which resolves the leaves of all its entries in one pass.
+
+    The getters are a single ``operator.attrgetter`` over the dotted chains, which walks them all in C, instead of one
+    ``getattr`` per link and entry in Python. Built once per specialization, as the struct types are fixed by its key.
+    """
+    entries_by_template_arg: dict[int, list[tuple]] = {}
+    for entry in launch_info:
+        entries_by_template_arg.setdefault(entry[1], []).append(entry)
+    getters: StructLeafGetters = []
+    for template_arg_idx, entries in entries_by_template_arg.items():
+        attr_chains = tuple(entry[2] for entry in entries)
+        if len(entries) == 1 or any("." in attr_name for attr_chain in attr_chains for attr_name in attr_chain):
+            # A single attrgetter name returns the leaf itself rather than a tuple, and names holding a dot, which
+            # setattr allows, cannot be told apart from chains.
+            getter = partial(_walk_attr_chains, attr_chains)
+        else:
+            getter = attrgetter(*(".".join(attr_chain) for attr_chain in attr_chains))
+        getters.append((template_arg_idx, getter, entries))
+    return getters
+
 
 class LaunchContextBufferCache:
     # Here, we are tracking whether a launch context buffer can be cached. The point of caching the launch context
@@ -189,6 +239,117 @@ class LaunchContextBufferCache:
         return True
 
 
+def _set_launch_ctx_buffer_args(
+    launch_ctx: KernelLaunchContext, launch_ctx_buffer: dict[KernelBatchedArgType, list[tuple]]
+) -> None:
+    # All arguments to context in batches to mitigate overhead of calling Python bindings repeatedly.
+    # This is essential because calling any pybind11 function is adding ~180ns penalty no matter what.
+    # Note that we are allowed to do this because Quadrants Launch Kernel context is storing the input
+    # arguments in an unordered list. The actual runtime (gfx, llvm...) will later query this context
+    # in correct order.
+    if launch_ctx_args := launch_ctx_buffer.get(_FLOAT):
+        launch_ctx.set_args_float(*zip(*launch_ctx_args))  # type: ignore
+    if launch_ctx_args := launch_ctx_buffer.get(_INT):
+        launch_ctx.set_args_int(*zip(*launch_ctx_args))  # type: ignore
+    if launch_ctx_args := launch_ctx_buffer.get(_UINT):
+        launch_ctx.set_args_uint(*zip(*launch_ctx_args))  # type: ignore
+    if launch_ctx_args := launch_ctx_buffer.get(_QD_ARRAY):
+        launch_ctx.set_args_ndarray(*zip(*launch_ctx_args))  # type: ignore
+    if launch_ctx_args := launch_ctx_buffer.get(_QD_ARRAY_WITH_GRAD):
+        launch_ctx.set_args_ndarray_with_grad(*zip(*launch_ctx_args))  # type: ignore
+
+
+def _make_launch_stats(launch_ctx_buffer: dict[KernelBatchedArgType, list[tuple]]) -> LaunchStats:
+    kernel_args_count_by_type = defaultdict(int)
+    kernel_args_count_by_type.update({key: len(launch_ctx_args) for key, launch_ctx_args in launch_ctx_buffer.items()})
+    return LaunchStats(kernel_args_count_by_type=kernel_args_count_by_type)
+
+
+class SharedLaunchArgsCache:
+    # Program-wide counterpart of 'LaunchContextBufferCache', shared by all kernels. A pipeline of kernels taking the
+    # same state (typically a frozen dataclass of ndarrays) would otherwise walk it once per kernel, on the first launch
+    # of each, to build the very same launch context buffer. Here, the buffer built by the first kernel is stored under
+    # its launch layout (see 'Kernel._launch_layout') and the ids of the args, and the kernels with the same launch
+    # layout then set it on their launch context as is, instead of walking the args again.
+    # Only cacheable buffers are stored, which hold ndarrays and small ints only. The ndarrays are stored as weak
+    # references, so that the cache does not keep them alive, and the first one being garbage collected evicts the
+    # entry, as in 'LaunchContextBufferCache'. The buffers are dropped along with the Quadrants program.
+    def __init__(self) -> None:
+        self._prog_weakref: ReferenceType[Program] | None = None
+        # Launch layouts are interned as small ints, which are much cheaper to hash as part of the cache key. Cleared
+        # along with the buffers, but ids come from a counter, so that an id is never reused for another layout.
+        self._layout_ids: dict[tuple, int] = {}
+        self._next_layout_id = 0
+        # Key is (layout id, *args_hash[1:]), i.e. the args hash of the kernel, without the kernel itself.
+        self._launch_ctx_buffers: dict[tuple, dict[KernelBatchedArgType, list[tuple]]] = {}
+
+    def get_layout_id(self, layout: tuple) -> int:
+        """Returns the id of layout, or -1 if it cannot be hashed, in which case the kernel does not share buffers."""
+        try:
+            layout_id = self._layout_ids.get(layout)
+        except TypeError:
+            return -1
+        if layout_id is None:
+            layout_id = self._layout_ids[layout] = self._next_layout_id
+            self._next_layout_id += 1
+        return layout_id
+
+    @staticmethod
+    def _destroy_callback(cache_ref: ReferenceType["SharedLaunchArgsCache"], ref: ReferenceType) -> None:
+        maybe_cache = cache_ref()
+        if maybe_cache is not None:
+            maybe_cache._launch_ctx_buffers.clear()
+            maybe_cache._layout_ids.clear()
+            maybe_cache._prog_weakref = None
+
+    def get(self, shared_args_hash: tuple) -> dict[KernelBatchedArgType, list[tuple]] | None:
+        """Returns the launch context buffer cached under shared_args_hash, if any, with its ndarrays resolved."""
+        if self._prog_weakref is None:
+            prog = impl.get_runtime().prog
+            assert prog is not None
+            self._prog_weakref = ReferenceType(
+                prog, partial(SharedLaunchArgsCache._destroy_callback, ReferenceType(self))
+            )
+        weak_buffer = self._launch_ctx_buffers.get(shared_args_hash)
+        if weak_buffer is None:
+            return None
+        launch_ctx_buffer = dict(weak_buffer)
+        if launch_ctx_args := weak_buffer.get(_QD_ARRAY):
+            launch_ctx_buffer[_QD_ARRAY] = [(arg_id, arr_ref()) for arg_id, arr_ref in launch_ctx_args]
+        if launch_ctx_args := weak_buffer.get(_QD_ARRAY_WITH_GRAD):
+            launch_ctx_buffer[_QD_ARRAY_WITH_GRAD] = [
+                (arg_id, arr_ref(), arr_grad_ref()) for arg_id, arr_ref, arr_grad_ref in launch_ctx_args
+            ]
+        return launch_ctx_buffer
+
+    def cache(self, shared_args_hash: tuple, launch_ctx_buffer: dict[KernelBatchedArgType, list[tuple]]) -> None:
+        """Stores the cacheable launch_ctx_buffer under shared_args_hash, until one of its ndarrays is collected."""
+        launch_ctx_buffers = self._launch_ctx_buffers
+
+        def _evict_callback(ref, _hash=shared_args_hash):
+            launch_ctx_buffers.pop(_hash, None)
+
+        weak_buffer = dict(launch_ctx_buffer)
+        if launch_ctx_args := launch_ctx_buffer.get(_QD_ARRAY):
+            weak_buffer[_QD_ARRAY] = [(arg_id, ReferenceType(arr, _evict_callback)) for arg_id, arr in launch_ctx_args]
+        if launch_ctx_args := launch_ctx_buffer.get(_QD_ARRAY_WITH_GRAD):
+            weak_buffer[_QD_ARRAY_WITH_GRAD] = [
+                (arg_id, ReferenceType(arr, _evict_callback), ReferenceType(arr_grad, _evict_callback))
+                for arg_id, arr, arr_grad in launch_ctx_args
+            ]
+        launch_ctx_buffers[shared_args_hash] = weak_buffer
+
+
+_shared_launch_args_cache = SharedLaunchArgsCache()
+# Stands for all template parameters in launch layouts, whose annotations are distinct objects in each kernel although
+# they do not set any kernel arg.
+_TEMPLATE_LAYOUT = "template"
+
+
+def _is_template(annotation: Any) -> bool:
+    return annotation is template or type(annotation) is template
+
+
 class ASTGenerator:
     def __init__(
         self,
@@ -323,6 +484,10 @@ class Kernel(FuncBase):
         self.autodiff_mode = autodiff_mode
         self.grad: "Kernel | None" = None
         impl.get_runtime().kernels.append(self)  # type: ignore[arg-type]
+        stats_name = f"{_func.__module__}.{_func.__qualname__}"
+        if autodiff_mode != AutodiffMode.NONE:
+            stats_name += f"[{autodiff_mode.name.lower()}]"
+        self.cache_stats = cache_stats.get_kernel_stats(stats_name)
         self.reset()
         self.kernel_cpp: None | KernelCxx = None
         # A materialized kernel is a KernelCxx object which may or may not have been compiled. It generally has been
@@ -330,6 +495,14 @@ class Kernel(FuncBase):
         self.materialized_kernels: dict[CompiledKernelKeyType, KernelCxx] = {}
         self.has_print = False
         self.use_graph: bool = False
+        # Set by `@qd.kernel(async_return=True)`. Launches then return a KernelFuture instead of the return value,
+        # without waiting for the kernel.
+        self.async_return: bool = False
+        # Set for kernels built by `qd.fuse(...)`. Adjacent top-level for-loops over the same range are then compiled
+        # into one task when no iteration depends on another one.
+        self.fuse_loops: bool = False
+        # Set by `@qd.kernel(tiered=...)`. None follows `qd.init(tiered_compilation=...)`.
+        self.tiered: bool | None = None
         # Opt-in flag set by `@qd.kernel(graph=True, checkpoints=True)`. When True, the AST transformer enables
         # `qd.checkpoint(...)` recognition AND auto-wraps every top-level for-loop that isn't already inside a `with
         # qd.checkpoint(...)` block in an implicit no-yield checkpoint. When False, any use of `qd.checkpoint(...)` in
@@ -384,12 +557,17 @@ class Kernel(FuncBase):
         self.launch_observations = LaunchObservations()
 
         self.launch_context_buffer_cache = LaunchContextBufferCache()
+        # Id of the launch layout of each key in _shared_launch_args_cache, or -1 if its buffers are not shared.
+        self._launch_layout_ids: dict[CompiledKernelKeyType, int] = {}
         self._struct_ndarray_launch_info_by_key: dict[CompiledKernelKeyType, list] = {}
         # Launch info for primitives lifted from ``@qd.data_oriented(template_primitives=False)`` template args (see
         # ``predeclare_struct_primitives``). Maps key -> list of ``(arg_id, template_arg_idx, attr_chain, kind)``.
         self._struct_primitive_launch_info_by_key: dict[CompiledKernelKeyType, list] = {}
+        # Leaf getters of the two launch infos above, built on the first launch of each key.
+        self._struct_ndarray_getters_by_key: dict[CompiledKernelKeyType, StructLeafGetters] = {}
+        self._struct_primitive_getters_by_key: dict[CompiledKernelKeyType, StructLeafGetters] = {}
         self._mutable_nd_cached_key: CompiledKernelKeyType | None = None
-        self._mutable_nd_cached_val: list = []
+        self._mutable_nd_cached_val: StructLeafGetters = []
         self._tensor_unwrap_indices: tuple[int, ...] | None = None
 
     def ast_builder(self) -> ASTBuilder:
@@ -400,6 +578,10 @@ class Kernel(FuncBase):
         self.runtime = impl.get_runtime()
         self.materialized_kernels = {}
         self.compiled_kernel_data_by_key = {}
+        # Background compiles started by compile_async, by key, until they are done.
+        self.pending_compiles: dict[CompiledKernelKeyType, concurrent.futures.Future] = {}
+        # Frozen launch contexts of the last kernel.launch_many() call, see _bound_launch.launch_many.
+        self.launch_many_cache: Any = None
         self._last_compiled_kernel_data = None
         self.src_ll_cache_observations = SrcLlCacheObservations()
         self.fe_ll_cache_observations = FeLlCacheObservations()
@@ -407,14 +589,20 @@ class Kernel(FuncBase):
     def _try_load_fastcache(self, args: tuple[Any, ...], key: "CompiledKernelKeyType") -> set[str] | None:
         frontend_cache_key: str | None = None
         if self.runtime.src_ll_cache and self.quadrants_callable and self.quadrants_callable.is_pure:
+            start = time.perf_counter()
             kernel_source_info, _src = get_source_info_and_src(self.func)
             self.fast_checksum = src_hasher.create_cache_key(
-                self.raise_on_templated_floats, kernel_source_info, args, self.arg_metas
+                self.raise_on_templated_floats, kernel_source_info, args, self.arg_metas, stats=self.cache_stats
             )
+            load_start = time.perf_counter()
+            self.cache_stats.hashing_time += load_start - start
             cache_value = None
             if self.fast_checksum:
                 self.src_ll_cache_observations.cache_key_generated = True
                 cache_value = src_hasher.load(self.fast_checksum)
+                if cache_value is None:
+                    self.cache_stats.fastcache_misses += 1
+                    self.cache_stats.load_time += time.perf_counter() - load_start
             if cache_value is not None:
                 frontend_cache_key = cache_value.frontend_cache_key
                 self.src_ll_cache_observations.cache_validated = True
@@ -426,7 +614,12 @@ class Kernel(FuncBase):
                     prog.config(),
                     prog.get_device_caps(),
                 )
-                if self.compiled_kernel_data_by_key[key]:
+                self.cache_stats.load_time += time.perf_counter() - load_start
+                if not self.compiled_kernel_data_by_key[key]:
+                    # The entry points to a kernel that is gone from the offline cache.
+                    self.cache_stats.fastcache_misses += 1
+                else:
+                    self.cache_stats.fastcache_hits += 1
                     self.src_ll_cache_observations.cache_loaded = True
                     self.used_py_dataclass_parameters_by_key_enforcing[key] = cache_value.used_py_dataclass_parameters
                     # Fast-cache restore skips AST transformation, so rebuild the AST-transformer-produced metadata from
@@ -540,12 +733,16 @@ class Kernel(FuncBase):
                 quadrants_kernel = impl.get_runtime().prog.create_kernel(
                     quadrants_ast_generator, kernel_name, self.autodiff_mode
                 )
+                quadrants_kernel.fuse_loops = self.fuse_loops
                 if _pass == 1:
                     assert key not in self.materialized_kernels
                     self.materialized_kernels[key] = quadrants_kernel
                     self._struct_ndarray_launch_info_by_key[key] = getattr(
                         ctx.global_context, "struct_ndarray_launch_info", []
                     )
+                    self._struct_ndarray_getters_by_key.pop(key, None)
+                    self._launch_layout_ids.pop(key, None)
+                    self._struct_primitive_getters_by_key.pop(key, None)
                     # Only record an entry when this key actually lifts primitives, so the dict stays empty for the
                     # overwhelming majority of kernels (none use template_primitives=False). launch_kernel can then
                     # skip the whole primitive-binding path with a single empty-dict check instead of paying a
@@ -574,6 +771,175 @@ class Kernel(FuncBase):
                     ]
                 runtime._current_global_context = None
 
+    def _get_fastcache_store_kwargs(self, key: "CompiledKernelKeyType") -> dict[str, Any]:
+        """Snapshot of what src_hasher.store records about specialization key, besides the cache keys."""
+        return dict(
+            function_source_infos=set(self.visited_functions),
+            used_py_dataclass_parameters=set(self.used_py_dataclass_parameters_by_key_enforcing[key]),
+            graph_do_while_levels=[
+                (level.cond_arg_name, level.parent_id, level.cond_cpp_arg_id) for level in self.graph_do_while_levels
+            ],
+            checkpoint_yield_on_args=list(self.checkpoint_yield_on_args),
+            checkpoint_yield_on_cpp_arg_ids=list(self.checkpoint_yield_on_cpp_arg_ids),
+            checkpoint_user_labels_by_cp_id=list(self.checkpoint_user_labels_by_cp_id),
+        )
+
+    def store_in_fastcache(self, key: "CompiledKernelKeyType", fast_checksum: str, frontend_cache_key: str) -> None:
+        """Records frontend_cache_key, the offline cache key of the compiled kernel, under fast_checksum."""
+        src_hasher.store(frontend_cache_key, fast_checksum, **self._get_fastcache_store_kwargs(key))
+        self.src_ll_cache_observations.cache_stored = True
+
+    def _record_compile_result(
+        self,
+        compile_result: CompileResult,
+        fast_checksum: str | None,
+        fastcache_store_kwargs: dict[str, Any] | None,
+    ) -> None:
+        """Bookkeeping of an optimized build returned by Program.compile_kernel (or load_cached_kernel)."""
+        src_hasher.record_kernel_key(compile_result.cache_key)
+        self.cache_stats.record_compile(compile_result.cache_hit, compile_result.compile_time)
+        if compile_result.cache_hit:
+            self.fe_ll_cache_observations.cache_hit = True
+        if fast_checksum and fastcache_store_kwargs is not None:
+            src_hasher.store(compile_result.cache_key, fast_checksum, **fastcache_store_kwargs)
+            self.src_ll_cache_observations.cache_stored = True
+
+    def _is_tiered(self) -> bool:
+        if self.autodiff_mode != AutodiffMode.NONE:
+            # Gradient kernels are compiled as usual, see Program::compile_kernel_quick.
+            return False
+        if self.tiered is not None:
+            return self.tiered
+        return impl.get_runtime().tiered_compilation
+
+    def _compile(self, key: "CompiledKernelKeyType", t_kernel: KernelCxx, prog: Program) -> CompiledKernelData:
+        """Returns the compiled kernel of specialization key, which missed compiled_kernel_data_by_key."""
+        if self.pending_compiles:
+            pending_compile = self.pending_compiles.pop(key, None)
+            if pending_compile is not None:
+                # Compiled by compile_async, still running or just done.
+                pending_compile.result()
+                compiled_kernel_data = self.compiled_kernel_data_by_key.get(key)
+                if compiled_kernel_data:
+                    return compiled_kernel_data
+        # Store Quadrants program config and device cap for efficiency because they are used at multiple places
+        prog_config = prog.config()
+        prog_device_cap = prog.get_device_caps()
+
+        fast_checksum = self.fast_checksum
+        fastcache_store_kwargs = self._get_fastcache_store_kwargs(key) if fast_checksum else None
+        if self._is_tiered():
+            compile_result = prog.load_cached_kernel(prog_config, prog_device_cap, t_kernel)
+            if compile_result is None:
+                # Launch a quick build now, and swap in the optimized build once the background thread is done with
+                # it. Set here, rather than after the launch by __call__, so the swap cannot be undone.
+                compiled_kernel_data = prog.compile_kernel_quick(prog_config, prog_device_cap, t_kernel)
+                self.compiled_kernel_data_by_key[key] = compiled_kernel_data
+                _tiered_compilation.enqueue(self, key, t_kernel, fast_checksum, fastcache_store_kwargs)
+                return compiled_kernel_data
+        else:
+            compile_result = prog.compile_kernel(prog_config, prog_device_cap, t_kernel)
+        self._record_compile_result(compile_result, fast_checksum, fastcache_store_kwargs)
+        return compile_result.compiled_kernel_data
+
+    def _set_launch_ctx_args(
+        self,
+        key: "CompiledKernelKeyType",
+        args: tuple[Any, ...],
+        launch_ctx: KernelLaunchContext,
+        callbacks: list[Callable[[], None]],
+        arg_index_by_param: dict[int, int] | None = None,
+    ) -> tuple[dict[KernelBatchedArgType, list[tuple]], bool]:
+        """Sets args on launch_ctx. Returns the batched args, and whether launch_ctx can be cached (see launch_kernel).
+
+        If given, arg_index_by_param is filled with the index of the first kernel arg of each non-template parameter.
+        """
+        launch_ctx_buffer: dict[KernelBatchedArgType, list[tuple]] = defaultdict(list)
+        actual_argument_slot = 0
+        is_launch_ctx_cacheable = True
+        template_num = 0
+        i_out = 0
+        # `checkpoint_yield_on_cpp_arg_ids` is populated at AST-build time (see
+        # `CheckpointTransformer.build_checkpoint_with`); no per-arg name match is needed here. The launch path
+        # below forwards the table to the launch context with a single `forward_yield_on_table_to_ctx` call.
+        for i_in, val in enumerate(args):
+            needed_ = self.arg_metas[i_in].annotation
+            if needed_ is template or type(needed_) is template:
+                template_num += 1
+                i_out += 1
+                continue
+            # FIXME: This shortcut skips _recursive_set_args() solely when val._qd_all_field is true and the annotation is
+            # a dataclass, but _recursive_set_args() is where the strict provided_arg_type-is-needed_arg_type check lives.
+            # As a result, once an instance has _qd_all_field=True, passing it to a kernel parameter annotated with a
+            # different all-Field dataclass type can be silently accepted instead of raising the previous runtime type error,
+            # which weakens API/type safety and can route the wrong struct type through launch.
+            if getattr(val, "_qd_all_field", False) and getattr(needed_, _FIELDS, None) is not None:
+                continue
+            # `graph_do_while_levels[*].cond_cpp_arg_id` is also populated at AST-build time (see
+            # `ASTTransformer.build_While` -> `_resolve_ndarray_kernel_arg_id`), so the launch path forwards it
+            # directly below without per-arg name matching here. This uniformly handles bare parameter conditions
+            # (`qd.graph_do_while(counter)`) and `@qd.data_oriented` member conditions
+            # (`qd.graph_do_while(self.counter)`).
+            if arg_index_by_param is not None:
+                arg_index_by_param[i_in] = i_out - template_num
+            num_args_, is_launch_ctx_cacheable_ = self._recursive_set_args(
+                self.used_py_dataclass_parameters_by_key_enforcing[key],
+                self.arg_metas[i_in].name,
+                launch_ctx,
+                launch_ctx_buffer,
+                needed_,
+                type(val),
+                val,
+                i_out - template_num,
+                actual_argument_slot,
+                callbacks,
+            )
+            i_out += num_args_
+            is_launch_ctx_cacheable &= is_launch_ctx_cacheable_
+
+        struct_nd_info = self._struct_ndarray_launch_info_by_key.get(key)
+        if struct_nd_info:
+            struct_nd_getters = self._struct_ndarray_getters_by_key.get(key)
+            if struct_nd_getters is None:
+                struct_nd_getters = self._struct_ndarray_getters_by_key[key] = _make_struct_leaf_getters(struct_nd_info)
+            self._set_struct_ndarray_args(struct_nd_getters, args, launch_ctx_buffer, is_launch_ctx_cacheable)
+
+        # Empty for every kernel that doesn't use template_primitives=False (the common case), so this guard
+        # short-circuits without hashing ``key`` -- keeping the per-launch hot path free of added overhead.
+        if self._struct_primitive_launch_info_by_key:
+            struct_prim_info = self._struct_primitive_launch_info_by_key.get(key)
+            if struct_prim_info:
+                struct_prim_getters = self._struct_primitive_getters_by_key.get(key)
+                if struct_prim_getters is None:
+                    struct_prim_getters = _make_struct_leaf_getters(struct_prim_info)
+                    self._struct_primitive_getters_by_key[key] = struct_prim_getters
+                self._set_struct_primitive_args(struct_prim_getters, args, launch_ctx_buffer)
+                # Lifted primitives are read fresh from the live object on every launch (that is the whole point),
+                # so the prepared launch context must not be cached under ``args_hash`` (the hash keys on object
+                # id, not primitive value, so a cached context would serve stale values when the user mutates the
+                # member). Marking it non-cacheable keeps this kernel correct at the cost of rebuilding each launch.
+                is_launch_ctx_cacheable = False
+
+        self.launch_stats = _make_launch_stats(launch_ctx_buffer)
+
+        _set_launch_ctx_buffer_args(launch_ctx, launch_ctx_buffer)
+        return launch_ctx_buffer, is_launch_ctx_cacheable
+
+    def _launch_layout(self, key: "CompiledKernelKeyType") -> tuple:
+        """Returns everything but the args themselves that _set_launch_ctx_args depends on for key.
+
+        Kernels with equal launch layouts set the very same launch context args from the same Python args, so that they
+        can share the launch context buffers built for one another (see SharedLaunchArgsCache).
+        """
+        return (
+            tuple(
+                (arg_meta.name, _TEMPLATE_LAYOUT if _is_template(arg_meta.annotation) else arg_meta.annotation)
+                for arg_meta in self.arg_metas
+            ),
+            frozenset(self.used_py_dataclass_parameters_by_key_enforcing[key]),
+            tuple(self._struct_ndarray_launch_info_by_key.get(key) or ()),
+        )
+
     def launch_kernel(
         self,
         key,
@@ -585,6 +951,9 @@ class Kernel(FuncBase):
     ) -> Any:
         assert len(args) == len(self.arg_metas), f"{len(self.arg_metas)} arguments needed but {len(args)} provided"
 
+        timer = _launch_overhead.recorder
+        if timer is not None:
+            t_hash = perf_counter_ns()
         callbacks: list[Callable[[], None]] = []
         launch_ctx = t_kernel.make_launch_context()
         # Special treatment for primitive types is unecessary and detrimental. See 'TemplateMapper.lookup' for details.
@@ -609,11 +978,9 @@ class Kernel(FuncBase):
             if self._struct_ndarray_launch_info_by_key:
                 struct_nd_info = self._struct_ndarray_launch_info_by_key.get(key)
                 if struct_nd_info:
-                    self._mutable_nd_cached_val = [
-                        (idx, chain)
-                        for _, idx, chain in struct_nd_info
-                        if chain_has_mutable_container(args, idx, chain)
-                    ]
+                    self._mutable_nd_cached_val = _make_struct_leaf_getters(
+                        [entry for entry in struct_nd_info if chain_has_mutable_container(args, entry[1], entry[2])]
+                    )
                 else:
                     self._mutable_nd_cached_val = []
             else:
@@ -622,119 +989,52 @@ class Kernel(FuncBase):
         if self._mutable_nd_cached_val:
             args_hash = (
                 *args_hash,
-                *(id(self._resolve_struct_ndarray(args, idx, chain)) for idx, chain in self._mutable_nd_cached_val),
+                *[
+                    id(leaf._unwrap() if type(leaf) in _TENSOR_WRAPPER_TYPES else leaf)
+                    for idx, get_leaves, _ in self._mutable_nd_cached_val
+                    for leaf in get_leaves(args[idx])
+                ],
             )
+        if timer is not None:
+            t_ctx = perf_counter_ns()
         if not self.launch_context_buffer_cache.populate_launch_ctx_from_cache(args_hash, launch_ctx):
-            launch_ctx_buffer: dict[KernelBatchedArgType, list[tuple]] = defaultdict(list)
-            actual_argument_slot = 0
-            is_launch_ctx_cacheable = True
-            template_num = 0
-            i_out = 0
-            # `checkpoint_yield_on_cpp_arg_ids` is populated at AST-build time (see
-            # `CheckpointTransformer.build_checkpoint_with`); no per-arg name match is needed here. The launch path
-            # below forwards the table to the launch context with a single `forward_yield_on_table_to_ctx` call.
-            for i_in, val in enumerate(args):
-                needed_ = self.arg_metas[i_in].annotation
-                if needed_ is template or type(needed_) is template:
-                    template_num += 1
-                    i_out += 1
-                    continue
-                # FIXME: This shortcut skips _recursive_set_args() solely when val._qd_all_field is true and the annotation is
-                # a dataclass, but _recursive_set_args() is where the strict provided_arg_type-is-needed_arg_type check lives.
-                # As a result, once an instance has _qd_all_field=True, passing it to a kernel parameter annotated with a
-                # different all-Field dataclass type can be silently accepted instead of raising the previous runtime type error,
-                # which weakens API/type safety and can route the wrong struct type through launch.
-                if getattr(val, "_qd_all_field", False) and getattr(needed_, _FIELDS, None) is not None:
-                    continue
-                # `graph_do_while_levels[*].cond_cpp_arg_id` is also populated at AST-build time (see
-                # `ASTTransformer.build_While` -> `_resolve_ndarray_kernel_arg_id`), so the launch path forwards it
-                # directly below without per-arg name matching here. This uniformly handles bare parameter conditions
-                # (`qd.graph_do_while(counter)`) and `@qd.data_oriented` member conditions
-                # (`qd.graph_do_while(self.counter)`).
-                num_args_, is_launch_ctx_cacheable_ = self._recursive_set_args(
-                    self.used_py_dataclass_parameters_by_key_enforcing[key],
-                    self.arg_metas[i_in].name,
-                    launch_ctx,
-                    launch_ctx_buffer,
-                    needed_,
-                    type(val),
-                    val,
-                    i_out - template_num,
-                    actual_argument_slot,
-                    callbacks,
+            # Another kernel with the same launch layout may have walked these very args already.
+            layout_id = self._launch_layout_ids.get(key)
+            if layout_id is None:
+                layout_id = self._launch_layout_ids[key] = _shared_launch_args_cache.get_layout_id(
+                    self._launch_layout(key)
                 )
-                i_out += num_args_
-                is_launch_ctx_cacheable &= is_launch_ctx_cacheable_
-
-            struct_nd_info = self._struct_ndarray_launch_info_by_key.get(key)
-            if struct_nd_info:
-                self._set_struct_ndarray_args(struct_nd_info, args, launch_ctx_buffer, is_launch_ctx_cacheable)
-
-            # Empty for every kernel that doesn't use template_primitives=False (the common case), so this guard
-            # short-circuits without hashing ``key`` -- keeping the per-launch hot path free of added overhead.
-            if self._struct_primitive_launch_info_by_key:
-                struct_prim_info = self._struct_primitive_launch_info_by_key.get(key)
-                if struct_prim_info:
-                    self._set_struct_primitive_args(struct_prim_info, args, launch_ctx_buffer)
-                    # Lifted primitives are read fresh from the live object on every launch (that is the whole point),
-                    # so the prepared launch context must not be cached under ``args_hash`` (the hash keys on object
-                    # id, not primitive value, so a cached context would serve stale values when the user mutates the
-                    # member). Marking it non-cacheable keeps this kernel correct at the cost of rebuilding each launch.
-                    is_launch_ctx_cacheable = False
-
-            kernel_args_count_by_type = defaultdict(int)
-            kernel_args_count_by_type.update(
-                {key: len(launch_ctx_args) for key, launch_ctx_args in launch_ctx_buffer.items()}
-            )
-            self.launch_stats = LaunchStats(kernel_args_count_by_type=kernel_args_count_by_type)
-
-            # All arguments to context in batches to mitigate overhead of calling Python bindings repeatedly.
-            # This is essential because calling any pybind11 function is adding ~180ns penalty no matter what.
-            # Note that we are allowed to do this because Quadrants Launch Kernel context is storing the input
-            # arguments in an unordered list. The actual runtime (gfx, llvm...) will later query this context
-            # in correct order.
-            if launch_ctx_args := launch_ctx_buffer.get(_FLOAT):
-                launch_ctx.set_args_float(*zip(*launch_ctx_args))  # type: ignore
-            if launch_ctx_args := launch_ctx_buffer.get(_INT):
-                launch_ctx.set_args_int(*zip(*launch_ctx_args))  # type: ignore
-            if launch_ctx_args := launch_ctx_buffer.get(_UINT):
-                launch_ctx.set_args_uint(*zip(*launch_ctx_args))  # type: ignore
-            if launch_ctx_args := launch_ctx_buffer.get(_QD_ARRAY):
-                launch_ctx.set_args_ndarray(*zip(*launch_ctx_args))  # type: ignore
-            if launch_ctx_args := launch_ctx_buffer.get(_QD_ARRAY_WITH_GRAD):
-                launch_ctx.set_args_ndarray_with_grad(*zip(*launch_ctx_args))  # type: ignore
-
+            launch_ctx_buffer = None
+            if layout_id >= 0:
+                shared_args_hash = (layout_id, *args_hash[1:])
+                launch_ctx_buffer = _shared_launch_args_cache.get(shared_args_hash)
+            if launch_ctx_buffer is not None:
+                self.launch_stats = _make_launch_stats(launch_ctx_buffer)
+                _set_launch_ctx_buffer_args(launch_ctx, launch_ctx_buffer)
+                is_launch_ctx_cacheable = True
+            else:
+                launch_ctx_buffer, is_launch_ctx_cacheable = self._set_launch_ctx_args(key, args, launch_ctx, callbacks)
+                if layout_id >= 0:
+                    if is_launch_ctx_cacheable:
+                        _shared_launch_args_cache.cache(shared_args_hash, launch_ctx_buffer)
+                    else:
+                        # Typically float args, which make every launch uncacheable: spare them the shared lookup.
+                        self._launch_layout_ids[key] = -1
             if is_launch_ctx_cacheable and args_hash is not None:
                 self.launch_context_buffer_cache.cache(t_kernel, args_hash, launch_ctx, launch_ctx_buffer)
+        if timer is not None:
+            t_compile = t_compiled = perf_counter_ns()
 
         try:
             prog = impl.get_runtime().prog
             if not compiled_kernel_data:
-                # Store Quadrants program config and device cap for efficiency because they are used at multiple places
-                prog_config = prog.config()
-                prog_device_cap = prog.get_device_caps()
-
-                compile_result: CompileResult = prog.compile_kernel(prog_config, prog_device_cap, t_kernel)
-                compiled_kernel_data = compile_result.compiled_kernel_data
-                if compile_result.cache_hit:
-                    self.fe_ll_cache_observations.cache_hit = True
-                if self.fast_checksum:
-                    src_hasher.store(
-                        compile_result.cache_key,
-                        self.fast_checksum,
-                        self.visited_functions,
-                        self.used_py_dataclass_parameters_by_key_enforcing[key],
-                        graph_do_while_levels=[  # type: ignore[reportCallIssue]
-                            (level.cond_arg_name, level.parent_id, level.cond_cpp_arg_id)
-                            for level in self.graph_do_while_levels
-                        ],
-                        checkpoint_yield_on_args=list(self.checkpoint_yield_on_args),
-                        checkpoint_yield_on_cpp_arg_ids=list(self.checkpoint_yield_on_cpp_arg_ids),
-                        checkpoint_user_labels_by_cp_id=list(self.checkpoint_user_labels_by_cp_id),
-                    )
-                    self.src_ll_cache_observations.cache_stored = True
+                compiled_kernel_data = self._compile(key, t_kernel, prog)
+                if timer is not None:
+                    t_compiled = perf_counter_ns()
             self._last_compiled_kernel_data = compiled_kernel_data
             launch_ctx.use_graph = self.use_graph and _GRAPH_ENABLED
+            if self.async_return:
+                launch_ctx.async_result = True
             if self.use_graph and qd_stream is not None:
                 raise RuntimeError(
                     "qd_stream is not compatible with graph=True kernels. "
@@ -759,11 +1059,21 @@ class Kernel(FuncBase):
             stream_handle = qd_stream.handle if qd_stream is not None else 0
             if stream_handle:
                 prog.set_current_cuda_stream(stream_handle)
+            if timer is not None:
+                t_launch = perf_counter_ns()
             try:
                 prog.launch_kernel(compiled_kernel_data, launch_ctx)
             finally:
                 if stream_handle:
                     prog.set_current_cuda_stream(0)
+            if timer is not None:
+                timer.record_launch(
+                    self.cache_stats.name,
+                    args_hashing_ns=t_ctx - t_hash,
+                    launch_ctx_ns=t_compile - t_ctx,
+                    compile_ns=t_compiled - t_compile,
+                    cpp_launch_ns=perf_counter_ns() - t_launch,
+                )
         except Exception as e:
             e = handle_exception_from_cpp(e)
             if impl.get_runtime().print_full_traceback:
@@ -774,13 +1084,16 @@ class Kernel(FuncBase):
             callback()
 
         return_type = self.return_type
-        if return_type or self.has_print:
+        if self.has_print or (return_type and not self.async_return):
             if qd_stream is not None and self.has_print and not return_type:
                 qd_stream.synchronize()
             runtime_ops.sync()
 
         if not return_type:
             return None
+        if self.async_return:
+            # The results are read back, waiting for the kernel, by KernelFuture.result().
+            return KernelFuture(self, launch_ctx)
         if len(return_type) == 1:
             return self.construct_kernel_ret(launch_ctx, return_type[0], (0,))
         return tuple([self.construct_kernel_ret(launch_ctx, ret_type, (i,)) for i, ret_type in enumerate(return_type)])
@@ -796,19 +1109,9 @@ class Kernel(FuncBase):
             return launch_ctx.get_struct_ret_float(indices)
         raise QuadrantsRuntimeTypeError(f"Invalid return type on index={indices}")
 
-    @staticmethod
-    def _resolve_struct_ndarray(args, template_arg_idx, attr_chain):
-        """Walk a struct's attribute chain to find the live ndarray (or Tensor wrapper)."""
-        obj = args[template_arg_idx]
-        for attr_name in attr_chain:
-            obj = getattr(obj, attr_name)
-        if type(obj) in _TENSOR_WRAPPER_TYPES:
-            obj = obj._unwrap()
-        return obj
-
     @staticmethod
     def _set_struct_ndarray_args(
-        launch_info: list,
+        getters: StructLeafGetters,
         args: tuple,
         launch_ctx_buffer: dict,
         is_launch_ctx_cacheable: bool,
@@ -816,23 +1119,21 @@ class Kernel(FuncBase):
         """Set ndarray kernel args that were pre-declared from struct template fields during compilation."""
         from quadrants.lang._ndarray import Ndarray  # pylint: disable=C0415
 
-        for arg_id, template_arg_idx, attr_chain in launch_info:
-            obj = args[template_arg_idx]
-            for attr_name in attr_chain:
-                obj = getattr(obj, attr_name)
-            if type(obj) in _TENSOR_WRAPPER_TYPES:
-                obj = obj._unwrap()
-            assert isinstance(obj, Ndarray), f"Expected Ndarray at {attr_chain}, got {type(obj)}"
-            v_primal = obj.arr
-            v_grad = obj.grad.arr if obj.grad else None
-            if v_grad is None:
-                launch_ctx_buffer[_QD_ARRAY].append((arg_id, v_primal))
-            else:
-                launch_ctx_buffer[_QD_ARRAY_WITH_GRAD].append((arg_id, v_primal, v_grad))
+        for template_arg_idx, get_leaves, launch_info in getters:
+            for (arg_id, _, attr_chain), obj in zip(launch_info, get_leaves(args[template_arg_idx])):
+                if type(obj) in _TENSOR_WRAPPER_TYPES:
+                    obj = obj._unwrap()
+                assert isinstance(obj, Ndarray), f"Expected Ndarray at {attr_chain}, got {type(obj)}"
+                v_primal = obj.arr
+                v_grad = obj.grad.arr if obj.grad else None
+                if v_grad is None:
+                    launch_ctx_buffer[_QD_ARRAY].append((arg_id, v_primal))
+                else:
+                    launch_ctx_buffer[_QD_ARRAY_WITH_GRAD].append((arg_id, v_primal, v_grad))
 
     @staticmethod
     def _set_struct_primitive_args(
-        launch_info: list,
+        getters: StructLeafGetters,
         args: tuple,
         launch_ctx_buffer: dict,
     ) -> None:
@@ -844,24 +1145,23 @@ class Kernel(FuncBase):
         arg that was lifted as an integer would silently truncate (``int(1.5) == 1``), so that one lossy direction is
         rejected here rather than corrupting the value; the lossless directions (``int``/``bool`` -> float, and
         ``bool`` <-> ``int``) still coerce, matching typed-scalar-arg semantics."""
-        for arg_id, template_arg_idx, attr_chain, kind in launch_info:
-            obj = args[template_arg_idx]
-            for attr_name in attr_chain:
-                obj = getattr(obj, attr_name)
-            if kind == "f":
-                launch_ctx_buffer[_FLOAT].append((arg_id, float(obj)))
-            else:
-                if type(obj) is float:
-                    raise TypeError(
-                        f"Primitive member '{'.'.join(attr_chain)}' of a @qd.data_oriented(template_primitives=False) "
-                        f"object was lifted as an integer kernel argument (its type at first compile), but is now a "
-                        f"float ({obj!r}); coercing it would truncate. Keep the member's type stable across launches, "
-                        f"or use the default template_primitives=True to re-specialise the kernel per type."
-                    )
-                if kind == "u":
-                    launch_ctx_buffer[_UINT].append((arg_id, int(obj)))
+        for template_arg_idx, get_leaves, launch_info in getters:
+            for (arg_id, _, attr_chain, kind), obj in zip(launch_info, get_leaves(args[template_arg_idx])):
+                if kind == "f":
+                    launch_ctx_buffer[_FLOAT].append((arg_id, float(obj)))
                 else:
-                    launch_ctx_buffer[_INT].append((arg_id, int(obj)))
+                    if type(obj) is float:
+                        raise TypeError(
+                            f"Primitive member '{'.'.join(attr_chain)}' of a @qd.data_oriented("
+                            f"template_primitives=False) object was lifted as an integer kernel argument (its type at "
+                            f"first compile), but is now a float ({obj!r}); coercing it would truncate. Keep the "
+                            f"member's type stable across launches, or use the default template_primitives=True to "
+                            f"re-specialise the kernel per type."
+                        )
+                    if kind == "u":
+                        launch_ctx_buffer[_UINT].append((arg_id, int(obj)))
+                    else:
+                        launch_ctx_buffer[_INT].append((arg_id, int(obj)))
 
     def ensure_compiled(self, *py_args: tuple[Any, ...]) -> tuple[Callable, int, AutodiffMode]:
         try:
@@ -905,11 +1205,18 @@ class Kernel(FuncBase):
                 "context, or omit qd_stream."
             )
         if impl.get_runtime()._arch == _ARCH_PYTHON:
+            if self.async_return:
+                return KernelFuture.resolved(self.func(*py_args, **kwargs))
             return self.func(*py_args, **kwargs)
+        timer = _launch_overhead.recorder
+        if timer is not None:
+            t_start = perf_counter_ns()
         config = impl.current_cfg()
 
         self.raise_on_templated_floats = config.raise_on_templated_floats
         py_args = self.fuse_args(is_func=False, is_pyfunc=False, py_args=py_args, kwargs=kwargs, global_context=None)
+        if timer is not None:
+            t_unwrap = perf_counter_ns()
         # Tensor-wrapper unwrap (stork-17). Canonicalize ``qd.Tensor`` slots, plus wrapper positions discovered on
         # the first launch, before the autograd tape and identity-keyed caches observe the arg tuple.
         #
@@ -939,6 +1246,8 @@ class Kernel(FuncBase):
                         py_args_l[i] = _arg._impl
                 if py_args_l is not None:
                     py_args = tuple(py_args_l)
+        if timer is not None:
+            t_unwrapped = perf_counter_ns()
 
         # Transform the primal kernel to forward mode grad kernel
         # then recover to primal when exiting the forward mode manager
@@ -958,7 +1267,11 @@ class Kernel(FuncBase):
         if self.autodiff_mode != _NONE and impl.current_cfg().opt_level == 0:
             _logging.warn("""opt_level = 1 is enforced to enable gradient computation.""")
             impl.current_cfg().opt_level = 1
+        if timer is not None:
+            t_mapping = perf_counter_ns()
         key = self.ensure_compiled(*py_args)  # type: ignore[arg-type]
+        if timer is not None:
+            template_mapping_ns = perf_counter_ns() - t_mapping
         self._last_launch_key = key
         kernel_cpp = self.materialized_kernels[key]
         compiled_kernel_data = self.compiled_kernel_data_by_key.get(key, None)
@@ -969,9 +1282,17 @@ class Kernel(FuncBase):
         # on field-CPU benchmarks; every Python-frame nanosecond here shows up as 1-4% on small envs).
         if not self.use_checkpoints:
             ret = self.launch_kernel(key, kernel_cpp, compiled_kernel_data, *py_args, qd_stream=qd_stream)
-            if compiled_kernel_data is None:
+            if compiled_kernel_data is None and not self.compiled_kernel_data_by_key.get(key):
                 assert self._last_compiled_kernel_data is not None
                 self.compiled_kernel_data_by_key[key] = self._last_compiled_kernel_data
+            if timer is not None:
+                timer.record_call(
+                    self.cache_stats.name,
+                    fuse_args_ns=t_unwrap - t_start,
+                    tensor_unwrap_ns=t_unwrapped - t_unwrap,
+                    template_mapping_ns=template_mapping_ns,
+                    total_ns=perf_counter_ns() - t_start,
+                )
             return ret
         # Checkpoint-enabled slow path: translate the user-supplied `from_checkpoint=` label into the dense,
         # source-order internal cp_id the runtime uses. Translation happens here (after `ensure_compiled`) because
@@ -1001,9 +1322,17 @@ class Kernel(FuncBase):
                 qd_stream=qd_stream,
                 _resume_from_checkpoint=_resume_from_checkpoint,
             )
-        if compiled_kernel_data is None:
+        if compiled_kernel_data is None and not self.compiled_kernel_data_by_key.get(key):
             assert self._last_compiled_kernel_data is not None
             self.compiled_kernel_data_by_key[key] = self._last_compiled_kernel_data
+        if timer is not None:
+            timer.record_call(
+                self.cache_stats.name,
+                fuse_args_ns=t_unwrap - t_start,
+                tensor_unwrap_ns=t_unwrapped - t_unwrap,
+                template_mapping_ns=template_mapping_ns,
+                total_ns=perf_counter_ns() - t_start,
+            )
         # Surface a GraphStatus for kernels with `qd.checkpoint(yield_on=...)` so the host can drive the qipc-style
         # re-entrant loop. Kernels without yield-capable checkpoints get `ret` (typically `None`) passed through;
         # short-circuit the helper call so the hot non-checkpoint path doesn't even enter the Python frame.
@@ -3,7 +3,7 @@ import re
 import sys
 import typing
 from functools import update_wrapper, wraps
-from typing import Any, Callable, TypeVar, cast, overload
+from typing import Any, Callable, Iterable, TypeVar, cast, overload
 
 from quadrants.lang import impl
 from quadrants.lang.exception import (
@@ -159,6 +159,8 @@ def _kernel_impl(
     verbose: bool = False,
     graph: bool = False,
     checkpoints: bool = False,
+    tiered: bool | None = None,
+    async_return: bool = False,
 ) -> QuadrantsCallable:
     # Can decorators determine if a function is being defined inside a class?
     # https://stackoverflow.com/a/8793684/12003165
@@ -170,6 +172,8 @@ def _kernel_impl(
     adjoint = Kernel(_func, autodiff_mode=_REVERSE, _is_classkernel=is_classkernel)
     primal.use_graph = graph
     primal.use_checkpoints = checkpoints
+    primal.tiered = tiered
+    primal.async_return = async_return
     adjoint.use_checkpoints = checkpoints
     # Having |primal| contains |grad| makes the tape work.
     primal.grad = adjoint
@@ -234,6 +238,8 @@ def kernel(
     fastcache: bool = False,
     graph: bool = False,
     checkpoints: bool = False,
+    tiered: bool | None = None,
+    async_return: bool = False,
 ):
     """
     Marks a function as a Quadrants kernel.
@@ -254,6 +260,14 @@ def kernel(
             ``with qd.checkpoint(cp_id, yield_on=flag):`` blocks in the kernel body become pause points the host can
             resume from via ``kernel.resume(from_checkpoint=cp_id)``. Requires ``graph=True``.
             ``qd.checkpoint(...)`` in the body is rejected unless this flag is set.
+        tiered: If True, on a cache miss the kernel is first launched with a quickly compiled, barely optimized
+            build, while its optimized build is compiled in a background thread and swapped in once ready. If False,
+            the kernel is always compiled fully optimized before its first launch. Defaults to
+            ``qd.init(tiered_compilation=...)``. Gradient kernels are never tiered.
+        async_return: If True, a launch returns a ``KernelFuture`` instead of the return value of the kernel, without
+            waiting for the kernel to finish. On CUDA, the results stay on the device until ``future.result()`` reads
+            them back, so that many launches can be enqueued before reading back e.g. metrics. Kernels that return
+            nothing are not affected.
 
     Example::
 
@@ -278,7 +292,14 @@ def kernel(
                 f"@qd.kernel({fn.__name__!r}, checkpoints=True) requires graph=True; "
                 "the checkpoint resume model is only meaningful for graph kernels."
             )
-        wrapped = _kernel_impl(fn, level_of_class_stackframe=level, graph=graph, checkpoints=checkpoints)
+        wrapped = _kernel_impl(
+            fn,
+            level_of_class_stackframe=level,
+            graph=graph,
+            checkpoints=checkpoints,
+            tiered=tiered,
+            async_return=async_return,
+        )
         wrapped.is_pure = pure is not None and pure or fastcache
         if pure is not None:
             warnings_helper.warn_once(
@@ -319,6 +340,28 @@ class _BoundedDifferentiableMethod:
         assert self._adjoint is not None
         return self._adjoint(self._kernel_owner, *args, **kwargs)
 
+    def bind(self, *args, mutable: Iterable[str] = ()):
+        """Bound-method form of `QuadrantsCallable.bind` (see that docstring)."""
+        from ._bound_launch import bind  # pylint: disable=import-outside-toplevel
+
+        return bind(self, args, mutable)
+
+    def launch_many(self, arg_tuples: Iterable[tuple], qd_stream=None) -> None:
+        """Bound-method form of `QuadrantsCallable.launch_many` (see that docstring)."""
+        from ._bound_launch import (  # pylint: disable=import-outside-toplevel
+            launch_many,
+        )
+
+        launch_many(self, arg_tuples, qd_stream)
+
+    def compile_async(self, *args):
+        """Bound-method form of `QuadrantsCallable.compile_async` (see that docstring)."""
+        from ._precompile import (  # pylint: disable=import-outside-toplevel
+            compile_async,
+        )
+
+        return compile_async(self, args)
+
 
 def data_oriented(cls=None, *, template_primitives: bool = True):
     """Marks a class as Quadrants compatible.
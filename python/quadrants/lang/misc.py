@@ -362,6 +362,11 @@ def init(
     require_version: str | None = None,
     print_non_pure: bool = False,
     src_ll_cache: bool = True,
+    src_ll_cache_max_bytes: int = 0,
+    src_ll_cache_max_entries: int = 0,
+    src_ll_cache_backend: str = "files",
+    src_ll_cache_async_store: bool = False,
+    tiered_compilation: bool = False,
     **kwargs,
 ):
     """Initializes the Quadrants runtime.
@@ -379,6 +384,18 @@ def init(
         src_ll_cache: enable SRC-LL-CACHE, which will accelerate loading from cache, across all architectures,
                       for pure kernels (i.e. kernels declared with @qd.kernel(fastcache=True), or the deprecated
                       @qd.kernel(pure=True))
+        src_ll_cache_max_bytes: size budget, in bytes, of the SRC-LL-CACHE folder. Once exceeded, the least recently
+                      used entries are evicted in a background thread. 0 (the default) means unlimited.
+        src_ll_cache_max_entries: same as src_ll_cache_max_bytes, but budgets the number of entries instead.
+        src_ll_cache_backend: on-disk layout of the SRC-LL-CACHE. "files" (the default) stores one file per entry.
+                      "packed" appends all entries to a single memory-mapped pack file, which avoids one file open per
+                      kernel at startup. The LRU budgets above only apply to "files".
+        src_ll_cache_async_store: write new SRC-LL-CACHE entries from a background thread, in batches, rather than
+                      on the first launch of each kernel. Call qd.sync_cache() to wait for pending writes; they are
+                      also flushed on qd.reset() and at exit.
+        tiered_compilation: on a cache miss, launch a quickly compiled, barely optimized build of each kernel
+                      first, while the optimized build is compiled in a background thread and swapped in once ready.
+                      Can be overridden per kernel with @qd.kernel(tiered=...).
         **kwargs: Quadrants provides highly customizable compilation through
             ``kwargs``, which allows for fine grained control of Quadrants compiler
             behavior. Below we list some of the most frequently used ones. For a
@@ -401,6 +418,8 @@ def init(
     if require_version is not None:
         check_require_version(require_version)
 
+    if src_ll_cache_backend not in ("files", "packed"):
+        raise ValueError(f'Invalid src_ll_cache_backend={src_ll_cache_backend!r}, should be "files" or "packed"')
     if "default_up" in kwargs:
         raise KeyError("'default_up' is always the unsigned type of 'default_ip'. Please set 'default_ip' instead.")
     # Make a deepcopy in case these args reference to items from qd.cfg, which are
@@ -487,6 +506,11 @@ def init(
         runtime.print_full_traceback = spec_cfg.print_full_traceback
         runtime.unrolling_limit = spec_cfg.unrolling_limit
         runtime.src_ll_cache = src_ll_cache
+        runtime.src_ll_cache_max_bytes = src_ll_cache_max_bytes
+        runtime.src_ll_cache_max_entries = src_ll_cache_max_entries
+        runtime.src_ll_cache_backend = src_ll_cache_backend
+        runtime.src_ll_cache_async_store = src_ll_cache_async_store
+        runtime.tiered_compilation = tiered_compilation
         runtime.print_non_pure = print_non_pure
         _logging.set_logging_level(spec_cfg.log_level.lower())
 
@@ -682,6 +706,7 @@ def loop_config(
     block_dim_adaptive=True,
     bit_vectorize=False,
     name=None,
+    fuse=True,
 ):
     """Sets directives for the next loop
 
@@ -692,6 +717,8 @@ def loop_config(
         block_dim_adaptive (bool): Whether to allow backends set block_dim adaptively, enabled by default
         bit_vectorize (bool): Whether to enable bit vectorization of struct fors on quant_arrays.
         name (str): Optional name for this loop, used in GPU kernel names for profiling and debugging.
+        fuse (bool): Whether the loop may be fused with an adjacent top-level loop over the same range, enabled by
+            default. See the `fuse_loops` option of `qd.init`.
 
     Examples::
 
@@ -750,6 +777,9 @@ def loop_config(
     if name is not None:
         get_runtime().compiling_callable.ast_builder().set_loop_name(name)
 
+    if not fuse:
+        get_runtime().compiling_callable.ast_builder().set_fusable(False)
+
 
 def graph_do_while(condition) -> bool:
     """Marks a while loop as a CUDA graph do-while conditional node.
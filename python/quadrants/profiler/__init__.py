@@ -2,5 +2,6 @@
 
 from quadrants.profiler.kernel_metrics import *
 from quadrants.profiler.kernel_profiler import *
+from quadrants.profiler.launch_overhead import *
 from quadrants.profiler.memory_profiler import *
 from quadrants.profiler.scoped_profiler import *
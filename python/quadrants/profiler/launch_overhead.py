@@ -0,0 +1,34 @@
+# type: ignore
+
+import contextlib
+
+from quadrants.lang import _launch_overhead
+from quadrants.lang._launch_overhead import LaunchOverheadRecorder
+
+
+@contextlib.contextmanager
+def launch_overhead():
+    """Records the host time spent in each phase of every kernel launch within the context.
+
+    Yields a recorder, whose ``kernels`` attribute maps each kernel name to the time its launches spent, in
+    nanoseconds, in argument fusing, tensor unwrapping, template mapping, argument hashing, launch context cache
+    lookup or population, compilation and the C++ launch itself. ``table()`` returns the mean per launch, as text.
+
+    Outside of the context, launches are not timed.
+
+    Example::
+
+            >>> with qd.profiler.launch_overhead() as overhead:
+            >>>     for _ in range(1000):
+            >>>         step(state, dt)
+            >>> overhead.print_info()
+    """
+    recorder = LaunchOverheadRecorder()
+    previous = _launch_overhead.set_recorder(recorder)
+    try:
+        yield recorder
+    finally:
+        _launch_overhead.set_recorder(previous)
+
+
+__all__ = ["launch_overhead"]
@@ -5,8 +5,10 @@
 - `image` submodule for image io.
 - `video` submodule for exporting results to video files.
 - `diagnose` submodule for printing system environment information.
+- `fastcache` submodule for reporting and trimming the on-disk fastcache.
 """
 
 from quadrants.tools.diagnose import *
+from quadrants.tools.fastcache import *
 from quadrants.tools.np2ply import *
 from quadrants.tools.vtk import *
@@ -0,0 +1,91 @@
+# type: ignore
+
+"""Inspect and trim the on-disk fastcache (SRC-LL-CACHE) folder.
+
+Can also be run from the command line::
+
+    python -m quadrants.tools.fastcache report
+    python -m quadrants.tools.fastcache trim --max-bytes 100000000
+"""
+
+import argparse
+import datetime
+
+from quadrants.lang import impl
+from quadrants.lang._fast_caching import python_side_cache
+
+
+def _resolve_cache_folder(offline_cache_file_path):
+    if offline_cache_file_path is None:
+        runtime = impl.get_runtime()
+        if runtime._prog is not None:
+            offline_cache_file_path = runtime.prog.config().offline_cache_file_path
+        else:
+            offline_cache_file_path = impl.default_cfg().offline_cache_file_path
+    return python_side_cache.get_cache_folder(offline_cache_file_path)
+
+
+def fastcache_report(offline_cache_file_path=None):
+    """Reports how many entries the fastcache folder holds, and how much disk space they use.
+
+    Args:
+        offline_cache_file_path (Optional[str]): Offline cache folder containing the fastcache folder. Defaults to the
+            one of the current program, or to the default ``offline_cache_file_path`` if ``qd.init`` was not called.
+
+    Returns:
+        PythonSideCacheUsage: ``num_entries``, ``total_bytes``, and the oldest / newest access times.
+    """
+    return python_side_cache.get_usage(_resolve_cache_folder(offline_cache_file_path))
+
+
+def fastcache_trim(max_bytes=0, max_entries=0, offline_cache_file_path=None):
+    """Evicts the least recently used fastcache entries until the folder fits within the given budget.
+
+    Runs synchronously, unlike the background eviction enabled by ``qd.init(src_ll_cache_max_bytes=...)``.
+
+    Args:
+        max_bytes (int): Maximum total size of the entries to keep, in bytes. 0 means unlimited.
+        max_entries (int): Maximum number of entries to keep. 0 means unlimited.
+        offline_cache_file_path (Optional[str]): See :func:`fastcache_report`.
+
+    Returns:
+        PythonSideCacheEviction: how many entries and bytes were removed, and how many remain.
+    """
+    return python_side_cache.evict_lru(
+        _resolve_cache_folder(offline_cache_file_path), max_bytes=max_bytes, max_entries=max_entries
+    )
+
+
+def _format_mtime(mtime):
+    if mtime is None:
+        return "-"
+    return datetime.datetime.fromtimestamp(mtime).isoformat(timespec="seconds")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m quadrants.tools.fastcache", description=__doc__.splitlines()[0])
+    parser.add_argument("--offline-cache-file-path", default=None)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("report", help="print the size of the fastcache folder")
+    trim_parser = subparsers.add_parser("trim", help="evict least recently used entries")
+    trim_parser.add_argument("--max-bytes", type=int, default=0)
+    trim_parser.add_argument("--max-entries", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    if args.command == "trim":
+        eviction = fastcache_trim(args.max_bytes, args.max_entries, args.offline_cache_file_path)
+        print(f"removed: {eviction.num_removed} entries, {eviction.bytes_removed} bytes")
+        print(f"remaining: {eviction.num_remaining} entries, {eviction.bytes_remaining} bytes")
+        return
+    usage = fastcache_report(args.offline_cache_file_path)
+    print(f"folder: {usage.cache_folder}")
+    print(f"entries: {usage.num_entries}")
+    print(f"bytes: {usage.total_bytes}")
+    print(f"least recently used: {_format_mtime(usage.oldest_mtime)}")
+    print(f"most recently used: {_format_mtime(usage.newest_mtime)}")
+
+
+if __name__ == "__main__":
+    main()
+
+__all__ = ["fastcache_report", "fastcache_trim"]
@@ -41,6 +41,7 @@ static std::vector<std::uint8_t> get_offline_cache_key_of_compile_config(const C
   serializer(config.opt_level);
   serializer(config.external_optimization_level);
   serializer(config.move_loop_invariant_outside_if);
+  serializer(config.fuse_loops);
   serializer(config.demote_dense_struct_fors);
   serializer(config.advanced_optimization);
   serializer(config.constant_folding);
@@ -185,6 +186,7 @@ std::string get_hashed_offline_cache_key(const CompileConfig &config,
   auto compile_config_key = get_offline_cache_key_of_compile_config(config);
   auto device_caps_key = get_offline_cache_key_of_device_caps(caps);
   std::string autodiff_mode = std::to_string(static_cast<std::size_t>(kernel->autodiff_mode));
+  std::string fuse_loops = kernel->fuse_loops ? "1" : "0";
   picosha2::hash256_one_by_one hasher;
   hasher.process(compile_config_key.begin(), compile_config_key.end());
   hasher.process(device_caps_key.begin(), device_caps_key.end());
@@ -192,6 +194,7 @@ std::string get_hashed_offline_cache_key(const CompileConfig &config,
   hasher.process(kernel_rets_string.begin(), kernel_rets_string.end());
   hasher.process(kernel_body_string.begin(), kernel_body_string.end());
   hasher.process(autodiff_mode.begin(), autodiff_mode.end());
+  hasher.process(fuse_loops.begin(), fuse_loops.end());
   hasher.finish();
 
   auto res = picosha2::get_hash_hex_string(hasher);
@@ -255,9 +255,13 @@ void KernelCodeGenCPU::optimize_module(llvm::Module *module) {
   options.NoZerosInBSS = false;
   options.GuaranteedTailCallOpt = false;
 
+  // external_optimization_level 3 (the default) is O3. The quick builds of tiered compilation use 1, see
+  // Program::compile_kernel_quick.
+  const bool optimize_less = compile_config.external_optimization_level <= 1;
   llvm::StringRef mcpu = llvm::sys::getHostCPUName();
-  std::unique_ptr<llvm::TargetMachine> target_machine(target->createTargetMachine(
-      triple, mcpu.str(), "", options, llvm::Reloc::PIC_, llvm::CodeModel::Small, llvm::CodeGenOptLevel::Aggressive));
+  std::unique_ptr<llvm::TargetMachine> target_machine(
+      target->createTargetMachine(triple, mcpu.str(), "", options, llvm::Reloc::PIC_, llvm::CodeModel::Small,
+                                  optimize_less ? llvm::CodeGenOptLevel::Less : llvm::CodeGenOptLevel::Aggressive));
 
   QD_ERROR_UNLESS(target_machine.get(), "Could not allocate target machine!");
 
@@ -275,7 +279,8 @@ void KernelCodeGenCPU::optimize_module(llvm::Module *module) {
   pb.registerLoopAnalyses(lam);
   pb.crossRegisterProxies(lam, fam, cgam, mam);
 
-  llvm::ModulePassManager mpm = pb.buildPerModuleDefaultPipeline(llvm::OptimizationLevel::O3);
+  llvm::ModulePassManager mpm =
+      pb.buildPerModuleDefaultPipeline(optimize_less ? llvm::OptimizationLevel::O1 : llvm::OptimizationLevel::O3);
 
   mpm.run(*module, mam);
 
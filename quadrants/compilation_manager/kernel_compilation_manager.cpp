@@ -1,12 +1,85 @@
 #include "quadrants/compilation_manager/kernel_compilation_manager.h"
 
+#include <chrono>
+#include <condition_variable>
+#include <filesystem>
+#include <functional>
+#include <memory>
+#include <mutex>
+#include <thread>
+
 #include "quadrants/analysis/offline_cache_util.h"
 #include "quadrants/codegen/compiled_kernel_data.h"
 #include "quadrants/util/offline_cache.h"
 #include "quadrants/util/environ_config.h"
+#include "quadrants/util/lock.h"
 
 namespace quadrants::lang {
 
+namespace {
+
+// How often a process waiting for another process to compile a kernel checks whether it is done.
+constexpr std::chrono::milliseconds kCompileLockPollInterval{50};
+// How often the process holding a compile lock touches the lock file while compiling, so that a long compile is not
+// mistaken for a dead one.
+constexpr std::chrono::seconds kCompileLockRefreshInterval{10};
+// A compile lock not touched for this long is assumed to be left over by a process that died while compiling.
+constexpr std::chrono::seconds kCompileLockTimeout{60};
+
+bool is_stale_lock(const std::string &path) {
+  std::error_code ec;
+  auto lock_time = std::filesystem::last_write_time(path, ec);
+  return !ec && std::filesystem::file_time_type::clock::now() - lock_time > kCompileLockTimeout;
+}
+
+// Removes a stale compile lock. Waiters that found the lock stale at the same time take turns under a second lock
+// file, and each checks again before removing it: otherwise one of them could remove the lock another one has just
+// taken, and both would compile the kernel.
+void remove_stale_compile_lock(const std::string &lock_path) {
+  const auto breaker_path = lock_path + ".stale";
+  if (!try_lock_with_file(breaker_path)) {
+    if (is_stale_lock(breaker_path)) {
+      unlock_with_file(breaker_path);
+    }
+    return;
+  }
+  if (is_stale_lock(lock_path)) {
+    QD_DEBUG("Remove stale compile lock {}", lock_path);
+    unlock_with_file(lock_path);
+  }
+  unlock_with_file(breaker_path);
+}
+
+// Holds a compile lock taken with try_lock_with_file: touches the lock file every kCompileLockRefreshInterval until
+// the returned cleanup runs, which then removes it.
+RaiiCleanup hold_compile_lock(const std::string &lock_path) {
+  struct State {
+    std::mutex mut;
+    std::condition_variable cv;
+    bool released{false};
+    std::thread refresher;
+  };
+  auto state = std::make_shared<State>();
+  state->refresher = std::thread([state = state.get(), lock_path]() {
+    std::unique_lock<std::mutex> lock(state->mut);
+    while (!state->cv.wait_for(lock, kCompileLockRefreshInterval, [state]() { return state->released; })) {
+      std::error_code ec;
+      std::filesystem::last_write_time(lock_path, std::filesystem::file_time_type::clock::now(), ec);
+    }
+  });
+  return make_cleanup([state, lock_path]() {
+    {
+      std::lock_guard<std::mutex> _(state->mut);
+      state->released = true;
+    }
+    state->cv.notify_one();
+    state->refresher.join();
+    unlock_with_file(lock_path);
+  });
+}
+
+}  // namespace
+
 namespace offline_cache {
 
 constexpr char kQdCacheFilenameExt[] = "qdc";
@@ -66,15 +139,42 @@ CompileResult KernelCompilationManager::load_or_compile(const CompileConfig &com
                                                         const Kernel &kernel_def) {
   auto cache_mode = get_cache_mode(compile_config, kernel_def.ir_is_ast());
   const auto kernel_key = make_kernel_key(compile_config, caps, kernel_def);
+  {
+    std::lock_guard<std::mutex> _(mut_);
+    auto cached_kernel = try_load_cached_kernel(kernel_def.get_name(), kernel_key, compile_config.arch, cache_mode);
+    if (cached_kernel) {
+      return CompileResult{*cached_kernel, true, kernel_key};
+    }
+  }
+  // Several processes sharing the offline cache (e.g. the workers of a data-parallel job) often compile the same
+  // kernels at the same time. Only one of them compiles a given kernel, the others wait for its cache file and load it.
+  std::optional<RaiiCleanup> compile_lock;
+  if (cache_mode == CacheData::MemAndDiskCache) {
+    auto shared_kernel = wait_for_shared_kernel(kernel_def.get_name(), kernel_key, compile_config.arch, &compile_lock);
+    if (shared_kernel) {
+      return CompileResult{*shared_kernel, true, kernel_key};
+    }
+  }
+  // compile_lock is released after compile_and_cache_kernel wrote the cache file.
+  return CompileResult{compile_and_cache_kernel(kernel_key, compile_config, caps, kernel_def), false, kernel_key};
+}
+
+std::optional<CompileResult> KernelCompilationManager::try_load(const CompileConfig &compile_config,
+                                                                const DeviceCapabilityConfig &caps,
+                                                                const Kernel &kernel_def) {
+  auto cache_mode = get_cache_mode(compile_config, kernel_def.ir_is_ast());
+  const auto kernel_key = make_kernel_key(compile_config, caps, kernel_def);
+  std::lock_guard<std::mutex> _(mut_);
   auto cached_kernel = try_load_cached_kernel(kernel_def.get_name(), kernel_key, compile_config.arch, cache_mode);
-  bool cache_hit = (cached_kernel != nullptr);
-  return CompileResult{
-      cached_kernel ? *cached_kernel : compile_and_cache_kernel(kernel_key, compile_config, caps, kernel_def),
-      cache_hit, kernel_key};
+  if (cached_kernel) {
+    return CompileResult{*cached_kernel, true, kernel_key};
+  }
+  return std::nullopt;
 }
 
 void KernelCompilationManager::dump() {
-  if (caching_kernels_.empty()) {
+  std::lock_guard<std::mutex> _(mut_);
+  if (caching_kernels_.empty() && registered_data_.empty()) {
     return;
   }
 
@@ -86,7 +186,8 @@ void KernelCompilationManager::dump() {
 
   if (!lock_with_file(lock_path)) {
     QD_WARN("Lock {} failed. Please run 'qd cache clean -p {}' and try again.", lock_path, cache_dir_);
-    caching_kernels_.clear();  // Ignore the caching kernels
+    // The caching kernels are kept for the next dump rather than destroyed, since references to them may still be
+    // held by the caller of load_or_compile (dump may run mid-run, e.g. from qd.cache.export_bundle).
     return;
   }
 
@@ -105,31 +206,52 @@ void KernelCompilationManager::dump() {
       iter->second.metadata.last_used_at = e->metadata.last_used_at;
     }
   }
-
-  // Add new data
-  for (auto &[kernel_key, kernel] : caching_kernels_) {
-    if (kernel.metadata.cache_mode == CacheData::MemAndDiskCache) {
-      dataWrapperByCacheKey.insert({kernel_key, std::move(kernel)});
+  // Add registered data, whose cache files are already on disk
+  for (const auto *e : registered_data_) {
+    if (dataWrapperByCacheKey.find(e->metadata.kernel_key) == dataWrapperByCacheKey.end()) {
+      KernelCacheData k;
+      k.metadata = e->metadata;
+      data.size += k.metadata.size;
+      dataWrapperByCacheKey.insert({e->metadata.kernel_key, std::move(k)});
     }
   }
-  // Clear caching_kernels_
-  caching_kernels_.clear();
-  // Dump cached CompiledKernelData to disk
-  for (auto &[_, k] : dataWrapperByCacheKey) {
-    if (k.compiled_kernel_data) {
-      auto cache_filename = make_filename(k.metadata.kernel_key);
-      std::ofstream fs{cache_filename, std::ios::out | std::ios::binary};
-      QD_ASSERT(fs.is_open());
-      auto err = k.compiled_kernel_data->dump(fs);
-      if (err == CompiledKernelData::Err::kNoError) {
-        QD_ASSERT(!!fs);
-        k.metadata.size = fs.tellp();
-        data.size += k.metadata.size;
-      } else {
-        QD_DEBUG("Dump cached CompiledKernelData(kernel_key={}) failed: {}", k.metadata.kernel_key,
-                 CompiledKernelData::get_err_msg(err));
-      }
+  registered_data_.clear();
+
+  // Dump new data. The compiled kernels are moved to cached_data_ rather than destroyed, since references to them may
+  // still be held by the caller of load_or_compile.
+  for (auto iter = caching_kernels_.begin(); iter != caching_kernels_.end();) {
+    auto &[kernel_key, kernel] = *iter;
+    if (kernel.metadata.cache_mode != CacheData::MemAndDiskCache) {
+      ++iter;
+      continue;
     }
+    auto cache_filename = make_filename(kernel_key);
+    if (kernel.metadata.size > 0 && path_exists(cache_filename)) {
+      // Already written by compile_and_cache_kernel
+      data.size += kernel.metadata.size;
+      KernelCacheData k;
+      k.metadata = kernel.metadata;
+      dataWrapperByCacheKey[kernel_key] = std::move(k);
+      cached_data_.dataWrapperByCacheKey[kernel_key] = std::move(kernel);
+      iter = caching_kernels_.erase(iter);
+      continue;
+    }
+    std::ofstream fs{cache_filename, std::ios::out | std::ios::binary};
+    QD_ASSERT(fs.is_open());
+    auto err = kernel.compiled_kernel_data->dump(fs);
+    if (err == CompiledKernelData::Err::kNoError) {
+      QD_ASSERT(!!fs);
+      kernel.metadata.size = fs.tellp();
+      data.size += kernel.metadata.size;
+      KernelCacheData k;
+      k.metadata = kernel.metadata;
+      dataWrapperByCacheKey[kernel_key] = std::move(k);
+    } else {
+      QD_DEBUG("Dump cached CompiledKernelData(kernel_key={}) failed: {}", kernel_key,
+               CompiledKernelData::get_err_msg(err));
+    }
+    cached_data_.dataWrapperByCacheKey[kernel_key] = std::move(kernel);
+    iter = caching_kernels_.erase(iter);
   }
   // Dump offline cache metadata
   if (!dataWrapperByCacheKey.empty()) {
@@ -137,6 +259,30 @@ void KernelCompilationManager::dump() {
   }
 }
 
+int KernelCompilationManager::register_cache_files(const std::vector<std::string> &kernel_keys) {
+  std::lock_guard<std::mutex> _(mut_);
+  int num_registered = 0;
+  auto &dataWrapperByCacheKey = cached_data_.dataWrapperByCacheKey;
+  for (const auto &kernel_key : kernel_keys) {
+    if (caching_kernels_.count(kernel_key) || dataWrapperByCacheKey.count(kernel_key)) {
+      continue;
+    }
+    auto filename = make_filename(kernel_key);
+    if (!path_exists(filename)) {
+      continue;
+    }
+    KernelCacheData k;
+    k.metadata.kernel_key = kernel_key;
+    k.metadata.size = std::filesystem::file_size(filename);
+    k.metadata.created_at = k.metadata.last_used_at = std::time(nullptr);
+    k.metadata.cache_mode = CacheData::MemAndDiskCache;
+    auto &registered = (dataWrapperByCacheKey[kernel_key] = std::move(k));
+    registered_data_.push_back(&registered);
+    num_registered++;
+  }
+  return num_registered;
+}
+
 void KernelCompilationManager::clean_offline_cache(offline_cache::CleanCachePolicy policy,
                                                    int max_bytes,
                                                    double cleaning_factor) const {
@@ -224,10 +370,123 @@ const CompiledKernelData &KernelCompilationManager::compile_and_cache_kernel(con
     QD_INFO("Compiling kernel '{}'", kernel_def.get_name());
   }
   std::unique_ptr<CompiledKernelData> compiled_kernel_data = compile_kernel(compile_config, caps, kernel_def);
+  // Written right away rather than in dump(), so that other processes waiting for this kernel can load it.
+  std::size_t size = 0;
+  if (get_cache_mode(compile_config, kernel_def.ir_is_ast()) == CacheData::MemAndDiskCache) {
+    size = write_cache_file(kernel_key, *compiled_kernel_data);
+  }
+  std::lock_guard<std::mutex> _(mut_);
+  // Another thread may have compiled the same kernel key in the meantime. Keep the first one, so that references
+  // already handed out stay valid.
+  if (auto iter = caching_kernels_.find(kernel_key); iter != caching_kernels_.end()) {
+    return *iter->second.compiled_kernel_data;
+  }
   CompiledKernelData &res = cache_kernel(kernel_key, compile_config, std::move(compiled_kernel_data), kernel_def);
+  caching_kernels_[kernel_key].metadata.size = size;
   return res;
 }
 
+std::size_t KernelCompilationManager::write_cache_file(const std::string &kernel_key,
+                                                       const CompiledKernelData &compiled_kernel_data) const {
+  // Written to a temporary file, then renamed, so that other processes never load a partially written file.
+  quadrants::create_directories(cache_dir_);
+  const auto cache_filename = make_filename(kernel_key);
+  const auto tmp_filename =
+      fmt::format("{}.{}.tmp", cache_filename,
+                  std::hash<std::thread::id>{}(std::this_thread::get_id()) ^
+                      static_cast<std::size_t>(std::chrono::steady_clock::now().time_since_epoch().count()));
+  std::size_t size = 0;
+  {
+    std::ofstream fs{tmp_filename, std::ios::out | std::ios::binary};
+    if (!fs.is_open()) {
+      QD_DEBUG("Open {} failed", tmp_filename);
+      return 0;
+    }
+    auto err = compiled_kernel_data.dump(fs);
+    if (err != CompiledKernelData::Err::kNoError || !fs) {
+      QD_DEBUG("Dump cached CompiledKernelData(kernel_key={}) failed: {}", kernel_key,
+               CompiledKernelData::get_err_msg(err));
+      fs.close();
+      std::remove(tmp_filename.c_str());
+      return 0;
+    }
+    size = fs.tellp();
+  }
+  std::error_code ec;
+  std::filesystem::rename(tmp_filename, cache_filename, ec);
+  if (ec) {
+    QD_DEBUG("Rename {} to {} failed: {}", tmp_filename, cache_filename, ec.message());
+    std::remove(tmp_filename.c_str());
+    return 0;
+  }
+  return size;
+}
+
+const CompiledKernelData *KernelCompilationManager::wait_for_shared_kernel(const std::string &kernel_name,
+                                                                           const std::string &kernel_key,
+                                                                           Arch arch,
+                                                                           std::optional<RaiiCleanup> *compile_lock) {
+  quadrants::create_directories(cache_dir_);
+  const auto lock_path = join_path(cache_dir_, fmt::format(kCompileLockFilenameFormat, kernel_key));
+  while (true) {
+    if (try_lock_with_file(lock_path)) {
+      compile_lock->emplace(hold_compile_lock(lock_path));
+      // The process holding the lock before may have finished between the lookup in load_or_compile and now.
+      return load_shared_kernel(kernel_name, kernel_key, arch);
+    }
+    if (is_stale_lock(lock_path)) {
+      remove_stale_compile_lock(lock_path);
+    }
+    std::this_thread::sleep_for(kCompileLockPollInterval);
+    if (auto shared_kernel = load_shared_kernel(kernel_name, kernel_key, arch)) {
+      return shared_kernel;
+    }
+  }
+}
+
+const CompiledKernelData *KernelCompilationManager::load_shared_kernel(const std::string &kernel_name,
+                                                                       const std::string &kernel_key,
+                                                                       Arch arch) {
+  {
+    // The compile lock may also be held by another thread of this process.
+    std::lock_guard<std::mutex> _(mut_);
+    if (auto iter = caching_kernels_.find(kernel_key); iter != caching_kernels_.end()) {
+      return iter->second.compiled_kernel_data.get();
+    }
+  }
+  auto loaded = load_ckd(kernel_key, arch);
+  if (!loaded) {
+    return nullptr;
+  }
+  QD_ASSERT(loaded->arch() == arch);
+  std::lock_guard<std::mutex> _(mut_);
+  if (auto iter = caching_kernels_.find(kernel_key); iter != caching_kernels_.end()) {
+    return iter->second.compiled_kernel_data.get();
+  }
+  auto &k = cached_data_.dataWrapperByCacheKey[kernel_key];
+  if (k.compiled_kernel_data) {
+    return k.compiled_kernel_data.get();
+  }
+  QD_DEBUG("Create kernel '{}' from cache written by another process (key='{}')", kernel_name, kernel_key);
+  const bool in_metadata = !k.metadata.kernel_key.empty();
+  k.metadata.kernel_key = kernel_key;
+  std::error_code ec;
+  auto size = std::filesystem::file_size(make_filename(kernel_key), ec);
+  k.metadata.size = ec ? 0 : size;
+  k.metadata.last_used_at = std::time(nullptr);
+  if (!in_metadata) {
+    k.metadata.created_at = k.metadata.last_used_at;
+  }
+  k.metadata.cache_mode = CacheData::MemAndDiskCache;
+  k.compiled_kernel_data = std::move(loaded);
+  if (in_metadata) {
+    updated_data_.push_back(&k);
+  } else {
+    registered_data_.push_back(&k);
+  }
+  return k.compiled_kernel_data.get();
+}
+
 CompiledKernelData &KernelCompilationManager::cache_kernel(const std::string &kernel_key,
                                                            const CompileConfig &compile_config,
                                                            std::unique_ptr<CompiledKernelData> compiled_kernel_data,
@@ -252,6 +511,7 @@ const CompiledKernelData *KernelCompilationManager::load_fast_cache(const std::s
                                                                     const CompileConfig &compile_config,
                                                                     const DeviceCapabilityConfig &caps) {
   auto cache_mode = get_cache_mode(compile_config, true);
+  std::lock_guard<std::mutex> _(mut_);
   auto res = try_load_cached_kernel(kernel_name, checksum, compile_config.arch, cache_mode);
   return res;
 }
@@ -3,8 +3,12 @@
 #include <ctime>
 #include <string>
 #include <memory>
+#include <mutex>
+#include <optional>
 #include <unordered_map>
+#include <vector>
 
+#include "quadrants/common/cleanup.h"
 #include "quadrants/util/offline_cache.h"
 #include "quadrants/codegen/kernel_compiler.h"
 #include "quadrants/codegen/compiled_kernel_data.h"
@@ -48,6 +52,8 @@ struct CompileResult {
   const CompiledKernelData &compiled_kernel_data;
   bool cache_hit;
   std::string cache_key;
+  // Wall time spent in load_or_compile, in seconds. Filled in by Program::compile_kernel(s).
+  double compile_time{0.0};
 };
 
 namespace tests {
@@ -57,6 +63,8 @@ class KernelCompilationManagerTest_CacheExistingKernelThrowsException_Test;
 class KernelCompilationManagerTest_DumpMemCacheOnlyKernel_Test;
 class KernelCompilationManagerTest_DumpMultipleKernels_Test;
 class KernelCompilationManagerTest_CacheDuplicateKernelFromDiskThrowsException_Test;
+class KernelCompilationManagerTest_WaitForKernelCompiledByAnotherProcess_Test;
+class KernelCompilationManagerTest_RemoveStaleCompileLock_Test;
 }  // namespace tests
 
 class KernelCompilationManager final {
@@ -64,6 +72,8 @@ class KernelCompilationManager final {
   static constexpr char kMetadataFilename[] = "qdcache.qdb";
   static constexpr char kCacheFilenameFormat[] = "{}.qdc";
   static constexpr char kMetadataLockName[] = "qdcache.lock";
+  // Held by the process compiling a kernel, see load_or_compile.
+  static constexpr char kCompileLockFilenameFormat[] = "{}.lock";
 
   using KernelCacheData = CacheData::DataWrapper;
   using CachingKernels = std::unordered_map<std::string, KernelCacheData>;
@@ -76,13 +86,32 @@ class KernelCompilationManager final {
   explicit KernelCompilationManager(Config init_params);
 
   // Load from memory || Load from disk || (Compile && Cache in memory)
+  // Thread-safe: kernels can be compiled concurrently, see Program::compile_kernels.
+  // With the offline cache enabled, it is also safe across processes sharing the cache directory: a kernel is compiled
+  // by one process at a time (under a per-kernel lock file), and written to disk right away, so that the other
+  // processes load it instead of compiling it again.
   CompileResult load_or_compile(const CompileConfig &compile_config,
                                 const DeviceCapabilityConfig &caps,
                                 const Kernel &kernel_def);
 
-  // Dump the cached data in memory to disk
+  // Load from memory || Load from disk, without compiling. Returns nullopt if kernel_def is in neither cache.
+  std::optional<CompileResult> try_load(const CompileConfig &compile_config,
+                                        const DeviceCapabilityConfig &caps,
+                                        const Kernel &kernel_def);
+
+  // Compiles kernel_def without looking it up in, or adding it to, the caches.
+  std::unique_ptr<CompiledKernelData> compile_kernel(const CompileConfig &compile_config,
+                                                     const DeviceCapabilityConfig &caps,
+                                                     const Kernel &kernel_def) const;
+
+  // Dump the cached data in memory to disk. Kernels stay loaded, so this can also be called while the program runs.
   void dump();
 
+  // Registers kernels whose cache files were copied into the cache directory by another process (e.g. by
+  // qd.cache.import_bundle), so that they are found by later lookups, and recorded in the metadata on the next dump.
+  // Keys that are already known, or whose file is missing, are ignored. Returns the number of kernels registered.
+  int register_cache_files(const std::vector<std::string> &kernel_keys);
+
   // Run offline cache cleaning
   void clean_offline_cache(offline_cache::CleanCachePolicy policy, int max_bytes, double cleaning_factor) const;
 
@@ -100,13 +129,11 @@ class KernelCompilationManager final {
   friend class tests::KernelCompilationManagerTest_DumpMemCacheOnlyKernel_Test;
   friend class tests::KernelCompilationManagerTest_DumpMultipleKernels_Test;
   friend class tests::KernelCompilationManagerTest_CacheDuplicateKernelFromDiskThrowsException_Test;
+  friend class tests::KernelCompilationManagerTest_WaitForKernelCompiledByAnotherProcess_Test;
+  friend class tests::KernelCompilationManagerTest_RemoveStaleCompileLock_Test;
 
   std::string make_filename(const std::string &kernel_key) const;
 
-  std::unique_ptr<CompiledKernelData> compile_kernel(const CompileConfig &compile_config,
-                                                     const DeviceCapabilityConfig &caps,
-                                                     const Kernel &kernel_def) const;
-
   std::string make_kernel_key(const CompileConfig &compile_config,
                               const DeviceCapabilityConfig &caps,
                               const Kernel &kernel_def) const;
@@ -126,14 +153,36 @@ class KernelCompilationManager final {
                                    std::unique_ptr<CompiledKernelData> compiled_kernel_data,
                                    const Kernel &kernel_def);
 
+  // Writes the cache file of a kernel atomically. Returns its size, or 0 on failure.
+  std::size_t write_cache_file(const std::string &kernel_key, const CompiledKernelData &compiled_kernel_data) const;
+
+  // Waits until either this process holds the compile lock of kernel_key, which is then stored in compile_lock, or
+  // another process wrote the cache file of kernel_key. Returns the kernel loaded from that file, if any. The holder
+  // of the lock keeps touching it while compiling; a lock left untouched for a while belongs to a process that died,
+  // and is removed.
+  const CompiledKernelData *wait_for_shared_kernel(const std::string &kernel_name,
+                                                   const std::string &kernel_key,
+                                                   Arch arch,
+                                                   std::optional<RaiiCleanup> *compile_lock);
+
+  // Loads a kernel written to the cache directory by another process, and adds it to cached_data_.
+  const CompiledKernelData *load_shared_kernel(const std::string &kernel_name,
+                                               const std::string &kernel_key,
+                                               Arch arch);
+
   std::unique_ptr<CompiledKernelData> load_ckd(const std::string &kernel_key, Arch arch);
 
   static CacheData::CacheMode get_cache_mode(const CompileConfig &compile_config, bool kernel_ir_is_ast);
 
   Config config_;
+  // Guards caching_kernels_, cached_data_ and updated_data_. Not held while compiling.
+  std::mutex mut_;
   CachingKernels caching_kernels_;
   CacheData cached_data_;
   std::vector<KernelCacheData *> updated_data_;
+  // Entries of cached_data_ added by register_cache_files or load_shared_kernel, which are not in the metadata file
+  // yet.
+  std::vector<KernelCacheData *> registered_data_;
   const std::string cache_dir_;
 };
 
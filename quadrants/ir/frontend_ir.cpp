@@ -114,7 +114,8 @@ FrontendForStmt::FrontendForStmt(const FrontendForStmt &o)
       graph_parallel_region_id(o.graph_parallel_region_id),
       graph_do_while_level_id(o.graph_do_while_level_id),
       checkpoint_id(o.checkpoint_id),
-      loop_name(o.loop_name) {
+      loop_name(o.loop_name),
+      fusable(o.fusable) {
 }
 
 void FrontendForStmt::init_config(Arch arch, const ForLoopConfig &config) {
@@ -127,6 +128,7 @@ void FrontendForStmt::init_config(Arch arch, const ForLoopConfig &config) {
   graph_do_while_level_id = config.graph_do_while_level_id;
   checkpoint_id = config.checkpoint_id;
   loop_name = config.loop_name;
+  fusable = config.fusable;
   if (arch == Arch::cuda || arch == Arch::amdgpu) {
     num_cpu_threads = 1;
     QD_ASSERT(block_dim <= quadrants_max_gpu_block_dim);
@@ -38,6 +38,9 @@ struct ForLoopConfig {
   // slice 1b; the runtime does not yet consume this field, so behaviour is unchanged for non- checkpoint code paths.
   int checkpoint_id{-1};
   std::string loop_name{""};
+  // Whether the offloaded task of this loop may be fused with an adjacent one, see `fuse_offloaded_range_fors`. Cleared
+  // by `qd.loop_config(fuse=False)`.
+  bool fusable{true};
 };
 
 #define QD_DEFINE_CLONE_FOR_FRONTEND_IR                                           \
@@ -217,6 +220,7 @@ class FrontendForStmt : public Stmt {
   int graph_do_while_level_id{-1};
   int checkpoint_id{-1};
   std::string loop_name;
+  bool fusable{true};
 
   FrontendForStmt(const ExprGroup &loop_vars,
                   SNode *snode,
@@ -939,6 +943,7 @@ class ASTBuilder {
       config.graph_do_while_level_id = -1;
       config.checkpoint_id = -1;
       config.loop_name.clear();
+      config.fusable = true;
     }
   };
 
@@ -1090,6 +1095,10 @@ class ASTBuilder {
     for_loop_dec_.config.loop_name = loop_name;
   }
 
+  void set_fusable(bool fusable) {
+    for_loop_dec_.config.fusable = fusable;
+  }
+
   void insert_snode_access_flag(SNodeAccessFlag v, const Expr &field) {
     for_loop_dec_.config.mem_access_opt.add_flag(field.snode(), v);
   }
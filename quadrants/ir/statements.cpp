@@ -227,6 +227,7 @@ std::unique_ptr<Stmt> RangeForStmt::clone() const {
   new_stmt->checkpoint_id = checkpoint_id;
   new_stmt->graph_do_while_level_id = graph_do_while_level_id;
   new_stmt->loop_name = loop_name;
+  new_stmt->fusable = fusable;
   return new_stmt;
 }
 
@@ -416,6 +417,7 @@ std::unique_ptr<Stmt> OffloadedStmt::clone() const {
   new_stmt->checkpoint_id = checkpoint_id;
   new_stmt->graph_do_while_level_id = graph_do_while_level_id;
   new_stmt->loop_name = loop_name;
+  new_stmt->fusable = fusable;
   // Shared-pointer copy: the captured trip-count `SizeExpr` is read-only after `determine_ad_stack_size`
   // populates it in `compile_to_offloads`, and LLVM codegen clones each offload at `codegen.cpp:68`
   // before lowering it. Without this copy the cloned task arrives with `pre_chunk_loop_trip_count_expr ==
@@ -990,6 +990,8 @@ class RangeForStmt : public Stmt {
   // runtime can reconstruct nested graph_do_while loops. See graph_do_while docs.
   int graph_do_while_level_id{-1};
   std::string loop_name;
+  // Cleared by `qd.loop_config(fuse=False)`. Propagated to `OffloadedStmt::fusable` by `offload.cpp`.
+  bool fusable{true};
 
   RangeForStmt(Stmt *begin,
                Stmt *end,
@@ -1391,6 +1393,8 @@ class OffloadedStmt : public Stmt {
   Stmt *end_stmt{nullptr};
   std::string range_hint = "";
   std::string loop_name;
+  // Whether `fuse_offloaded_range_fors` may fuse this range-for task with an adjacent one.
+  bool fusable{true};
 
   mesh::Mesh *mesh{nullptr};
   mesh::MeshElementType major_from_type;
@@ -96,6 +96,7 @@ bool determine_ad_stack_size(IRNode *root, const CompileConfig &config);
 bool constant_fold(IRNode *root);
 void associate_continue_scope(IRNode *root, const CompileConfig &config);
 void offload(IRNode *root, const CompileConfig &config);
+bool fuse_offloaded_range_fors(IRNode *root);
 bool transform_statements(IRNode *root,
                           std::function<bool(Stmt *)> filter,
                           std::function<void(Stmt *, DelayedIRModifier *)> transformer);
@@ -30,6 +30,9 @@ struct CompileConfig {
   // per-task CSE that unification is restored by merge_global_ptrs (pre-offload, fields) and cse_offloaded_tasks
   // (post-offload, ndarrays) -- see compile_to_offloads.cpp -- so this pass itself is unchanged from upstream.
   bool cache_loop_invariant_global_vars{true};
+  // Fuse adjacent top-level range-fors into one offloaded task, see irpass::fuse_offloaded_range_fors. Kernels built
+  // by qd.fuse set Kernel::fuse_loops, which enables it regardless of this option.
+  bool fuse_loops{true};
   bool demote_dense_struct_fors;
   bool advanced_optimization;
   bool constant_folding;
@@ -104,6 +107,9 @@ struct CompileConfig {
   double offline_cache_cleaning_factor{0.25};              // [0.f, 1.f]
 
   int num_compile_threads{4};
+  // CPU backend only: launch kernels from a dedicated thread, in order, without waiting for them to complete. See
+  // Program::launch_kernel.
+  bool async_cpu_launch{false};
   std::string vk_api_version;
 
   size_t cuda_stack_limit{0};
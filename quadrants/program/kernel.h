@@ -18,6 +18,10 @@ class QD_DLL_EXPORT Kernel : public Callable {
 
   bool is_accessor{false};
 
+  // Set for kernels built by qd.fuse(): adjacent range-for tasks are fused when no iteration depends on another one,
+  // even if CompileConfig::fuse_loops is off.
+  bool fuse_loops{false};
+
   Kernel(Program &program,
          const std::function<void()> &func,
          const std::string &name = "",
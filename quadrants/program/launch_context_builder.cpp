@@ -57,6 +57,12 @@ LaunchContextBuilder::LaunchContextBuilder(CallableBase *kernel)
   ctx_->arg_buffer = arg_buffer_.get();
 }
 
+LaunchContextBuilder::~LaunchContextBuilder() {
+  if (result_readback) {
+    result_readback(false);
+  }
+}
+
 void LaunchContextBuilder::copy(const LaunchContextBuilder &other) {
   QD_ASSERT(kernel_ == other.kernel_);
   QD_ASSERT(array_runtime_sizes.empty());
@@ -69,6 +75,17 @@ void LaunchContextBuilder::copy(const LaunchContextBuilder &other) {
   ndarray_shapes = other.ndarray_shapes;
 }
 
+LaunchContextBuilder LaunchContextBuilder::clone() const {
+  LaunchContextBuilder ctx(kernel_);
+  ctx.copy(*this);
+  ctx.use_graph = use_graph;
+  ctx.async_result = async_result;
+  ctx.graph_do_while_levels = graph_do_while_levels;
+  ctx.checkpoint_yield_on_arg_ids = checkpoint_yield_on_arg_ids;
+  ctx.resume_from_checkpoint = resume_from_checkpoint;
+  return ctx;
+}
+
 void LaunchContextBuilder::set_arg_float(int arg_id, float64 d) {
   auto dt = kernel_->args_type->get_element_type(std::array{arg_id});
   QD_ASSERT_INFO(dt->is<PrimitiveType>(),
@@ -441,7 +458,16 @@ void LaunchContextBuilder::set_arg_matrix(int arg_id, const Matrix &matrix) {
   }
 }
 
+void LaunchContextBuilder::wait_for_result() {
+  if (result_readback) {
+    auto readback = std::move(result_readback);
+    result_readback = nullptr;
+    readback(true);
+  }
+}
+
 TypedConstant LaunchContextBuilder::fetch_ret(const std::vector<int> &index) {
+  wait_for_result();
   const Type *dt = ret_type_->get_element_type(index);
   int offset = ret_type_->get_element_offset(index);
   return fetch_ret_impl(offset, dt);
@@ -1,4 +1,6 @@
 #pragma once
+#include <functional>
+
 #include <quadrants/program/callable.h>
 #include "quadrants/program/ndarray.h"
 #include "quadrants/program/matrix.h"
@@ -49,6 +51,7 @@ class LaunchContextBuilder {
   LaunchContextBuilder &operator=(LaunchContextBuilder &&) = default;
   LaunchContextBuilder(const LaunchContextBuilder &) = delete;
   LaunchContextBuilder &operator=(const LaunchContextBuilder &) = delete;
+  ~LaunchContextBuilder();
 
   // Copy all the arguments already added to an existing launcher context.
   // The input context must be associated with the exactly same kernel, and
@@ -57,6 +60,10 @@ class LaunchContextBuilder {
   // the exact same input arguments.
   void copy(const LaunchContextBuilder &other);
 
+  // Returns a new launch context holding the arguments and launch settings (graph, graph_do_while and checkpoint
+  // tables) of this one, which must not have been launched. This context stays untouched, so it can be cloned again.
+  LaunchContextBuilder clone() const;
+
   void set_arg_float(int arg_id, float64 d);
   // Bulk processing of multiple scalar float arguments at the same time.
   // This is mainly useful to mitigate Python/C++ binding function call overhead.
@@ -146,6 +153,10 @@ class LaunchContextBuilder {
 
   void set_arg_matrix(int arg_id, const Matrix &matrix);
 
+  // Waits for the results of an `async_result` launch, and copies them into the host result buffer, if the backend
+  // left them on the device. A no-op otherwise. Called by the getters below.
+  void wait_for_result();
+
   TypedConstant fetch_ret(const std::vector<int> &index);
   float64 get_struct_ret_float(const std::vector<int> &index);
   int64 get_struct_ret_int(const std::vector<int> &index);
@@ -171,6 +182,13 @@ class LaunchContextBuilder {
   const StructType *args_type{nullptr};
   size_t result_buffer_size{0};
   bool use_graph{false};
+  // Set from Python for `@qd.kernel(async_return=True)` launches. Backends supporting it then leave the results on the
+  // device, without waiting for the kernel, and install `result_readback` to copy them back once they are asked for.
+  bool async_result{false};
+  // Copies the results left on the device back into the host result buffer if called with true, waiting for the kernel
+  // to finish, and releases the device buffer holding them. Called at most once, with false if the results are dropped
+  // unread.
+  std::function<void(bool)> result_readback;
   // Level table for nested `graph_do_while`, indexed by level id (empty if the kernel has no graph_do_while loop).
   // Populated from Python at launch; flag_dev_ptr filled in by the backend's ndarray-resolution loop. Replaces the old
   // single-loop scalars (arg id + flag ptr); the single (non-nested) loop is simply the depth-1 case with one level
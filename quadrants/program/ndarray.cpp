@@ -140,6 +140,7 @@ TypedConstant Ndarray::read(const std::vector<int> &I) const {
   // Surface any pending adstack overflow at this Quadrants Python entry. The internal `synchronize()`
   // below drains the queue but does NOT raise; the explicit poll catches DLPack-bypass overflows from a
   // previous launch within one entry of the offending kernel even when the user never calls `qd.sync()`.
+  prog_->wait_for_deferred_launches();
   prog_->check_adstack_overflow_and_assert();
   prog_->synchronize();
   size_t index = flatten_index(total_shape_, I);
@@ -169,6 +170,8 @@ TypedConstant Ndarray::read(const std::vector<int> &I) const {
 }
 
 void Ndarray::write(const std::vector<int> &I, TypedConstant val) const {
+  // Unlike other backends, the CPU backend writes host memory directly, so deferred launches must be done with it.
+  prog_->wait_for_deferred_launches();
   if (get_element_data_type()->is_primitive(PrimitiveTypeID::f16)) {
     uint16_t float16 = fp16_ieee_from_fp32_value(val.val_f32);
     std::memcpy(&val.value_bits, &float16, 4);
@@ -108,8 +108,9 @@ void ParallelExecutor::worker_loop() {
       }
     }
     if (notify_flush_cv) {
-      // It is fine to notify |flush_cv_| while nobody is waiting on it.
-      flush_cv_.notify_one();
+      // It is fine to notify |flush_cv_| while nobody is waiting on it. Several threads can be flushing at once,
+      // e.g. when kernels are compiled concurrently, so wake them all.
+      flush_cv_.notify_all();
     }
   }
 }
@@ -121,6 +121,10 @@ Program::Program(Arch desired_arch)
 
   Timelines::get_instance().set_enabled(config.timeline);
 
+  if (config.async_cpu_launch && arch_is_cpu(config.arch)) {
+    deferred_launch_worker_ = std::make_unique<ParallelExecutor>("deferred_launch", 1);
+  }
+
   QD_TRACE("Program ({}) arch={} initialized.", fmt::ptr(this), arch_name(config.arch));
 }
 
@@ -162,11 +166,185 @@ CompileResult Program::compile_kernel(const CompileConfig &compile_config,
   QD_AUTO_PROF;
   auto &mgr = program_impl_->get_kernel_compilation_manager();
   CompileResult compile_result = mgr.load_or_compile(compile_config, device_caps, kernel_def);
-  total_compilation_time_ += Time::get_time() - start_t;
+  compile_result.compile_time = Time::get_time() - start_t;
+  add_compilation_time(compile_result.compile_time);
   return compile_result;
 }
 
+std::vector<CompileResult> Program::compile_kernels(const CompileConfig &compile_config,
+                                                    const DeviceCapabilityConfig &device_caps,
+                                                    const std::vector<Kernel *> &kernel_defs,
+                                                    int num_threads) {
+  auto start_t = Time::get_time();
+  QD_AUTO_PROF;
+  auto &mgr = program_impl_->get_kernel_compilation_manager();
+  std::vector<std::optional<CompileResult>> results(kernel_defs.size());
+  std::vector<std::exception_ptr> errors(kernel_defs.size());
+  auto compile_one = [&](std::size_t i) {
+    try {
+      auto kernel_start_t = Time::get_time();
+      results[i].emplace(mgr.load_or_compile(compile_config, device_caps, *kernel_defs[i]));
+      results[i]->compile_time = Time::get_time() - kernel_start_t;
+    } catch (...) {
+      errors[i] = std::current_exception();
+    }
+  };
+  if (num_threads <= 0) {
+    num_threads = compile_config.num_compile_threads;
+  }
+  if (arch_uses_llvm(compile_config.arch) && num_threads > 1 && kernel_defs.size() > 1) {
+    if (!kernel_compile_workers_ || kernel_compile_workers_->get_num_threads() != num_threads) {
+      kernel_compile_workers_ = std::make_unique<ParallelExecutor>("precompile", num_threads);
+    }
+    for (std::size_t i = 0; i < kernel_defs.size(); i++) {
+      kernel_compile_workers_->enqueue([&compile_one, i] { compile_one(i); });
+    }
+    kernel_compile_workers_->flush();
+  } else {
+    for (std::size_t i = 0; i < kernel_defs.size(); i++) {
+      compile_one(i);
+    }
+  }
+  add_compilation_time(Time::get_time() - start_t);
+  for (auto &error : errors) {
+    if (error) {
+      std::rethrow_exception(error);
+    }
+  }
+  std::vector<CompileResult> compile_results;
+  compile_results.reserve(kernel_defs.size());
+  for (auto &result : results) {
+    compile_results.push_back(*result);
+  }
+  return compile_results;
+}
+
+void Program::add_compilation_time(float64 compilation_time) {
+  // Kernels can be compiled from several threads, see compile_kernels and compile_kernel_quick.
+  std::lock_guard<std::mutex> _(compilation_time_mut_);
+  total_compilation_time_ += compilation_time;
+}
+
+std::optional<CompileResult> Program::load_cached_kernel(const CompileConfig &compile_config,
+                                                         const DeviceCapabilityConfig &device_caps,
+                                                         const Kernel &kernel_def) {
+  auto &mgr = program_impl_->get_kernel_compilation_manager();
+  return mgr.try_load(compile_config, device_caps, kernel_def);
+}
+
+const CompiledKernelData &Program::compile_kernel_quick(const CompileConfig &compile_config,
+                                                        const DeviceCapabilityConfig &device_caps,
+                                                        const Kernel &kernel_def) {
+  auto start_t = Time::get_time();
+  QD_AUTO_PROF;
+  CompileConfig quick_config = compile_config;
+  quick_config.advanced_optimization = false;
+  quick_config.cfg_optimization = false;
+  // Picks the O1 LLVM pipeline on CPU. The GPU backends run LLVM when the kernel is loaded, with the program's config.
+  quick_config.external_optimization_level = 1;
+  if (kernel_def.autodiff_mode == AutodiffMode::kNone) {
+    // Gradient kernels need opt_level >= 1.
+    quick_config.opt_level = 0;
+  }
+  auto &mgr = program_impl_->get_kernel_compilation_manager();
+  auto compiled_kernel_data = mgr.compile_kernel(quick_config, device_caps, kernel_def);
+  add_compilation_time(Time::get_time() - start_t);
+  std::lock_guard<std::mutex> _(quick_compiled_kernels_mut_);
+  quick_compiled_kernels_.push_back(std::move(compiled_kernel_data));
+  return *quick_compiled_kernels_.back();
+}
+
+LaunchContextBuilder Program::launch_kernel_frozen(const CompiledKernelData &compiled_kernel_data,
+                                                   const LaunchContextBuilder &frozen_ctx) {
+  LaunchContextBuilder ctx = frozen_ctx.clone();
+  launch_kernel(compiled_kernel_data, ctx);
+  return ctx;
+}
+
+void Program::launch_kernels_frozen(const std::vector<CompiledKernelData *> &compiled_kernel_datas,
+                                    const std::vector<LaunchContextBuilder *> &frozen_ctxs) {
+  QD_ASSERT(compiled_kernel_datas.size() == frozen_ctxs.size());
+  for (std::size_t i = 0; i < frozen_ctxs.size(); i++) {
+    if (deferred_launch_worker_ && can_defer_launch(*frozen_ctxs[i])) {
+      // Clone once, rather than once here and once more in launch_kernel.
+      defer_launch(*compiled_kernel_datas[i], std::make_shared<LaunchContextBuilder>(frozen_ctxs[i]->clone()));
+      continue;
+    }
+    LaunchContextBuilder ctx = frozen_ctxs[i]->clone();
+    launch_kernel(*compiled_kernel_datas[i], ctx);
+  }
+}
+
 void Program::launch_kernel(const CompiledKernelData &compiled_kernel_data, LaunchContextBuilder &ctx) {
+  if (deferred_launch_worker_) {
+    if (can_defer_launch(ctx)) {
+      // ctx may be cached by the caller and copied into the launch contexts of later calls, so it must not be mutated
+      // by the deferred launch thread.
+      defer_launch(compiled_kernel_data, std::make_shared<LaunchContextBuilder>(ctx.clone()));
+      return;
+    }
+    wait_for_deferred_launches();
+  }
+  launch_kernel_now(compiled_kernel_data, ctx);
+}
+
+bool Program::can_defer_launch(const LaunchContextBuilder &ctx) {
+  // Return values and checkpoint yields are read from ctx right after the launch. External (numpy, torch) arrays are
+  // read and written in place by CPU kernels, so the caller may use them as soon as the launch returns.
+  if (ctx.result_buffer_size > 0 || !ctx.checkpoint_yield_on_arg_ids.empty()) {
+    return false;
+  }
+  for (const auto &[key, ptr] : ctx.array_ptrs) {
+    auto it = ctx.device_allocation_type.find(key.arg_id);
+    if (it == ctx.device_allocation_type.end() || it->second == LaunchContextBuilder::DevAllocType::kNone) {
+      return false;
+    }
+  }
+  return true;
+}
+
+void Program::defer_launch(const CompiledKernelData &compiled_kernel_data, std::shared_ptr<LaunchContextBuilder> ctx) {
+  // compiled_kernel_data is owned by the kernel compilation manager (or quick_compiled_kernels_), which outlives the
+  // deferred launch thread, drained on finalize.
+  deferred_launch_worker_->enqueue([this, &compiled_kernel_data, ctx]() {
+    {
+      std::lock_guard<std::mutex> _(deferred_launch_error_mut_);
+      // A launch failing synchronously would have stopped the caller before the next launches were issued.
+      if (deferred_launch_error_) {
+        return;
+      }
+    }
+    try {
+      launch_kernel_now(compiled_kernel_data, *ctx);
+    } catch (...) {
+      std::lock_guard<std::mutex> _(deferred_launch_error_mut_);
+      deferred_launch_error_ = std::current_exception();
+    }
+  });
+}
+
+void Program::drain_deferred_launches() {
+  if (deferred_launch_worker_) {
+    deferred_launch_worker_->flush();
+  }
+}
+
+void Program::wait_for_deferred_launches() {
+  if (!deferred_launch_worker_) {
+    return;
+  }
+  deferred_launch_worker_->flush();
+  std::exception_ptr error;
+  {
+    std::lock_guard<std::mutex> _(deferred_launch_error_mut_);
+    std::swap(error, deferred_launch_error_);
+  }
+  if (error) {
+    std::rethrow_exception(error);
+  }
+}
+
+void Program::launch_kernel_now(const CompiledKernelData &compiled_kernel_data, LaunchContextBuilder &ctx) {
   // Diagnose-snapshot capture strategy depends on when the overflow check fires relative to ctx lifetime:
   //   - SPIR-V backends poll the overflow flag at `synchronize()` time, by which point the launch ctx is
   //     long gone; capture eagerly here, before the CPU launcher's `set_host_accessible_ndarray_ptrs`
@@ -217,6 +395,7 @@ static void remove_rw_accessor_cache(SNode *parent_snode, SNodeRwAccessorsBank *
 
 void Program::destroy_snode_tree(SNodeTree *snode_tree) {
   QD_ASSERT(arch_uses_llvm(compile_config().arch) || compile_config().arch == Arch::vulkan);
+  drain_deferred_launches();
 
   // When accessing a qd.field at Python scope, SNodeRwAccessorsBank creates a Quadrants Kernel to read/write the field
   // in a JIT manner, which caches the compiled JIT Kernel so as to avoid recompilation when accessing the same field.
@@ -236,6 +415,8 @@ void Program::destroy_snode_tree(SNodeTree *snode_tree) {
 }
 
 SNodeTree *Program::add_snode_tree(std::unique_ptr<SNode> root, bool compile_only) {
+  // Materializing a tree allocates from the LLVM runtime, which deferred launches may be using.
+  drain_deferred_launches();
   const int id = allocate_snode_tree_id();
   auto tree = std::make_unique<SNodeTree>(id, std::move(root));
   tree->root()->set_snode_tree_id(id);
@@ -260,10 +441,12 @@ SNode *Program::get_snode_root(int tree_id) {
 }
 
 void Program::synchronize() {
+  drain_deferred_launches();
   program_impl_->synchronize();
 }
 
 void Program::synchronize_and_assert() {
+  wait_for_deferred_launches();
   program_impl_->synchronize_and_assert();
 }
 
@@ -391,6 +574,10 @@ void Program::dump_cache_data_to_disk() {
   program_impl_->dump_cache_data_to_disk();
 }
 
+int Program::register_offline_cache_files(const std::vector<std::string> &kernel_keys) {
+  return program_impl_->get_kernel_compilation_manager().register_cache_files(kernel_keys);
+}
+
 void Program::finalize() {
   if (finalized_) {
     return;
@@ -412,6 +599,9 @@ void Program::finalize() {
   QD_TRACE("Program finalizing...");
 
   synchronize();
+  deferred_launch_worker_.reset();
+  deferred_launch_error_ = nullptr;
+  kernel_compile_workers_.reset();
   if (arch_uses_llvm(compile_config().arch)) {
     program_impl_->finalize();
   }
@@ -477,12 +667,16 @@ void Program::delete_ndarray(Ndarray *ndarray) {
   // valid in Python. This isn't the best implementation, ndarrays should be managed by quadrants runtime instead of
   // this giant program and it should be freed when: - Python GC signals quadrants that it's no longer useful - All
   // kernels using it are executed.
+  // Called on Python GC, so deferred launch errors are left for the next synchronization point to raise.
+  drain_deferred_launches();
   if (ndarrays_.count(ndarray) && !program_impl_->used_in_kernel(ndarray->ndarray_alloc_.alloc_id)) {
     ndarrays_.erase(ndarray);
   }
 }
 
 intptr_t Program::get_ndarray_data_ptr_as_int(const Ndarray *ndarray) {
+  // The pointer is handed to other frameworks (e.g. DLPack), which read and write through it right away.
+  wait_for_deferred_launches();
   uint64_t *data_ptr{nullptr};
   if (arch_is_cpu(compile_config().arch) || compile_config().arch == Arch::cuda ||
       compile_config().arch == Arch::amdgpu) {
@@ -494,6 +688,7 @@ intptr_t Program::get_ndarray_data_ptr_as_int(const Ndarray *ndarray) {
 }
 
 void Program::fill_ndarray_fast_u32(Ndarray *ndarray, uint32_t val) {
+  wait_for_deferred_launches();
   // This is a temporary solution to bypass device api. Should be moved to CommandList once available in CUDA.
   program_impl_->fill_ndarray(ndarray->ndarray_alloc_,
                               ndarray->get_nelement() * ndarray->get_element_size() / sizeof(uint32_t), val);
@@ -2,7 +2,9 @@
 
 #pragma once
 
+#include <exception>
 #include <functional>
+#include <memory>
 #include <mutex>
 #include <optional>
 #include <atomic>
@@ -23,6 +25,7 @@
 #include "quadrants/program/function.h"
 #include "quadrants/program/kernel.h"
 #include "quadrants/program/kernel_profiler.h"
+#include "quadrants/program/parallel_executor.h"
 #include "quadrants/program/snode_expr_utils.h"
 #include "quadrants/program/snode_rw_accessors_bank.h"
 #include "quadrants/program/program_stream.h"
@@ -105,10 +108,11 @@ class QD_DLL_EXPORT Program {
     return profiler.get();
   }
 
-  // Drain the backend command queue. Does not raise; for internal use only.
+  // Drain the backend command queue. Does not raise, leaving any deferred launch error pending; for internal use only.
   void synchronize();
 
-  // Drain the queue and raise on any pending user-visible assert (e.g. adstack overflow). Bound to `qd.sync()`.
+  // Drain the queue and raise on any pending user-visible assert (e.g. adstack overflow), or on the first error raised
+  // by a deferred launch since the last sync (see wait_for_deferred_launches). Bound to `qd.sync()`.
   void synchronize_and_assert();
 
   // Per-Quadrants-Python-entry poll for any pending adstack overflow signal. Unlike `synchronize_and_assert`
@@ -129,6 +133,9 @@ class QD_DLL_EXPORT Program {
 
   void dump_cache_data_to_disk();
 
+  // See KernelCompilationManager::register_cache_files.
+  int register_offline_cache_files(const std::vector<std::string> &kernel_keys);
+
   const CompiledKernelData *load_fast_cache(const std::string &checksum,
                                             const std::string &kernel_name,
                                             const CompileConfig &compile_config,
@@ -144,8 +151,48 @@ class QD_DLL_EXPORT Program {
                                const DeviceCapabilityConfig &device_caps,
                                const Kernel &kernel_def);
 
+  // Compiles several kernels at once, on up to num_threads threads (num_compile_threads if num_threads <= 0). Used by
+  // qd.precompile. Only the LLVM backends compile concurrently; other backends compile one kernel after the other.
+  // The results are in the order of kernel_defs. If any kernel fails to compile, the first failure is rethrown once
+  // all of them are done.
+  std::vector<CompileResult> compile_kernels(const CompileConfig &compile_config,
+                                             const DeviceCapabilityConfig &device_caps,
+                                             const std::vector<Kernel *> &kernel_defs,
+                                             int num_threads);
+
+  // First tier of tiered compilation: returns kernel_def's optimized build from the in-memory or offline cache if it is
+  // there, or nullopt. See compile_kernel_quick.
+  std::optional<CompileResult> load_cached_kernel(const CompileConfig &compile_config,
+                                                  const DeviceCapabilityConfig &device_caps,
+                                                  const Kernel &kernel_def);
+
+  // Compiles kernel_def with most optimizations turned off, so that it can be launched while its optimized build (from
+  // compile_kernel) is compiled in the background. The quick build is neither cached nor written to the offline cache.
+  // It stays alive until the program is finalized, since launches in flight may still refer to it.
+  const CompiledKernelData &compile_kernel_quick(const CompileConfig &compile_config,
+                                                 const DeviceCapabilityConfig &device_caps,
+                                                 const Kernel &kernel_def);
+
+  // With async_cpu_launch on the CPU backend, a clone of ctx is launched from the deferred launch thread, after every
+  // launch deferred before it, and this returns right away, leaving ctx unlaunched. Launches whose results are read by
+  // the caller as soon as this returns run synchronously instead, once the deferred ones have completed: see
+  // can_defer_launch.
   void launch_kernel(const CompiledKernelData &compiled_kernel_data, LaunchContextBuilder &ctx);
 
+  // Blocks until every deferred launch has completed, then rethrows the first error raised by one of them, if any.
+  // No-op unless async_cpu_launch is on.
+  void wait_for_deferred_launches();
+
+  // Launches compiled_kernel_data with a clone of frozen_ctx, which is left as is, so that a kernel can be launched
+  // again and again with the same arguments without setting them up each time. Returns the launched context, which
+  // holds the kernel's return values.
+  LaunchContextBuilder launch_kernel_frozen(const CompiledKernelData &compiled_kernel_data,
+                                            const LaunchContextBuilder &frozen_ctx);
+
+  // Launches each compiled_kernel_datas[i] with a clone of frozen_ctxs[i], one after the other, in a single call.
+  void launch_kernels_frozen(const std::vector<CompiledKernelData *> &compiled_kernel_datas,
+                             const std::vector<LaunchContextBuilder *> &frozen_ctxs);
+
   std::size_t get_graph_cache_size() {
     return program_impl_->get_kernel_launcher().get_graph_cache_size();
   }
@@ -397,7 +444,24 @@ class QD_DLL_EXPORT Program {
   std::unordered_map<FunctionKey, Function *> function_map_;
 
   std::unique_ptr<ProgramImpl> program_impl_;
+  void add_compilation_time(float64 compilation_time);
+
+  void launch_kernel_now(const CompiledKernelData &compiled_kernel_data, LaunchContextBuilder &ctx);
+  static bool can_defer_launch(const LaunchContextBuilder &ctx);
+  void defer_launch(const CompiledKernelData &compiled_kernel_data, std::shared_ptr<LaunchContextBuilder> ctx);
+  // Same as wait_for_deferred_launches, but leaves any error pending, for teardown paths that must not throw.
+  void drain_deferred_launches();
+
+  std::mutex compilation_time_mut_;
   float64 total_compilation_time_{0.0};
+  // Created on the first compile_kernels call, and kept, so that its threads (and their LLVM contexts) are reused.
+  std::unique_ptr<ParallelExecutor> kernel_compile_workers_;
+  std::mutex quick_compiled_kernels_mut_;
+  std::vector<std::unique_ptr<CompiledKernelData>> quick_compiled_kernels_;
+  // Single thread running deferred launches in order, with async_cpu_launch on the CPU backend; null otherwise.
+  std::unique_ptr<ParallelExecutor> deferred_launch_worker_;
+  std::mutex deferred_launch_error_mut_;
+  std::exception_ptr deferred_launch_error_;
   static std::atomic<int> num_instances_;
   bool finalized_{false};
   size_t num_offloaded_tasks_on_last_call_{0};
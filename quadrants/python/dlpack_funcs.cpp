@@ -205,6 +205,8 @@ nb::capsule field_to_dlpack(Program *program, SNode *snode, int element_ndim, in
 
   Arch arch = program->compile_config().arch;
   validate_arch(arch);
+  // The consumer reads the memory right away, with no way to wait for deferred CPU launches (async_cpu_launch).
+  program->wait_for_deferred_launches();
 
 #if QD_WITH_AMDGPU
   std::unique_ptr<AMDGPUContext::ContextGuard> amdgpu_guard;
@@ -385,6 +387,8 @@ nb::capsule ndarray_to_dlpack(Program *program,
                               bool versioned) {
   Arch arch = program->compile_config().arch;
   validate_arch(arch);
+  // The consumer reads the memory right away, with no way to wait for deferred CPU launches (async_cpu_launch).
+  program->wait_for_deferred_launches();
 
 #if QD_WITH_AMDGPU
   std::unique_ptr<AMDGPUContext::ContextGuard> amdgpu_guard;
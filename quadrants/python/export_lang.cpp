@@ -228,6 +228,9 @@ void export_lang(nb::module_ &m) {
               "advanced_optimization pipeline.")
       .def_rw("cache_loop_invariant_global_vars", &CompileConfig::cache_loop_invariant_global_vars,
               "Cache loop-invariant global loads into locals inside loops.")
+      .def_rw("fuse_loops", &CompileConfig::fuse_loops,
+              "Fuse adjacent top-level range-for loops over the same range into a single offloaded task, when every "
+              "element one of them writes is only accessed by the same iteration of the other.")
       .def_rw("default_cpu_block_dim", &CompileConfig::default_cpu_block_dim,
               "Number of iterations per CPU parallel-for block.")
       .def_rw("cpu_block_dim_adaptive", &CompileConfig::cpu_block_dim_adaptive,
@@ -351,6 +354,10 @@ void export_lang(nb::module_ &m) {
       .def_rw("num_compile_threads", &CompileConfig::num_compile_threads,
               "Number of host threads used to compile kernels on the LLVM backends (CPU, CUDA, AMDGPU); other backends "
               "ignore it, and it is forced to 1 when print_ir is set.")
+      .def_rw("async_cpu_launch", &CompileConfig::async_cpu_launch,
+              "On the CPU backend, enqueue kernel launches to a dedicated thread and return without waiting for them "
+              "to complete. They are waited for by qd.sync(), host reads and writes, and launches that cannot be "
+              "deferred. Ignored by other backends.")
       .def_rw("vk_api_version", &CompileConfig::vk_api_version,
               "Vulkan API version to request, as a \"major.minor.patch\" string (e.g. \"1.3.0\"). Empty lets Quadrants "
               "select a usable version automatically.")
@@ -417,6 +424,7 @@ void export_lang(nb::module_ &m) {
       .def("create_assert_stmt", &ASTBuilder::create_assert_stmt)
       .def("expr_assign", &ASTBuilder::expr_assign)
       .def("set_loop_name", &ASTBuilder::set_loop_name)
+      .def("set_fusable", &ASTBuilder::set_fusable)
       .def("begin_frontend_range_for", &ASTBuilder::begin_frontend_range_for)
       .def("end_frontend_range_for", &ASTBuilder::pop_scope)
       .def("begin_frontend_struct_for_on_snode", &ASTBuilder::begin_frontend_struct_for_on_snode)
@@ -506,6 +514,7 @@ void export_lang(nb::module_ &m) {
       .def("get_snode_root", &Program::get_snode_root, nb::rv_policy::reference)
       .def("load_fast_cache", &Program::load_fast_cache, nb::rv_policy::reference)
       .def("dump_cache_data_to_disk", &Program::dump_cache_data_to_disk)
+      .def("register_offline_cache_files", &Program::register_offline_cache_files)
       .def(
           "create_kernel",
           [](Program *program, const std::function<void(Kernel *)> &body, const std::string &name,
@@ -552,8 +561,38 @@ void export_lang(nb::module_ &m) {
       .def("fill_uint",
            [](Program *program, Ndarray *ndarray, uint32_t val) { program->fill_ndarray_fast_u32(ndarray, val); })
       .def("get_graphics_device", [](Program *program) { return program->get_graphics_device(); })
-      .def("compile_kernel", &Program::compile_kernel, nb::rv_policy::reference)
+      .def("compile_kernel",
+           [](Program *program, const CompileConfig &compile_config, const DeviceCapabilityConfig &device_caps,
+              const Kernel *kernel_def) {
+             // Released so that tiered compilation can compile optimized builds on a background thread.
+             nb::gil_scoped_release release;
+             return program->compile_kernel(compile_config, device_caps, *kernel_def);
+           })
+      .def(
+          "compile_kernels",
+          [](Program *program, const CompileConfig &compile_config, const DeviceCapabilityConfig &device_caps,
+             const std::vector<Kernel *> &kernel_defs, int num_threads) {
+            nb::gil_scoped_release release;
+            return program->compile_kernels(compile_config, device_caps, kernel_defs, num_threads);
+          },
+          nb::arg("compile_config"), nb::arg("device_caps"), nb::arg("kernel_defs"), nb::arg("num_threads") = 0)
+      .def("load_cached_kernel",
+           [](Program *program, const CompileConfig &compile_config, const DeviceCapabilityConfig &device_caps,
+              const Kernel *kernel_def) {
+             nb::gil_scoped_release release;
+             return program->load_cached_kernel(compile_config, device_caps, *kernel_def);
+           })
+      .def(
+          "compile_kernel_quick",
+          [](Program *program, const CompileConfig &compile_config, const DeviceCapabilityConfig &device_caps,
+             const Kernel *kernel_def) -> const CompiledKernelData & {
+            nb::gil_scoped_release release;
+            return program->compile_kernel_quick(compile_config, device_caps, *kernel_def);
+          },
+          nb::rv_policy::reference)
       .def("launch_kernel", &Program::launch_kernel)
+      .def("launch_kernel_frozen", &Program::launch_kernel_frozen)
+      .def("launch_kernels_frozen", &Program::launch_kernels_frozen)
       .def("get_device_caps", &Program::get_device_caps)
       .def("subgroup_size", &Program::subgroup_size)
       .def("get_graph_cache_size", &Program::get_graph_cache_size)
@@ -576,7 +615,8 @@ void export_lang(nb::module_ &m) {
       .def_prop_ro("compiled_kernel_data",
                    [](const CompileResult &self) -> const CompiledKernelData & { return self.compiled_kernel_data; })
       .def_ro("cache_hit", &CompileResult::cache_hit)
-      .def_ro("cache_key", &CompileResult::cache_key);
+      .def_ro("cache_key", &CompileResult::cache_key)
+      .def_ro("compile_time", &CompileResult::compile_time);
 
   nb::class_<Axis>(m, "Axis").def(nb::init<int>());
   nb::class_<SNode>(m, "SNodeCxx")
@@ -683,6 +723,7 @@ void export_lang(nb::module_ &m) {
              self->no_activate.push_back(snode);
            })
       .def("to_string", &Kernel::to_string)
+      .def_rw("fuse_loops", &Kernel::fuse_loops)
       .def("insert_scalar_param", &Kernel::insert_scalar_param)
       .def("insert_arr_param", &Kernel::insert_arr_param)
       .def("insert_ndarray_param", &Kernel::insert_ndarray_param)
@@ -715,6 +756,12 @@ void export_lang(nb::module_ &m) {
       .def("get_struct_ret_uint", &LaunchContextBuilder::get_struct_ret_uint)
       .def("get_struct_ret_float", &LaunchContextBuilder::get_struct_ret_float)
       .def_rw("use_graph", &LaunchContextBuilder::use_graph)
+      .def_rw("async_result", &LaunchContextBuilder::async_result)
+      .def("wait_for_result",
+           [](LaunchContextBuilder *self) {
+             nb::gil_scoped_release release;
+             self->wait_for_result();
+           })
       .def("add_graph_do_while_level", &LaunchContextBuilder::add_graph_do_while_level)
       .def_rw("checkpoint_yield_on_arg_ids", &LaunchContextBuilder::checkpoint_yield_on_arg_ids)
       .def_rw("resume_from_checkpoint", &LaunchContextBuilder::resume_from_checkpoint);
@@ -375,6 +375,13 @@ void KernelLauncher::launch_llvm_kernel(Handle handle, LaunchContextBuilder &ctx
     persistent_result_buffer_capacity_ = new_cap;
   }
   device_result_buffer = static_cast<char *>(persistent_result_buffer_dev_ptr_);
+  // `async_result` launches on the default stream get a result buffer of their own instead, which keeps the results on
+  // the device past the launch, until `result_readback` is called. Explicit streams keep the synchronous readback
+  // below, as the stream may be gone by the time the results are read.
+  const bool async_result = ctx.async_result && ctx.result_buffer_size > 0 && default_stream_path;
+  if (async_result) {
+    device_result_buffer = static_cast<char *>(acquire_async_result_buffer(needed_result));
+  }
   ctx.get_context().runtime = executor->get_llvm_runtime();
 
   for (int i = 0; i < (int)parameters.size(); i++) {
@@ -533,7 +540,23 @@ void KernelLauncher::launch_llvm_kernel(Handle handle, LaunchContextBuilder &ctx
   // Persistent scratch (default-stream path): no per-launch free for the per-handle `arg_buffer` / `runtime_context`
   // or the launcher-global `result_buffer`. All live until launcher destruction; the dtor handles the final
   // `mem_free_async`.  Ephemeral buffers (explicit-stream path) are freed below.
-  if (ctx.result_buffer_size > 0) {
+  if (async_result) {
+    // The synchronous `cuMemcpyDtoH` run by the readback is ordered after the kernel on the null stream, so it waits
+    // for the kernel, and only for as long as needed, when the results are first asked for.
+    ctx.result_readback = [buffers = async_result_buffers_, host_result_buffer, device_result_buffer,
+                           result_buffer_size = ctx.result_buffer_size, needed_result](bool read) {
+      std::lock_guard<std::mutex> lock(buffers->mut);
+      QD_ERROR_IF(read && !buffers->launcher_alive,
+                  "The results of an async_return kernel launch were read after the program was reset");
+      if (!buffers->launcher_alive) {
+        return;
+      }
+      if (read) {
+        CUDADriver::get_instance().memcpy_device_to_host(host_result_buffer, device_result_buffer, result_buffer_size);
+      }
+      buffers->free.emplace_back(device_result_buffer, needed_result);
+    };
+  } else if (ctx.result_buffer_size > 0) {
     CUDADriver::get_instance().memcpy_device_to_host_async(host_result_buffer, device_result_buffer,
                                                            ctx.result_buffer_size, active_stream);
   }
@@ -589,6 +612,30 @@ KernelLauncher::~KernelLauncher() {
   if (persistent_result_buffer_dev_ptr_ != nullptr) {
     CUDADriver::get_instance().mem_free_async(persistent_result_buffer_dev_ptr_, nullptr);
   }
+  // Buffers still held by unread results are released along with the context.
+  std::lock_guard<std::mutex> lock(async_result_buffers_->mut);
+  for (auto &[ptr, size] : async_result_buffers_->free) {
+    CUDADriver::get_instance().mem_free_async(ptr, nullptr);
+  }
+  async_result_buffers_->free.clear();
+  async_result_buffers_->launcher_alive = false;
+}
+
+void *KernelLauncher::acquire_async_result_buffer(std::size_t size) {
+  {
+    std::lock_guard<std::mutex> lock(async_result_buffers_->mut);
+    auto &free = async_result_buffers_->free;
+    for (auto it = free.begin(); it != free.end(); ++it) {
+      if (it->second >= size) {
+        void *ptr = it->first;
+        free.erase(it);
+        return ptr;
+      }
+    }
+  }
+  void *ptr = nullptr;
+  CUDADriver::get_instance().malloc_async(&ptr, size, nullptr);
+  return ptr;
 }
 
 KernelLauncher::Handle KernelLauncher::register_llvm_kernel(const LLVM::CompiledKernelData &compiled) {
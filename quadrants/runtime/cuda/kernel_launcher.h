@@ -1,7 +1,10 @@
 #pragma once
 
 #include <deque>
+#include <memory>
+#include <mutex>
 #include <string>
+#include <utility>
 #include <vector>
 
 #include "quadrants/codegen/llvm/compiled_kernel_data.h"
@@ -28,6 +31,15 @@ class KernelLauncher : public LLVM::KernelLauncher {
     void *runtime_context_dev_ptr{nullptr};
   };
 
+  // Device result buffers of `async_result` launches. Each one holds the results of a launch until they are read back
+  // or dropped, and then goes back to `free` to be reused. Shared with the readbacks installed on launch contexts,
+  // which can outlive the launcher; `launcher_alive` tells them whether the buffers still exist.
+  struct AsyncResultBuffers {
+    std::mutex mut;
+    std::vector<std::pair<void *, std::size_t>> free;
+    bool launcher_alive{true};
+  };
+
  public:
   using Base::Base;
 
@@ -74,6 +86,10 @@ class KernelLauncher : public LLVM::KernelLauncher {
   // matching scheme and the recursive-launch rationale this whole layout is designed around.
   void *persistent_result_buffer_dev_ptr_{nullptr};
   std::size_t persistent_result_buffer_capacity_{0};
+  std::shared_ptr<AsyncResultBuffers> async_result_buffers_{std::make_shared<AsyncResultBuffers>()};
+
+  // Takes a device buffer of at least `size` bytes from `async_result_buffers_`, allocating one if none is free.
+  void *acquire_async_result_buffer(std::size_t size);
 
  public:
   ~KernelLauncher() override;
@@ -1,3 +1,5 @@
+#include <mutex>
+
 #include "quadrants/ir/transforms.h"
 #include "quadrants/ir/visitors.h"
 #include "quadrants/ir/statements.h"
@@ -39,6 +41,10 @@ namespace irpass {
 
 void compile_quadrants_functions(IRNode *ir, const CompileConfig &compile_config, Function::IRStage target_stage) {
   QD_AUTO_PROF;
+  // Functions are compiled in place, and shared by every kernel calling them, which can be compiled concurrently
+  // (Program::compile_kernels).
+  static std::mutex mut;
+  std::lock_guard<std::mutex> _(mut);
   CompileQuadrantsFunctions::run(ir, compile_config, target_stage);
 }
 
@@ -153,6 +153,16 @@ void compile_to_offloads(IRNode *ir,
 
   dump_ir("after_offload");
 
+  // Run adjacent range-for tasks over the same range as one task when no iteration depends on another one. Kernels
+  // built by qd.fuse() always do. This has to happen before the per-task CSE below, which then also merges the
+  // accesses of the fused loop bodies.
+  if (config.fuse_loops || kernel->fuse_loops) {
+    if (irpass::fuse_offloaded_range_fors(ir)) {
+      irpass::analysis::verify_if_debug(ir, config);
+      dump_ir("after_fuse_offloaded_range_fors");
+    }
+  }
+
   // Full per-task CSE now, before flag_access #2 splits a global's read/write pointers by access flag and before
   // simplify_III's LICM hoists the read pointer out of the loop. This restores the pointer-unification that main
   // gets from whole_kernel_cse running inside the post-offload full_simplify (per-task CSE otherwise defers to the
@@ -0,0 +1,362 @@
+#include "quadrants/ir/ir.h"
+#include "quadrants/ir/analysis.h"
+#include "quadrants/ir/statements.h"
+#include "quadrants/ir/transforms.h"
+#include "quadrants/ir/visitors.h"
+#include "quadrants/system/profiler.h"
+
+#include <algorithm>
+#include <optional>
+#include <typeinfo>
+#include <unordered_map>
+#include <vector>
+
+namespace quadrants::lang {
+
+namespace {
+
+using TaskType = OffloadedStmt::TaskType;
+
+// The global memory behind a pointer: a place SNode, an ndarray argument (or its gradient), or a global temporary.
+// Ndarray arguments are keyed by argument id; the same ndarray can still be passed to several arguments, see may_alias.
+struct MemoryObject {
+  const SNode *snode{nullptr};
+  std::vector<int> arg_id;
+  bool is_grad{false};
+  int64 global_tmp_offset{-1};
+
+  bool operator==(const MemoryObject &other) const {
+    return snode == other.snode && arg_id == other.arg_id && is_grad == other.is_grad &&
+           global_tmp_offset == other.global_tmp_offset;
+  }
+};
+
+struct MemoryAccess {
+  MemoryObject object;
+  DataType dtype;
+  // Indices of the GlobalPtrStmt / ExternalPtrStmt accessed; nullptr for global temporaries, which are scalars.
+  const std::vector<Stmt *> *indices{nullptr};
+  bool write{false};
+};
+
+// The global reads and writes of an offloaded task: the read/write sets of gather_snode_read_writes, extended to
+// ndarrays and global temporaries and kept per access, with the indices accessed. Returns std::nullopt if the task
+// does anything that cannot be reordered with the tasks around it, e.g. print, random numbers, asserts, function
+// calls, shared arrays, autodiff stacks or sparse SNode accesses.
+std::optional<std::vector<MemoryAccess>> gather_memory_accesses(OffloadedStmt *task) {
+  std::vector<MemoryAccess> accesses;
+  bool supported = true;
+  irpass::analysis::gather_statements(task->body.get(), [&](Stmt *stmt) {
+    Stmt *ptr = nullptr;
+    bool write = false;
+    if (auto global_load = stmt->cast<GlobalLoadStmt>()) {
+      ptr = global_load->src;
+    } else if (auto global_store = stmt->cast<GlobalStoreStmt>()) {
+      ptr = global_store->dest;
+      write = true;
+    } else if (auto atomic = stmt->cast<AtomicOpStmt>()) {
+      ptr = atomic->dest;
+      write = true;
+    } else if (auto alloca = stmt->cast<AllocaStmt>()) {
+      supported &= !alloca->is_shared;
+    } else if (stmt->has_global_side_effect() && !stmt->is_container_statement() && !stmt->is<ContinueStmt>() &&
+               !stmt->is<WhileControlStmt>()) {
+      supported = false;
+    }
+    if (!ptr) {
+      return false;
+    }
+    while (auto matrix_ptr = ptr->cast<MatrixPtrStmt>()) {
+      ptr = matrix_ptr->origin;
+    }
+    MemoryAccess access;
+    access.dtype = ptr->ret_type.ptr_removed();
+    access.write = write;
+    if (ptr->is<AllocaStmt>()) {
+      // A local atomic.
+      return false;
+    } else if (auto global_ptr = ptr->cast<GlobalPtrStmt>()) {
+      // Activating a sparse SNode also changes its neighbours.
+      supported &= global_ptr->snode->is_path_all_dense;
+      access.object.snode = global_ptr->snode;
+      access.indices = &global_ptr->indices;
+    } else if (auto external_ptr = ptr->cast<ExternalPtrStmt>()) {
+      auto arg_load = external_ptr->base_ptr->cast<ArgLoadStmt>();
+      if (!arg_load) {
+        supported = false;
+        return false;
+      }
+      access.object.arg_id = arg_load->arg_id;
+      access.object.is_grad = external_ptr->is_grad;
+      access.indices = &external_ptr->indices;
+    } else if (auto global_tmp = ptr->cast<GlobalTemporaryStmt>()) {
+      access.object.global_tmp_offset = (int64)global_tmp->offset;
+    } else {
+      supported = false;
+      return false;
+    }
+    accesses.push_back(access);
+    return false;
+  });
+  if (!supported) {
+    return std::nullopt;
+  }
+  return accesses;
+}
+
+// Whether stmt has the same value in every iteration of every task: only constants, scalar arguments, ndarray shapes
+// and arithmetic on them are considered.
+bool is_kernel_invariant(Stmt *stmt) {
+  if (stmt->is<ConstStmt>() || stmt->is<ExternalTensorShapeAlongAxisStmt>()) {
+    return true;
+  } else if (auto arg_load = stmt->cast<ArgLoadStmt>()) {
+    return !arg_load->is_ptr;
+  } else if (auto unary = stmt->cast<UnaryOpStmt>()) {
+    return is_kernel_invariant(unary->operand);
+  } else if (auto binary = stmt->cast<BinaryOpStmt>()) {
+    return is_kernel_invariant(binary->lhs) && is_kernel_invariant(binary->rhs);
+  }
+  return false;
+}
+
+// Whether index is the loop index of task, optionally shifted by an invariant, so that different iterations of task
+// access different indices.
+bool is_shifted_loop_index(Stmt *index, OffloadedStmt *task) {
+  if (auto loop_index = index->cast<LoopIndexStmt>()) {
+    return loop_index->loop == task;
+  }
+  if (auto binary = index->cast<BinaryOpStmt>()) {
+    if (binary->op_type == BinaryOpType::add) {
+      return (is_shifted_loop_index(binary->lhs, task) && is_kernel_invariant(binary->rhs)) ||
+             (is_kernel_invariant(binary->lhs) && is_shifted_loop_index(binary->rhs, task));
+    } else if (binary->op_type == BinaryOpType::sub) {
+      return is_shifted_loop_index(binary->lhs, task) && is_kernel_invariant(binary->rhs);
+    }
+  }
+  return false;
+}
+
+// Whether a, computed in an iteration of task_a, and b, computed in the iteration of task_b with the same loop index,
+// have the same value.
+bool same_index(Stmt *a, OffloadedStmt *task_a, Stmt *b, OffloadedStmt *task_b) {
+  if (auto loop_index_a = a->cast<LoopIndexStmt>()) {
+    auto loop_index_b = b->cast<LoopIndexStmt>();
+    return loop_index_b && loop_index_a->loop == task_a && loop_index_b->loop == task_b &&
+           loop_index_a->index == loop_index_b->index;
+  }
+  if (typeid(*a) != typeid(*b) || a->ret_type != b->ret_type) {
+    return false;
+  }
+  if (auto const_a = a->cast<ConstStmt>()) {
+    return const_a->val.equal_type_and_value(b->as<ConstStmt>()->val);
+  } else if (auto arg_load_a = a->cast<ArgLoadStmt>()) {
+    auto arg_load_b = b->as<ArgLoadStmt>();
+    return !arg_load_a->is_ptr && !arg_load_b->is_ptr && arg_load_a->arg_id == arg_load_b->arg_id;
+  } else if (auto shape_a = a->cast<ExternalTensorShapeAlongAxisStmt>()) {
+    auto shape_b = b->as<ExternalTensorShapeAlongAxisStmt>();
+    return shape_a->arg_id == shape_b->arg_id && shape_a->axis == shape_b->axis;
+  } else if (auto unary_a = a->cast<UnaryOpStmt>()) {
+    auto unary_b = b->as<UnaryOpStmt>();
+    return unary_a->op_type == unary_b->op_type && unary_a->cast_type == unary_b->cast_type &&
+           same_index(unary_a->operand, task_a, unary_b->operand, task_b);
+  } else if (auto binary_a = a->cast<BinaryOpStmt>()) {
+    auto binary_b = b->as<BinaryOpStmt>();
+    return binary_a->op_type == binary_b->op_type && same_index(binary_a->lhs, task_a, binary_b->lhs, task_b) &&
+           same_index(binary_a->rhs, task_a, binary_b->rhs, task_b);
+  }
+  return false;
+}
+
+// Whether two accesses can touch the same memory. Distinct ndarray arguments of the same element type and
+// dimensionality may be the same ndarray, and are then indexed the same way.
+bool may_alias(const MemoryAccess &a, const MemoryAccess &b) {
+  if (a.object == b.object) {
+    return true;
+  }
+  return !a.object.arg_id.empty() && !b.object.arg_id.empty() && a.object.is_grad == b.object.is_grad &&
+         a.dtype == b.dtype && a.indices->size() == b.indices->size();
+}
+
+// Whether two accesses to the same object can only touch the same element in the same iteration: they share an axis
+// indexed by the (shifted) loop index, the same way in both tasks.
+bool only_same_iteration(const MemoryAccess &a, OffloadedStmt *task_a, const MemoryAccess &b, OffloadedStmt *task_b) {
+  if (!a.indices || !b.indices || a.indices->size() != b.indices->size()) {
+    return false;
+  }
+  for (int i = 0; i < (int)a.indices->size(); i++) {
+    Stmt *index_a = (*a.indices)[i];
+    Stmt *index_b = (*b.indices)[i];
+    if (is_shifted_loop_index(index_a, task_a) && same_index(index_a, task_a, index_b, task_b)) {
+      return true;
+    }
+  }
+  return false;
+}
+
+// The values stored to each global temporary by the top level of serial tasks, which is where offload() stores the
+// dynamic bounds of range-fors.
+using GlobalTmpStores = std::unordered_map<std::size_t, std::vector<GlobalStoreStmt *>>;
+
+GlobalTmpStores gather_global_tmp_stores(Block *root) {
+  GlobalTmpStores stores;
+  for (auto &stmt : root->statements) {
+    auto task = stmt->cast<OffloadedStmt>();
+    if (!task || task->task_type != TaskType::serial) {
+      continue;
+    }
+    for (auto &s : task->body->statements) {
+      if (auto store = s->cast<GlobalStoreStmt>()) {
+        if (auto global_tmp = store->dest->cast<GlobalTemporaryStmt>()) {
+          stores[global_tmp->offset].push_back(store);
+        }
+      }
+    }
+  }
+  return stores;
+}
+
+bool same_bound(bool const_a,
+                int32 value_a,
+                std::size_t offset_a,
+                bool const_b,
+                int32 value_b,
+                std::size_t offset_b,
+                const GlobalTmpStores &stores) {
+  if (const_a || const_b) {
+    return const_a && const_b && value_a == value_b;
+  }
+  if (offset_a == offset_b) {
+    return true;
+  }
+  auto store_a = stores.find(offset_a);
+  auto store_b = stores.find(offset_b);
+  if (store_a == stores.end() || store_b == stores.end() || store_a->second.size() != 1 ||
+      store_b->second.size() != 1) {
+    return false;
+  }
+  Stmt *val_a = store_a->second[0]->val;
+  Stmt *val_b = store_b->second[0]->val;
+  return is_kernel_invariant(val_a) && irpass::analysis::same_value(val_a, val_b, std::unordered_map<int, int>{});
+}
+
+// A serial task that only computes loop bounds into global temporaries, from kernel invariants. offload() emits one
+// before each range-for whose bounds are not constant; it can run before the range-for preceding it.
+bool is_bound_task(Stmt *stmt) {
+  auto task = stmt->cast<OffloadedStmt>();
+  if (!task || task->task_type != TaskType::serial) {
+    return false;
+  }
+  for (auto &s : task->body->statements) {
+    if (auto store = s->cast<GlobalStoreStmt>()) {
+      if (!store->dest->is<GlobalTemporaryStmt>()) {
+        return false;
+      }
+    } else if (!s->is<GlobalTemporaryStmt>() && !is_kernel_invariant(s.get())) {
+      return false;
+    }
+  }
+  return true;
+}
+
+bool is_fusable_range_for(Stmt *stmt) {
+  auto task = stmt->cast<OffloadedStmt>();
+  return task && task->task_type == TaskType::range_for && task->fusable && !task->end_stmt && !task->reversed &&
+         task->index_offsets.empty();
+}
+
+bool same_launch_config(OffloadedStmt *a, OffloadedStmt *b) {
+  return a->grid_dim == b->grid_dim && a->block_dim == b->block_dim && a->num_cpu_threads == b->num_cpu_threads &&
+         a->stream_parallel_group_id == b->stream_parallel_group_id &&
+         a->graph_parallel_region_id == b->graph_parallel_region_id && a->checkpoint_id == b->checkpoint_id &&
+         a->graph_do_while_level_id == b->graph_do_while_level_id;
+}
+
+bool can_fuse(OffloadedStmt *first, OffloadedStmt *second, const GlobalTmpStores &stores) {
+  if (!same_launch_config(first, second) ||
+      !same_bound(first->const_begin, first->begin_value, first->begin_offset, second->const_begin, second->begin_value,
+                  second->begin_offset, stores) ||
+      !same_bound(first->const_end, first->end_value, first->end_offset, second->const_end, second->end_value,
+                  second->end_offset, stores)) {
+    return false;
+  }
+  // A continue of the first loop would skip the body of the second one.
+  auto continues = irpass::analysis::gather_statements(first->body.get(), [&](Stmt *stmt) {
+    auto continue_stmt = stmt->cast<ContinueStmt>();
+    return continue_stmt && continue_stmt->scope == first;
+  });
+  if (!continues.empty()) {
+    return false;
+  }
+  auto accesses_first = gather_memory_accesses(first);
+  auto accesses_second = gather_memory_accesses(second);
+  if (!accesses_first || !accesses_second) {
+    return false;
+  }
+  for (auto &a : *accesses_first) {
+    for (auto &b : *accesses_second) {
+      if ((a.write || b.write) && may_alias(a, b) && !only_same_iteration(a, first, b, second)) {
+        return false;
+      }
+    }
+  }
+  return true;
+}
+
+void fuse_into(OffloadedStmt *first, OffloadedStmt *second) {
+  irpass::replace_all_usages_with(second->body.get(), second, first);
+  for (auto &stmt : second->body->statements) {
+    first->body->insert(std::move(stmt));
+  }
+  second->body->statements.clear();
+}
+
+}  // namespace
+
+namespace irpass {
+
+// Fuses adjacent range-for tasks with the same bounds and launch configuration into one task running both bodies,
+// when no iteration of the second loop accesses an element that another iteration of the first one writes, or the
+// other way around. Loops with `qd.loop_config(fuse=False)` are left alone. Serial tasks computing the bounds of the
+// second loop are moved before the first one. Must run right after offload(), before the tasks are optimized
+// separately.
+bool fuse_offloaded_range_fors(IRNode *root) {
+  QD_AUTO_PROF;
+  auto *block = root->cast<Block>();
+  if (!block) {
+    return false;
+  }
+  const auto stores = gather_global_tmp_stores(block);
+  auto &stmts = block->statements;
+  bool modified = false;
+  int i = 0;
+  while (i + 1 < (int)stmts.size()) {
+    if (!is_fusable_range_for(stmts[i].get())) {
+      i++;
+      continue;
+    }
+    int j = i + 1;
+    while (j < (int)stmts.size() && is_bound_task(stmts[j].get())) {
+      j++;
+    }
+    if (j == (int)stmts.size() || !is_fusable_range_for(stmts[j].get())) {
+      i = j;
+      continue;
+    }
+    auto first = stmts[i]->as<OffloadedStmt>();
+    auto second = stmts[j]->as<OffloadedStmt>();
+    if (!can_fuse(first, second, stores)) {
+      i = j;
+      continue;
+    }
+    std::rotate(stmts.begin() + i, stmts.begin() + i + 1, stmts.begin() + j);
+    fuse_into(first, second);
+    block->erase(j);
+    i = j - 1;
+    modified = true;
+  }
+  return modified;
+}
+
+}  // namespace irpass
+
+}  // namespace quadrants::lang
@@ -269,6 +269,7 @@ class LowerAST : public IRVisitor {
                                                       stmt->num_cpu_threads, stmt->block_dim, stmt->strictly_serialized,
                                                       /*range_hint=*/fmt::format("arg ({})", fmt::join(arg_id, ", ")),
                                                       /*loop_name=*/stmt->loop_name);
+      new_for->fusable = stmt->fusable;
       new_for->stream_parallel_group_id = stmt->stream_parallel_group_id;
       new_for->graph_parallel_region_id = stmt->graph_parallel_region_id;
       new_for->checkpoint_id = stmt->checkpoint_id;
@@ -307,6 +308,7 @@ class LowerAST : public IRVisitor {
                                                         stmt->is_bit_vectorized, stmt->num_cpu_threads, stmt->block_dim,
                                                         stmt->strictly_serialized, /*range_hint=*/"",
                                                         /*loop_name=*/stmt->loop_name);
+        new_for->fusable = stmt->fusable;
         new_for->stream_parallel_group_id = stmt->stream_parallel_group_id;
         new_for->graph_parallel_region_id = stmt->graph_parallel_region_id;
         new_for->checkpoint_id = stmt->checkpoint_id;
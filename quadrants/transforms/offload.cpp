@@ -206,6 +206,7 @@ class Offloader {
         offloaded->graph_do_while_level_id = s->graph_do_while_level_id;
         offloaded->checkpoint_id = s->checkpoint_id;
         offloaded->loop_name = s->loop_name;
+        offloaded->fusable = s->fusable;
         root_block->insert(std::move(offloaded));
       } else if (auto st = stmt->cast<StructForStmt>()) {
         GraphRegionTag pre_for_tag{st->graph_do_while_level_id, st->stream_parallel_group_id};
@@ -1,7 +1,9 @@
 #include "gtest/gtest.h"
+#include <chrono>
 #include <filesystem>
 #include <fstream>
 #include <memory>
+#include <optional>
 #include <string>
 #include <vector>
 
@@ -165,6 +167,49 @@ TEST_F(KernelCompilationManagerTest, DumpMultipleKernels) {
   EXPECT_TRUE(std::filesystem::exists(cache_file2));
 }
 
+TEST_F(KernelCompilationManagerTest, WaitForKernelCompiledByAnotherProcess) {
+  // Another process holds the compile lock, and writes the cache file while this one waits.
+  auto cache_dir = temp_dir_ / "kernel_compilation_manager";
+  std::filesystem::create_directories(cache_dir);
+  std::string checksum = "shared_kernel_key";
+  std::ofstream((cache_dir / (checksum + ".lock")).string()).close();
+  {
+    KernelCompilationManager::Config config;
+    config.offline_cache_path = temp_dir_.string();
+    config.kernel_compiler = std::make_unique<FakeKernelCompiler>();
+    KernelCompilationManager other(std::move(config));
+    FakeCompiledKernelData ckd("shared_data");
+    EXPECT_GT(other.write_cache_file(checksum, ckd), 0);
+  }
+
+  std::optional<RaiiCleanup> compile_lock;
+  auto loaded = mgr_->wait_for_shared_kernel("shared_kernel", checksum, kFakeArch, &compile_lock);
+  ASSERT_NE(loaded, nullptr);
+  EXPECT_FALSE(compile_lock.has_value());
+  EXPECT_EQ(static_cast<const FakeCompiledKernelData *>(loaded)->get_data(), "shared_data");
+
+  // Recorded in the metadata on dump, without rewriting the file.
+  mgr_->dump();
+  auto metadata_file = cache_dir / "qdcache.qdb";
+  EXPECT_TRUE(std::filesystem::exists(metadata_file));
+}
+
+TEST_F(KernelCompilationManagerTest, RemoveStaleCompileLock) {
+  auto cache_dir = temp_dir_ / "kernel_compilation_manager";
+  std::filesystem::create_directories(cache_dir);
+  std::string checksum = "stale_kernel_key";
+  auto lock_path = cache_dir / (checksum + ".lock");
+  std::ofstream(lock_path.string()).close();
+  std::filesystem::last_write_time(lock_path, std::filesystem::file_time_type::clock::now() - std::chrono::hours(1));
+
+  std::optional<RaiiCleanup> compile_lock;
+  EXPECT_EQ(mgr_->wait_for_shared_kernel("stale_kernel", checksum, kFakeArch, &compile_lock), nullptr);
+  EXPECT_TRUE(compile_lock.has_value());
+  EXPECT_TRUE(std::filesystem::exists(lock_path));
+  compile_lock.reset();
+  EXPECT_FALSE(std::filesystem::exists(lock_path));
+}
+
 TEST_F(KernelCompilationManagerTest, DumpEmptyCache) {
   // Test that dumping an empty cache doesn't crash
   mgr_->dump();
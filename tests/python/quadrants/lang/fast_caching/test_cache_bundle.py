@@ -0,0 +1,91 @@
+import json
+import pathlib
+import zipfile
+
+import pytest
+
+import quadrants as qd
+from quadrants._test_tools import qd_init_same_arch
+from quadrants.lang._fast_caching import bundle
+
+from tests import test_utils
+
+
+@test_utils.test(arch=qd.cpu)
+def test_cache_bundle_round_trip(tmp_path: pathlib.Path) -> None:
+    warm_cache = tmp_path / "warm"
+    cold_cache = tmp_path / "cold"
+    bundle_path = tmp_path / "kernels.qdbundle"
+    qd_init_same_arch(offline_cache_file_path=str(warm_cache), offline_cache=True)
+
+    @qd.kernel(fastcache=True)
+    def k1(a: qd.types.NDArray[qd.i32, 1]) -> None:
+        for i in range(a.shape[0]):
+            a[i] = i
+
+    @qd.kernel
+    def k2(a: qd.types.NDArray[qd.i32, 1]) -> None:
+        for i in range(a.shape[0]):
+            a[i] *= 2
+
+    a = qd.ndarray(qd.i32, (4,))
+    k1(a)
+    k2(a)
+    info = qd.cache.export_bundle(str(bundle_path))
+    assert info.num_fastcache_entries == 1
+    assert info.num_kernels == 2
+
+    qd_init_same_arch(offline_cache_file_path=str(cold_cache), offline_cache=True)
+    info = qd.cache.import_bundle(str(bundle_path))
+    assert info.num_fastcache_entries == 1
+    assert info.num_kernels == 2
+    a = qd.ndarray(qd.i32, (4,))
+    k1(a)
+    assert k1._primal.src_ll_cache_observations.cache_loaded
+    k2(a)
+    assert k2._primal.fe_ll_cache_observations.cache_hit
+    assert a.to_numpy().tolist() == [0, 2, 4, 6]
+
+    # importing again is a no-op
+    info = qd.cache.import_bundle(str(bundle_path))
+    assert info.num_fastcache_entries == 0
+    assert info.num_kernels == 0
+
+
+@test_utils.test(arch=qd.cpu)
+def test_cache_bundle_other_version(tmp_path: pathlib.Path) -> None:
+    qd_init_same_arch(offline_cache_file_path=str(tmp_path), offline_cache=True)
+    bundle_path = tmp_path / "kernels.qdbundle"
+    with zipfile.ZipFile(bundle_path, "w") as zf:
+        manifest = {"format": bundle.BUNDLE_FORMAT, "quadrants_version": "0.0.0", "kernel_keys": ["key"]}
+        zf.writestr("manifest.json", json.dumps(manifest))
+    with pytest.warns(UserWarning):
+        info = qd.cache.import_bundle(str(bundle_path))
+    assert info.num_kernels == 0
+
+
+@test_utils.test(arch=qd.cpu)
+def test_cache_bundle_other_arch(tmp_path: pathlib.Path) -> None:
+    qd_init_same_arch(offline_cache_file_path=str(tmp_path), offline_cache=True)
+    bundle_path = tmp_path / "kernels.qdbundle"
+    with zipfile.ZipFile(bundle_path, "w") as zf:
+        manifest = {
+            "format": bundle.BUNDLE_FORMAT,
+            "quadrants_version": qd.__version_str__,
+            "arch": "Arch.cuda",
+            "kernel_keys": ["key"],
+        }
+        zf.writestr("manifest.json", json.dumps(manifest))
+    with pytest.warns(UserWarning):
+        info = qd.cache.import_bundle(str(bundle_path))
+    assert info.num_kernels == 0
+
+
+@test_utils.test(arch=qd.cpu)
+def test_cache_bundle_rejects_other_archives(tmp_path: pathlib.Path) -> None:
+    qd_init_same_arch(offline_cache_file_path=str(tmp_path), offline_cache=True)
+    bundle_path = tmp_path / "not_a_bundle.zip"
+    with zipfile.ZipFile(bundle_path, "w") as zf:
+        zf.writestr("manifest.json", "{}")
+    with pytest.raises(ValueError):
+        qd.cache.import_bundle(str(bundle_path))
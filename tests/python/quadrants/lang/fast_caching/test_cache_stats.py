@@ -0,0 +1,76 @@
+import json
+import pathlib
+
+import quadrants as qd
+from quadrants._test_tools import qd_init_same_arch
+
+from tests import test_utils
+
+
+def _get_kernel_stats(name: str):
+    (kernel_stats,) = [kernel_stats for kernel_stats in qd.cache.stats().kernels if kernel_stats.name.endswith(name)]
+    return kernel_stats
+
+
+@test_utils.test(arch=qd.cpu)
+def test_cache_stats(tmp_path: pathlib.Path) -> None:
+    qd_init_same_arch(offline_cache_file_path=str(tmp_path), offline_cache=True)
+    qd.cache.reset_stats()
+
+    @qd.kernel(fastcache=True)
+    def stats_k1(a: qd.types.NDArray[qd.i32, 1]) -> None:
+        for i in range(a.shape[0]):
+            a[i] = i
+
+    @qd.kernel
+    def stats_k2(a: qd.types.NDArray[qd.i32, 1]) -> None:
+        for i in range(a.shape[0]):
+            a[i] *= 2
+
+    a = qd.ndarray(qd.i32, (4,))
+    stats_k1(a)
+    stats_k2(a)
+    k1_stats = _get_kernel_stats("stats_k1")
+    assert k1_stats.fastcache_misses == 1
+    assert k1_stats.fastcache_hits == 0
+    assert k1_stats.offline_cache_misses == 1
+    assert k1_stats.hashing_time > 0
+    assert k1_stats.compile_time > 0
+    k2_stats = _get_kernel_stats("stats_k2")
+    assert k2_stats.fastcache_misses == 0
+    assert k2_stats.offline_cache_misses == 1
+
+    qd_init_same_arch(offline_cache_file_path=str(tmp_path), offline_cache=True)
+    a = qd.ndarray(qd.i32, (4,))
+    stats_k1(a)
+    stats_k2(a)
+    k1_stats = _get_kernel_stats("stats_k1")
+    assert k1_stats.fastcache_hits == 1
+    assert k1_stats.offline_cache_misses == 1
+    k2_stats = _get_kernel_stats("stats_k2")
+    assert k2_stats.offline_cache_hits == 1
+
+    json_path = tmp_path / "stats.json"
+    cache_stats = qd.cache.stats(json_path=str(json_path))
+    assert cache_stats.total.fastcache_hits == 1
+    assert cache_stats.total.offline_cache_hits == 1
+    assert json.loads(json_path.read_text()) == cache_stats.to_dict()
+
+    qd.cache.reset_stats()
+    assert qd.cache.stats().kernels == []
+
+
+@test_utils.test(arch=qd.cpu)
+def test_cache_stats_skip_reason() -> None:
+    qd.cache.reset_stats()
+
+    @qd.kernel(fastcache=True)
+    def stats_skipped(a: qd.template()) -> None:
+        for i in range(a.shape[0]):
+            a[i] = i
+
+    f = qd.field(qd.i32, (4,))
+    stats_skipped(f)
+    kernel_stats = _get_kernel_stats("stats_skipped")
+    assert kernel_stats.fastcache_skips == {"warn": 1}
+    assert kernel_stats.fastcache_misses == 0
@@ -0,0 +1,64 @@
+import os
+import pathlib
+
+import pytest
+
+import quadrants as qd
+from quadrants._test_tools import qd_init_same_arch
+from quadrants.lang._fast_caching import cache_writer
+from quadrants.lang._fast_caching.packed_cache import PackedPythonSideCache
+from quadrants.lang._fast_caching.python_side_cache import PythonSideCache
+
+from tests import test_utils
+
+
+@pytest.mark.parametrize("backend", ["files", "packed"])
+@test_utils.test()
+def test_cache_writer_flush(tmp_path: pathlib.Path, backend: str) -> None:
+    qd_init_same_arch(offline_cache_file_path=str(tmp_path), src_ll_cache_backend=backend)
+    cache = PythonSideCache() if backend == "files" else PackedPythonSideCache()
+    for i in range(20):
+        cache_writer.enqueue(cache, f"key{i}", f"value{i}")
+    cache_writer.enqueue(cache, "key0", "latest")
+    qd.sync_cache()
+    assert cache.try_load("key0") == "latest"
+    for i in range(1, 20):
+        assert cache.try_load(f"key{i}") == f"value{i}"
+
+
+@test_utils.test()
+def test_cache_writer_store_many_fsyncs_folder_once(monkeypatch, tmp_path: pathlib.Path) -> None:
+    qd_init_same_arch(offline_cache_file_path=str(tmp_path))
+    cache = PythonSideCache()
+    num_fsyncs = 0
+    real_fsync = os.fsync
+
+    def counting_fsync(fd):
+        nonlocal num_fsyncs
+        num_fsyncs += 1
+        real_fsync(fd)
+
+    monkeypatch.setattr(os, "fsync", counting_fsync)
+    cache.store_many([(f"key{i}", "value") for i in range(10)])
+    # The data of each entry, then the cache folder once for the whole batch.
+    assert num_fsyncs == 10 + hasattr(os, "O_DIRECTORY")
+    for i in range(10):
+        assert cache.try_load(f"key{i}") == "value"
+
+
+@test_utils.test(arch=qd.cpu)
+def test_cache_writer_async_store_kernel(tmp_path: pathlib.Path) -> None:
+    qd_init_same_arch(offline_cache_file_path=str(tmp_path), offline_cache=True, src_ll_cache_async_store=True)
+
+    @qd.kernel(fastcache=True)
+    def k1(a: qd.types.NDArray[qd.i32, 1]) -> None:
+        for i in range(a.shape[0]):
+            a[i] = i
+
+    k1(qd.ndarray(qd.i32, (4,)))
+    assert k1._primal.src_ll_cache_observations.cache_stored
+
+    # qd.init flushes the queued store before the next program starts looking up entries
+    qd_init_same_arch(offline_cache_file_path=str(tmp_path), offline_cache=True, src_ll_cache_async_store=True)
+    k1(qd.ndarray(qd.i32, (4,)))
+    assert k1._primal.src_ll_cache_observations.cache_loaded
@@ -0,0 +1,137 @@
+import os
+import pathlib
+
+import quadrants as qd
+from quadrants._test_tools import qd_init_same_arch
+from quadrants.lang._fast_caching import packed_cache
+from quadrants.lang._fast_caching.packed_cache import PackedPythonSideCache
+
+from tests import test_utils
+
+
+@test_utils.test()
+def test_packed_cache_store_load(tmp_path: pathlib.Path) -> None:
+    qd_init_same_arch(offline_cache_file_path=str(tmp_path), src_ll_cache_backend="packed")
+    cache = PackedPythonSideCache()
+    assert cache.try_load("key1") is None
+    cache.store("key1", "value1")
+    cache.store("key2", "välue2")
+    assert cache.try_load("key1") == "value1"
+    assert cache.try_load("key2") == "välue2"
+
+    # A fresh index, as in a new process, maps the pack written above.
+    pack_index = packed_cache._PackIndex(cache.pack_path)
+    assert pack_index.get("key1") == "value1"
+    assert pack_index.get("key2") == "välue2"
+    assert pack_index.get("key3") is None
+
+
+@test_utils.test()
+def test_packed_cache_latest_record_wins(tmp_path: pathlib.Path) -> None:
+    pack_path = str(tmp_path / packed_cache.PACK_FILENAME)
+    writer = packed_cache._PackIndex(pack_path)
+    writer.put("key", "old")
+    writer.put("key", "new")
+
+    reader = packed_cache._PackIndex(pack_path)
+    assert reader.get("key") == "new"
+
+
+@test_utils.test()
+def test_packed_cache_sees_records_of_other_writers(tmp_path: pathlib.Path) -> None:
+    pack_path = str(tmp_path / packed_cache.PACK_FILENAME)
+    writer = packed_cache._PackIndex(pack_path)
+    writer.put("key1", "value1")
+
+    reader = packed_cache._PackIndex(pack_path)
+    assert reader.get("key1") == "value1"
+    assert reader.get("key2") is None
+    writer.put("key2", "value2")
+    assert reader.get("key2") == "value2"
+
+
+@test_utils.test()
+def test_packed_cache_skips_torn_records(tmp_path: pathlib.Path) -> None:
+    pack_path = tmp_path / packed_cache.PACK_FILENAME
+    writer = packed_cache._PackIndex(str(pack_path))
+    writer.put("key1", "value1")
+    writer.put("key2", "value2")
+    data = bytearray(pack_path.read_bytes())
+    # corrupt the value of key1, and truncate a third record half-way, as a crash would
+    data[data.index(b"value1")] ^= 0xFF
+    third = packed_cache._encode_record(b"key3", b"value3")
+    data += third[: len(third) // 2]
+    pack_path.write_bytes(bytes(data))
+
+    reader = packed_cache._PackIndex(str(pack_path))
+    assert reader.get("key1") is None
+    assert reader.get("key2") == "value2"
+    assert reader.get("key3") is None
+
+
+@test_utils.test()
+def test_packed_cache_reloads_replaced_pack(tmp_path: pathlib.Path) -> None:
+    pack_path = tmp_path / packed_cache.PACK_FILENAME
+    writer = packed_cache._PackIndex(str(pack_path))
+    writer.put("key1", "value1")
+    reader = packed_cache._PackIndex(str(pack_path))
+    assert reader.get("key1") == "value1"
+
+    # Another process compacts the pack, then appends to it, past the size of the file mapped by the reader.
+    other_path = tmp_path / "other.pack"
+    other_path.write_bytes(
+        packed_cache._encode_record(b"key2", b"value2") + packed_cache._encode_record(b"key1", b"value1-new")
+    )
+    os.replace(other_path, pack_path)
+    assert reader.get("key2") == "value2"
+    assert reader.get("key1") == "value1-new"
+
+
+@test_utils.test()
+def test_packed_cache_checks_record_on_get(tmp_path: pathlib.Path) -> None:
+    pack_path = tmp_path / packed_cache.PACK_FILENAME
+    writer = packed_cache._PackIndex(str(pack_path))
+    writer.put("key1", "value1")
+    reader = packed_cache._PackIndex(str(pack_path))
+
+    # Overwrite the value in place, after the reader indexed it.
+    with open(pack_path, "r+b") as f:
+        f.seek(pack_path.read_bytes().index(b"value1"))
+        f.write(b"X")
+    assert reader.get("key1") is None
+
+
+@test_utils.test()
+def test_packed_cache_compacts_stale_records(monkeypatch, tmp_path: pathlib.Path) -> None:
+    monkeypatch.setattr(packed_cache, "_COMPACT_MIN_BYTES", 0)
+    pack_path = tmp_path / packed_cache.PACK_FILENAME
+    writer = packed_cache._PackIndex(str(pack_path))
+    for i in range(10):
+        writer.put("key", f"value{i}")
+    size_before = pack_path.stat().st_size
+
+    reader = packed_cache._PackIndex(str(pack_path))
+    assert pack_path.stat().st_size < size_before
+    assert reader.get("key") == "value9"
+
+
+@test_utils.test(arch=qd.cpu)
+def test_packed_cache_kernel_round_trip(tmp_path: pathlib.Path) -> None:
+    qd_init_same_arch(offline_cache_file_path=str(tmp_path), offline_cache=True, src_ll_cache_backend="packed")
+
+    @qd.kernel(fastcache=True)
+    def k1(a: qd.types.NDArray[qd.i32, 1]) -> None:
+        for i in range(a.shape[0]):
+            a[i] = i
+
+    a = qd.ndarray(qd.i32, (4,))
+    k1(a)
+    assert k1._primal.src_ll_cache_observations.cache_stored
+    assert not list(tmp_path.glob("python_side_cache/*.cache.txt"))
+    assert (tmp_path / "python_side_cache" / packed_cache.PACK_FILENAME).exists()
+
+    qd_init_same_arch(offline_cache_file_path=str(tmp_path), offline_cache=True, src_ll_cache_backend="packed")
+    a = qd.ndarray(qd.i32, (4,))
+    k1(a)
+    assert k1._primal.src_ll_cache_observations.cache_loaded
+    assert a.to_numpy().tolist() == [0, 1, 2, 3]
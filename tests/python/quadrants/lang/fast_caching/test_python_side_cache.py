@@ -0,0 +1,100 @@
+import os
+import pathlib
+import time
+
+import quadrants as qd
+from quadrants._test_tools import qd_init_same_arch
+from quadrants.lang._fast_caching import python_side_cache
+from quadrants.lang._fast_caching.python_side_cache import PythonSideCache
+
+from tests import test_utils
+
+
+def _write_entries(cache_folder: pathlib.Path, num_entries: int, size: int) -> list[pathlib.Path]:
+    cache_folder.mkdir(parents=True, exist_ok=True)
+    paths = []
+    now = time.time()
+    for i in range(num_entries):
+        path = cache_folder / f"key{i}{python_side_cache.CACHE_FILE_SUFFIX}"
+        path.write_text("x" * size)
+        # oldest first
+        os.utime(path, (now - num_entries + i, now - num_entries + i))
+        paths.append(path)
+    return paths
+
+
+@test_utils.test()
+def test_python_side_cache_evict_lru_max_entries(tmp_path: pathlib.Path) -> None:
+    paths = _write_entries(tmp_path, 5, 10)
+    (tmp_path / "unrelated.tmp").write_text("ignored")
+
+    eviction = python_side_cache.evict_lru(str(tmp_path), max_entries=3)
+    assert eviction.num_removed == 2
+    assert eviction.bytes_removed == 20
+    assert eviction.num_remaining == 3
+    assert [p.exists() for p in paths] == [False, False, True, True, True]
+    assert (tmp_path / "unrelated.tmp").exists()
+
+
+@test_utils.test()
+def test_python_side_cache_evict_lru_max_bytes(tmp_path: pathlib.Path) -> None:
+    paths = _write_entries(tmp_path, 4, 100)
+    # reading bumps the mtime, so the first entry becomes the most recently used one
+    os.utime(paths[0], None)
+
+    eviction = python_side_cache.evict_lru(str(tmp_path), max_bytes=250)
+    assert eviction.num_removed == 2
+    assert eviction.bytes_remaining == 200
+    assert [p.exists() for p in paths] == [True, False, False, True]
+
+    usage = python_side_cache.get_usage(str(tmp_path))
+    assert usage.num_entries == 2
+    assert usage.total_bytes == 200
+
+
+@test_utils.test()
+def test_python_side_cache_evict_lru_unlimited(tmp_path: pathlib.Path) -> None:
+    _write_entries(tmp_path, 3, 10)
+    eviction = python_side_cache.evict_lru(str(tmp_path))
+    assert eviction.num_removed == 0
+    assert eviction.num_remaining == 3
+
+
+@test_utils.test()
+def test_python_side_cache_store_evicts_in_background(tmp_path: pathlib.Path) -> None:
+    qd_init_same_arch(offline_cache_file_path=str(tmp_path), src_ll_cache_max_entries=2)
+    cache = PythonSideCache()
+    for i in range(5):
+        cache.store(f"key{i}", "value")
+        # distinct mtimes, so that LRU order is well defined
+        os.utime(cache._get_filepath(f"key{i}"), (i, i))
+
+    deadline = time.time() + 10
+    while python_side_cache.get_usage(cache.cache_folder).num_entries > 2 and time.time() < deadline:
+        time.sleep(0.01)
+    assert python_side_cache.get_usage(cache.cache_folder).num_entries == 2
+
+
+@test_utils.test()
+def test_python_side_cache_try_load_evicted(tmp_path: pathlib.Path) -> None:
+    qd_init_same_arch(offline_cache_file_path=str(tmp_path))
+    cache = PythonSideCache()
+    cache.store("key", "value")
+    assert cache.try_load("key") == "value"
+    os.remove(cache._get_filepath("key"))
+    assert cache.try_load("key") is None
+    # touching an evicted entry must not resurrect it as an empty file
+    cache._touch(cache._get_filepath("key"))
+    assert not os.path.exists(cache._get_filepath("key"))
+
+
+@test_utils.test()
+def test_fastcache_tools(tmp_path: pathlib.Path) -> None:
+    _write_entries(tmp_path / python_side_cache.CACHE_FOLDER_NAME, 4, 10)
+    usage = qd.tools.fastcache_report(str(tmp_path))
+    assert usage.num_entries == 4
+    assert usage.total_bytes == 40
+
+    eviction = qd.tools.fastcache_trim(max_entries=1, offline_cache_file_path=str(tmp_path))
+    assert eviction.num_removed == 3
+    assert qd.tools.fastcache_report(str(tmp_path)).num_entries == 1
@@ -0,0 +1,110 @@
+import os
+import pathlib
+import time
+
+import quadrants as qd
+from quadrants._test_tools import qd_init_same_arch
+from quadrants.lang import _wrap_inspect
+from quadrants.lang._fast_caching import (
+    function_hasher,
+    python_side_cache,
+    source_hash_memo,
+)
+from quadrants.lang._fast_caching.source_hash_memo import SourceHashMemo
+
+from tests import test_utils
+
+
+def _write_source(filepath: pathlib.Path, text: str, age_s: float = 60.0) -> None:
+    filepath.write_text(text)
+    then = time.time() - age_s
+    os.utime(filepath, (then, then))
+
+
+class _CountingHasher:
+    def __init__(self) -> None:
+        self.num_calls = 0
+
+    def __call__(self, info: _wrap_inspect.FunctionSourceInfo) -> str:
+        self.num_calls += 1
+        return function_hasher._hash_source(info)
+
+
+@test_utils.test()
+def test_source_hash_memo_persists_across_processes(monkeypatch, tmp_path: pathlib.Path) -> None:
+    # os.utime bumps the ctime, so the file counts as just modified.
+    monkeypatch.setattr(source_hash_memo, "_RACY_WINDOW_NS", 0)
+    source = tmp_path / "mod.py"
+    _write_source(source, "def f():\n    pass\n\ndef g():\n    pass\n")
+    memo_path = str(tmp_path / "memo" / source_hash_memo.MEMO_FILENAME)
+    f_info = _wrap_inspect.FunctionSourceInfo(function_name="f", filepath=str(source), start_lineno=0, end_lineno=1)
+    g_info = _wrap_inspect.FunctionSourceInfo(function_name="g", filepath=str(source), start_lineno=3, end_lineno=4)
+    hasher = _CountingHasher()
+
+    memo = SourceHashMemo(memo_path)
+    f_hash = memo.hash_function(f_info, hasher)
+    g_hash = memo.hash_function(g_info, hasher)
+    assert memo.hash_function(f_info, hasher) == f_hash
+    assert hasher.num_calls == 2
+    memo.flush()
+
+    # as a new process would
+    memo = SourceHashMemo(memo_path)
+    assert memo.hash_function(f_info, hasher) == f_hash
+    assert memo.hash_function(g_info, hasher) == g_hash
+    assert hasher.num_calls == 2
+    assert memo.num_hits == 2
+
+
+@test_utils.test()
+def test_source_hash_memo_invalidated_on_change(monkeypatch, tmp_path: pathlib.Path) -> None:
+    monkeypatch.setattr(source_hash_memo, "_RACY_WINDOW_NS", 0)
+    source = tmp_path / "mod.py"
+    _write_source(source, "def f():\n    pass\n")
+    memo_path = str(tmp_path / source_hash_memo.MEMO_FILENAME)
+    info = _wrap_inspect.FunctionSourceInfo(function_name="f", filepath=str(source), start_lineno=0, end_lineno=1)
+    hasher = _CountingHasher()
+
+    memo = SourceHashMemo(memo_path)
+    old_hash = memo.hash_function(info, hasher)
+    memo.flush()
+
+    # Same size and mtime, only the content differs.
+    stat = os.stat(source)
+    source.write_text("def f():\n    pas5\n")
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    memo = SourceHashMemo(memo_path)
+    new_hash = memo.hash_function(info, hasher)
+    assert new_hash != old_hash
+    assert new_hash == function_hasher._hash_source(info)
+    assert hasher.num_calls == 2
+
+
+@test_utils.test()
+def test_source_hash_memo_skips_recently_modified_files(tmp_path: pathlib.Path) -> None:
+    source = tmp_path / "mod.py"
+    source.write_text("def f():\n    pass\n")
+    info = _wrap_inspect.FunctionSourceInfo(function_name="f", filepath=str(source), start_lineno=0, end_lineno=1)
+    hasher = _CountingHasher()
+
+    memo = SourceHashMemo(str(tmp_path / source_hash_memo.MEMO_FILENAME))
+    memo.hash_function(info, hasher)
+    memo.hash_function(info, hasher)
+    assert hasher.num_calls == 2
+
+
+@test_utils.test(arch=qd.cpu)
+def test_source_hash_memo_written_on_reset(tmp_path: pathlib.Path) -> None:
+    qd_init_same_arch(offline_cache_file_path=str(tmp_path), offline_cache=True)
+
+    @qd.kernel(fastcache=True)
+    def k1(a: qd.types.NDArray[qd.i32, 1]) -> None:
+        for i in range(a.shape[0]):
+            a[i] = i
+
+    a = qd.ndarray(qd.i32, (4,))
+    k1(a)
+    qd.reset()
+    memo_path = pathlib.Path(python_side_cache.get_cache_folder(str(tmp_path))) / source_hash_memo.MEMO_FILENAME
+    assert memo_path.is_file()
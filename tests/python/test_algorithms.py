@@ -9,7 +9,8 @@ Covers:
 - ``qd.algorithms.reduce_by_key_add`` - composable scan + scatter + atomic_add reduce-by-key.
 
 Each test runs across the full ``arch=qd.gpu`` parametrization so the kernels are exercised on CUDA, AMDGPU, Vulkan,
-and Metal (where the host supports each).
+and Metal (where the host supports each); the composition tests also run on the CPU backend, which emits tile-serial
+phases.
 """
 
 import math
@@ -136,6 +137,9 @@ def _skip_if_dtype_unsupported(dtype):
 # Reduce-by-key (f32 values): adds an atomic_add reordering layer on top of scan-style scatter; uses the
 # ``_F32_LARGE_N_*`` floor so MoltenVK's reordering stays comfortably bounded.
 #
+# CPU backend: each tile of ``BLOCK_DIM`` elements is folded serially, adding at most ``BLOCK_DIM * eps_f32 ~ 3e-5``
+# relative error per tile on top of the tree above it - inside every tolerance below.
+#
 # f64: strict-IEEE ``eps_f64 ~ 2.2e-16`` dominates everything; reordering is irrelevant at f64 precision for any
 # tested N.
 
@@ -267,7 +271,7 @@ def _reduce_host(rng, op, dtype, N):
 @pytest.mark.parametrize("op", _REDUCE_OPS)
 @pytest.mark.parametrize("N", [1, 255, 256, 257, 1024, 65537])
 @pytest.mark.parametrize("dtype", [qd.i32, qd.f32, qd.u64])
-@test_utils.test(arch=qd.gpu)
+@test_utils.test(arch=[qd.cpu, *qd.gpu])
 def test_reduce_composition(op, dtype, N):
     """``reduce_{add,min,max}`` compose at the **top level** of a user ``@qd.kernel`` with a device-resident count
     (``count[0]``) and a compile-time ``log256_max_n``, matching the host ``reduce_*`` entries. This pins the
@@ -404,7 +408,7 @@ def _verify_scan(got, op, dtype, N, host):
 @pytest.mark.parametrize("op", _SCAN_OPS)
 @pytest.mark.parametrize("N", [1, 255, 256, 257, 1024, 65537])
 @pytest.mark.parametrize("dtype", [qd.i32, qd.f32, qd.u64])
-@test_utils.test(arch=qd.gpu)
+@test_utils.test(arch=[qd.cpu, *qd.gpu])
 def test_exclusive_scan_composition(op, dtype, N):
     """``exclusive_scan_{add,min,max}`` compose at the **top level** of a user ``@qd.kernel`` with a device-resident
     count (``count[0]``) and a compile-time ``log256_max_n``, matching the host ``exclusive_scan_*`` entries. This pins
@@ -453,7 +457,7 @@ def test_exclusive_scan_composition(op, dtype, N):
 
 @pytest.mark.parametrize("N", [1, 255, 256, 257, 1024, 65537])
 @pytest.mark.parametrize("dtype", [qd.i32, qd.f32, qd.u64])
-@test_utils.test(arch=qd.gpu)
+@test_utils.test(arch=[qd.cpu, *qd.gpu])
 def test_select_composition(dtype, N):
     """``select`` composes at the **top level** of a user ``@qd.kernel`` with a device-resident count (``count[0]``) and
     a compile-time ``log256_max_n``, matching the host ``select`` entry. This pins the graph-composable compaction path
@@ -537,7 +541,7 @@ def _gen_keys(rng, dtype, N):
 
 @pytest.mark.parametrize("N", [257, 1024, 65536])
 @pytest.mark.parametrize("dtype", _RADIX_KEY_DTYPES)
-@test_utils.test(arch=qd.gpu)
+@test_utils.test(arch=[qd.cpu, *qd.gpu])
 def test_sort_composition(dtype, N):
     """``sort`` composes at the **top level** of a user ``@qd.kernel`` with a device-resident 0-d count (read as
     ``n[()]``) and compile-time ``key_dtype`` / ``has_values`` / ``end_bit`` / ``log256_max_n`` - the exact
@@ -632,7 +636,7 @@ def _gen_run_keys(rng, dtype, N):
 @pytest.mark.parametrize("N", [1, 255, 256, 257, 1024, 65537])
 @pytest.mark.parametrize("key_dtype", [qd.i32, qd.f32])
 @pytest.mark.parametrize("val_dtype", [qd.i32, qd.f32])
-@test_utils.test(arch=qd.gpu)
+@test_utils.test(arch=[qd.cpu, *qd.gpu])
 def test_reduce_by_key_add_composition(key_dtype, val_dtype, N):
     """``reduce_by_key_add`` composes at the **top level** of a user ``@qd.kernel`` with a device-resident count
     (``count[0]``), a compile-time ``log256_max_n``, and the values dtype as a template (needed only for the zero-init
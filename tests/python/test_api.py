@@ -123,6 +123,7 @@ user_api[qd] = [
     "bit_cast",
     "bit_shr",
     "block_local",
+    "cache",
     "cache_read_only",
     "cast",
     "ceil",
@@ -209,6 +210,7 @@ user_api[qd] = [
     "perf_dispatch",
     "polar_decompose",
     "pow",
+    "precompile",
     "profiler",
     "pure",
     "pyfunc",
@@ -240,6 +242,8 @@ user_api[qd] = [
     "svd",
     "sym_eig",
     "sync",
+    "sync_cache",
+    "sync_tiered_compilation",
     "tan",
     "tanh",
     "template",
@@ -262,6 +266,7 @@ user_api[qd] = [
     "x86_64",
     "zero",
 ]
+user_api[qd.cache] = ["export_bundle", "import_bundle", "reset_stats", "stats"]
 user_api[qd.graph] = [
     "do_while",
     "parallel",
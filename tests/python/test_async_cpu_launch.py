@@ -0,0 +1,84 @@
+import numpy as np
+import pytest
+
+import quadrants as qd
+
+from tests import test_utils
+
+
+@test_utils.test(arch=qd.cpu, async_cpu_launch=True)
+def test_async_cpu_launch_ndarray() -> None:
+    @qd.kernel
+    def add(a: qd.types.NDArray[qd.i32, 1], value: qd.i32) -> None:
+        for i in range(a.shape[0]):
+            a[i] += value
+
+    a = qd.ndarray(qd.i32, (16,))
+    for i in range(10):
+        add(a, i)
+    # Reading the ndarray back waits for the deferred launches.
+    assert a.to_numpy().tolist() == [45] * 16
+    add(a, 1)
+    assert a[3] == 46
+
+
+@test_utils.test(arch=qd.cpu, async_cpu_launch=True)
+def test_async_cpu_launch_field() -> None:
+    x = qd.field(qd.f32, shape=(8,))
+
+    @qd.kernel
+    def scale(k: qd.f32) -> None:
+        for i in x:
+            x[i] = x[i] * k + 1.0
+
+    for _ in range(3):
+        scale(2.0)
+    qd.sync()
+    assert x.to_numpy().tolist() == [7.0] * 8
+
+
+@test_utils.test(arch=qd.cpu, async_cpu_launch=True)
+def test_async_cpu_launch_return_and_external_array() -> None:
+    @qd.kernel
+    def fill(a: qd.types.NDArray[qd.f32, 1], value: qd.f32) -> None:
+        for i in range(a.shape[0]):
+            a[i] = value
+
+    @qd.kernel
+    def total(a: qd.types.NDArray[qd.f32, 1]) -> qd.f32:
+        s = 0.0
+        for i in range(a.shape[0]):
+            s += a[i]
+        return s
+
+    a = qd.ndarray(qd.f32, (4,))
+    fill(a, 2.0)
+    # Kernels returning values, or taking numpy arrays, run after the deferred launches.
+    assert total(a) == pytest.approx(8.0)
+    b = np.zeros(4, dtype=np.float32)
+    fill(b, 3.0)
+    assert b.tolist() == [3.0] * 4
+
+
+@test_utils.test(arch=qd.cpu, async_cpu_launch=True, require=qd.extension.assertion, debug=True, gdb_trigger=False)
+def test_async_cpu_launch_error_raised_by_sync() -> None:
+    @qd.kernel
+    def check(a: qd.types.NDArray[qd.i32, 1], value: qd.i32) -> None:
+        for i in range(a.shape[0]):
+            assert a[i] == value
+
+    @qd.kernel
+    def add(a: qd.types.NDArray[qd.i32, 1], value: qd.i32) -> None:
+        for i in range(a.shape[0]):
+            a[i] += value
+
+    a = qd.ndarray(qd.i32, (4,))
+    check(a, 1)
+    # Launches deferred after the failing one are skipped, as if it had raised right away.
+    add(a, 1)
+    with pytest.raises(AssertionError):
+        qd.sync()
+    # The error is only raised once, and later launches run again.
+    add(a, 2)
+    qd.sync()
+    assert a.to_numpy().tolist() == [2] * 4
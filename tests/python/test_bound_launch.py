@@ -0,0 +1,192 @@
+import pytest
+
+import quadrants as qd
+
+from tests import test_utils
+
+
+@test_utils.test()
+def test_bind() -> None:
+    @qd.kernel
+    def add(a: qd.types.NDArray[qd.f32, 1], b: qd.types.NDArray[qd.f32, 1], value: qd.f32) -> None:
+        for i in range(a.shape[0]):
+            a[i] += b[i] + value
+
+    a = qd.ndarray(qd.f32, (4,))
+    b = qd.ndarray(qd.f32, (4,))
+    b.fill(1.0)
+    bound = add.bind(a, b, 0.5)
+    for _ in range(3):
+        bound.launch()
+    assert a.to_numpy().tolist() == [4.5] * 4
+    assert add._primal.compiled_kernel_data_by_key
+
+
+@test_utils.test()
+def test_bind_mutable() -> None:
+    @qd.kernel
+    def fill(a: qd.types.NDArray[qd.i32, 1], value: qd.i32, offset: qd.u32) -> None:
+        for i in range(a.shape[0]):
+            a[i] = value + offset
+
+    a = qd.ndarray(qd.i32, (4,))
+    bound = fill.bind(a, 1, 10, mutable=["value"])
+    bound.launch()
+    assert a.to_numpy().tolist() == [11] * 4
+    bound.launch(5)
+    assert a.to_numpy().tolist() == [15] * 4
+    # The last values are kept.
+    bound.launch()
+    assert a.to_numpy().tolist() == [15] * 4
+    with pytest.raises(TypeError):
+        bound.launch(1, 2)
+
+
+@test_utils.test()
+def test_bind_return() -> None:
+    @qd.kernel
+    def total(a: qd.types.NDArray[qd.f32, 1], scale: qd.f32) -> qd.f32:
+        s = 0.0
+        for i in range(a.shape[0]):
+            s += a[i] * scale
+        return s
+
+    a = qd.ndarray(qd.f32, (4,))
+    a.fill(1.0)
+    bound = total.bind(a, 1.0, mutable=["scale"])
+    assert bound.launch() == pytest.approx(4.0)
+    assert bound.launch(2.0) == pytest.approx(8.0)
+
+
+@test_utils.test()
+def test_bind_async_return() -> None:
+    @qd.kernel(async_return=True)
+    def total(a: qd.types.NDArray[qd.f32, 1], scale: qd.f32) -> qd.f32:
+        s = 0.0
+        for i in range(a.shape[0]):
+            s += a[i] * scale
+        return s
+
+    a = qd.ndarray(qd.f32, (4,))
+    a.fill(1.0)
+    bound = total.bind(a, 1.0, mutable=["scale"])
+    futures = [bound.launch(float(i)) for i in range(3)]
+    assert all(isinstance(future, qd.KernelFuture) for future in futures)
+    assert [future.result() for future in futures] == [pytest.approx(4.0 * i) for i in range(3)]
+
+
+@test_utils.test()
+def test_bind_rejects_non_scalar_mutable() -> None:
+    @qd.kernel
+    def fill(a: qd.types.NDArray[qd.i32, 1], value: qd.i32) -> None:
+        for i in range(a.shape[0]):
+            a[i] = value
+
+    a = qd.ndarray(qd.i32, (4,))
+    with pytest.raises(ValueError):
+        fill.bind(a, 1, mutable=["a"])
+    with pytest.raises(ValueError):
+        fill.bind(a, 1, mutable=["missing"])
+
+
+@test_utils.test()
+def test_bind_data_oriented() -> None:
+    @qd.data_oriented
+    class Sim:
+        def __init__(self) -> None:
+            self.x = qd.ndarray(qd.f32, (4,))
+
+        @qd.kernel
+        def step(self, dt: qd.f32) -> None:
+            for i in range(self.x.shape[0]):
+                self.x[i] += dt
+
+    sim = Sim()
+    bound = sim.step.bind(0.0, mutable=["dt"])
+    bound.launch(0.25)
+    bound.launch(0.25)
+    assert sim.x.to_numpy().tolist() == [0.5] * 4
+
+
+@test_utils.test()
+def test_bind_invalid_after_reset() -> None:
+    @qd.kernel
+    def fill(a: qd.types.NDArray[qd.i32, 1]) -> None:
+        for i in range(a.shape[0]):
+            a[i] = 1
+
+    a = qd.ndarray(qd.i32, (4,))
+    bound = fill.bind(a)
+    qd.reset()
+    with pytest.raises(RuntimeError):
+        bound.launch()
+
+
+@test_utils.test()
+def test_bind_rejects_autodiff() -> None:
+    loss = qd.field(qd.f32, shape=(), needs_grad=True, needs_dual=True)
+    x = qd.field(qd.f32, shape=(), needs_grad=True, needs_dual=True)
+
+    @qd.kernel
+    def func() -> None:
+        loss[None] = 2 * x[None]
+
+    bound = func.bind()
+    with pytest.raises(RuntimeError, match="autodiff"):
+        with qd.ad.Tape(loss):
+            bound.launch()
+    with pytest.raises(RuntimeError, match="autodiff"):
+        with qd.ad.FwdMode(loss=loss, param=x, seed=[1.0]):
+            bound.launch()
+
+
+@test_utils.test()
+def test_launch_many() -> None:
+    @qd.kernel
+    def add(a: qd.types.NDArray[qd.i32, 1], value: qd.i32) -> None:
+        for i in range(a.shape[0]):
+            a[i] += value
+
+    arrays = [qd.ndarray(qd.i32, (4,)) for _ in range(3)]
+    arg_tuples = [(a, i + 1) for i, a in enumerate(arrays)]
+    add.launch_many(arg_tuples)
+    assert add._primal.launch_many_cache is not None
+    # Same argument objects: the launch contexts of the first call are reused.
+    add.launch_many(arg_tuples)
+    for i, a in enumerate(arrays):
+        assert a.to_numpy().tolist() == [2 * (i + 1)] * 4
+
+
+@test_utils.test()
+def test_launch_many_specializations() -> None:
+    @qd.kernel
+    def fill(a: qd.types.NDArray[qd.f32, 1], value: qd.template()) -> None:
+        for i in range(a.shape[0]):
+            a[i] = value
+
+    a = qd.ndarray(qd.f32, (4,))
+    b = qd.ndarray(qd.f32, (2,))
+    fill.launch_many([(a, 1), (b, 2)])
+    assert len(fill._primal.compiled_kernel_data_by_key) == 2
+    assert a.to_numpy().tolist() == [1.0] * 4
+    assert b.to_numpy().tolist() == [2.0] * 2
+
+    c = qd.ndarray(qd.f32, (3,))
+    fill.launch_many([(c, 1)])
+    assert c.to_numpy().tolist() == [1.0] * 3
+
+
+@test_utils.test()
+def test_launch_many_rejects_return_values() -> None:
+    @qd.kernel
+    def total(a: qd.types.NDArray[qd.f32, 1]) -> qd.f32:
+        s = 0.0
+        for i in range(a.shape[0]):
+            s += a[i]
+        return s
+
+    a = qd.ndarray(qd.f32, (4,))
+    with pytest.raises(RuntimeError, match="returning values"):
+        total.launch_many([(a,)])
+    # Rejected before compiling anything.
+    assert not total._primal.compiled_kernel_data_by_key
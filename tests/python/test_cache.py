@@ -1,7 +1,12 @@
+import dataclasses
 import pathlib
+from typing import Any
+
+import pytest
 
 import quadrants as qd
 from quadrants._test_tools import qd_init_same_arch
+from quadrants.lang.kernel import _shared_launch_args_cache
 from quadrants.lang.misc import get_host_arch_list
 
 from tests import test_utils
@@ -258,3 +263,110 @@ def test_fastcache(tmp_path: pathlib.Path, monkeypatch):
     assert is_valid
     assert value[None] == 4
     assert len(fun._primal.compiled_kernel_data_by_key) == 1
+
+
+@test_utils.test(arch=get_host_arch_list())
+def test_cache_identity_fast_path():
+    @qd.data_oriented
+    class IdentityState:
+        def __init__(self, x):
+            self.x = x
+
+    @qd.kernel
+    def fun(state: qd.template(), offset: qd.i32):
+        for i in range(state.x.shape[0]):
+            state.x[i] = state.x[i] + offset
+
+    x_i32 = qd.ndarray(qd.i32, shape=(4,))
+    x_f32 = qd.ndarray(qd.f32, shape=(4,))
+    state = IdentityState(x_i32)
+    mapper = fun._primal.mapper
+
+    fun(state, 1)
+    assert len(mapper._identity_cache) == 1
+    extract = mapper.extract
+    mapper.extract = None
+    try:
+        fun(state, 1)
+    finally:
+        mapper.extract = extract
+    assert x_i32.to_numpy().tolist() == [2] * 4
+
+    # Reassigning an ndarray member invalidates the fast path, so the new dtype gets its own specialization.
+    state.x = x_f32
+    fun(state, 1)
+    assert x_f32.to_numpy().tolist() == [1.0] * 4
+    assert len(mapper.mapping) == 2
+    assert len(mapper._identity_cache) == 1
+
+
+@pytest.mark.parametrize("dataclass_kwargs", [{"eq": False}, {"unsafe_hash": True}])
+@test_utils.test(arch=get_host_arch_list())
+def test_cache_identity_fast_path_hashable_mutable_container(dataclass_kwargs):
+    @dataclasses.dataclass(**dataclass_kwargs)
+    class Buffers:
+        x: Any
+
+    @qd.data_oriented
+    class IdentityState:
+        def __init__(self, buffers):
+            self.buffers = buffers
+
+    @qd.kernel
+    def fun(state: qd.template(), offset: qd.i32):
+        for i in range(state.buffers.x.shape[0]):
+            state.buffers.x[i] = state.buffers.x[i] + offset
+
+    x_i32 = qd.ndarray(qd.i32, shape=(4,))
+    x_f32 = qd.ndarray(qd.f32, shape=(4,))
+    buffers = Buffers(x_i32)
+    state = IdentityState(buffers)
+    mapper = fun._primal.mapper
+
+    fun(state, 1)
+    fun(state, 1)
+    assert x_i32.to_numpy().tolist() == [2] * 4
+
+    # The dataclass is hashable, but its members can still be rebound without going through a hooked __setattr__.
+    buffers.x = x_f32
+    fun(state, 1)
+    fun(state, 1)
+    assert x_f32.to_numpy().tolist() == [2.0] * 4
+    assert x_i32.to_numpy().tolist() == [2] * 4
+    assert len(mapper.mapping) == 2
+
+
+@test_utils.test(arch=get_host_arch_list())
+def test_cache_shared_across_kernels():
+    @dataclasses.dataclass(frozen=True)
+    class SharedState:
+        a: qd.types.NDArray[qd.i32, 1]
+        b: qd.types.NDArray[qd.i32, 1]
+
+    @qd.kernel
+    def fun1(state: SharedState, offset: qd.i32):
+        for i in range(state.a.shape[0]):
+            state.a[i] = state.b[i] + offset
+
+    @qd.kernel
+    def fun2(state: SharedState, offset: qd.i32):
+        for i in range(state.a.shape[0]):
+            state.b[i] = state.a[i] + offset
+
+    shared_cache = _shared_launch_args_cache
+    state = SharedState(a=qd.ndarray(qd.i32, shape=(4,)), b=qd.ndarray(qd.i32, shape=(4,)))
+    fun1(state, 1)
+    num_buffers = len(shared_cache._launch_ctx_buffers)
+    assert num_buffers >= 1
+
+    # fun2 has the same launch layout, so that it reuses the buffer built by fun1 instead of walking the args.
+    set_launch_ctx_args = fun2._primal._set_launch_ctx_args
+    fun2._primal._set_launch_ctx_args = None
+    try:
+        fun2(state, 1)
+    finally:
+        fun2._primal._set_launch_ctx_args = set_launch_ctx_args
+    assert state.b.to_numpy().tolist() == [2] * 4
+    assert fun2._primal.launch_stats == fun1._primal.launch_stats
+    assert len(fun2._primal.launch_context_buffer_cache._launch_ctx_cache) == 1
+    assert len(shared_cache._launch_ctx_buffers) == num_buffers
@@ -990,3 +990,51 @@ def test_data_oriented_attribute_cycle_does_not_recurse_infinitely():
     run(sim)
     np.testing.assert_array_equal(sim.solver.a.to_numpy(), np.arange(N) + 7)
     run(sim)
+
+
+# ---------------------------------------------------------------------------
+# 25. Many ndarray members, across nested containers. The launch path resolves them through per-specialization leaf
+# getters (``_make_struct_leaf_getters`` in kernel.py), one attrgetter per template arg; they must bind every member to
+# the right kernel arg, and pick up reassigned members of mutable containers.
+# ---------------------------------------------------------------------------
+
+
+@test_utils.test(arch=qd.cpu)
+def test_data_oriented_many_ndarrays_leaf_getters():
+    N = 4
+
+    @qd.data_oriented
+    class Inner:
+        def __init__(self):
+            self.c = qd.ndarray(qd.i32, shape=(N,))
+            self.d = qd.ndarray(qd.i32, shape=(N,))
+
+    @dataclasses.dataclass(frozen=True)
+    class State:
+        a: qd.types.NDArray[qd.i32, 1]
+        b: qd.types.NDArray[qd.i32, 1]
+        inner: Inner
+
+    state = State(a=qd.ndarray(qd.i32, shape=(N,)), b=qd.ndarray(qd.i32, shape=(N,)), inner=Inner())
+
+    @qd.kernel
+    def run(s: qd.template(), offset: qd.i32):
+        for i in range(N):
+            s.a[i] = i + offset
+            s.b[i] = i + offset + 10
+            s.inner.c[i] = i + offset + 20
+            s.inner.d[i] = i + offset + 30
+
+    for offset in (0, 100):
+        run(state, offset)
+        np.testing.assert_array_equal(state.a.to_numpy(), np.arange(N) + offset)
+        np.testing.assert_array_equal(state.b.to_numpy(), np.arange(N) + offset + 10)
+        np.testing.assert_array_equal(state.inner.c.to_numpy(), np.arange(N) + offset + 20)
+        np.testing.assert_array_equal(state.inner.d.to_numpy(), np.arange(N) + offset + 30)
+    assert len(run._primal._struct_ndarray_getters_by_key) == 1
+
+    old_d = state.inner.d
+    state.inner.d = qd.ndarray(qd.i32, shape=(N,))
+    run(state, 1)
+    np.testing.assert_array_equal(state.inner.d.to_numpy(), np.arange(N) + 31)
+    np.testing.assert_array_equal(old_d.to_numpy(), np.arange(N) + 130)
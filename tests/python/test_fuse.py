@@ -0,0 +1,198 @@
+import numpy as np
+import pytest
+
+import quadrants as qd
+from quadrants.lang import impl
+
+from tests import test_utils
+
+
+def _num_offloaded_tasks():
+    return impl.get_runtime().prog.get_num_offloaded_tasks_on_last_call()
+
+
+@test_utils.test()
+def test_fuse_fields():
+    n = 32
+    x = qd.field(qd.f32, shape=n)
+    y = qd.field(qd.f32, shape=n)
+    z = qd.field(qd.f32, shape=n)
+
+    @qd.kernel
+    def scale(k: qd.f32):
+        for i in range(n):
+            y[i] = x[i] * k
+
+    @qd.kernel
+    def shift(k: qd.f32, offset: qd.f32):
+        for i in range(n):
+            z[i] = y[i] + offset * k
+
+    x.from_numpy(np.arange(n, dtype=np.float32))
+    scale(2.0)
+    num_tasks = _num_offloaded_tasks()
+    shift(2.0, 1.0)
+    num_tasks += _num_offloaded_tasks()
+
+    step = qd.fuse(scale, shift)
+    y.fill(0)
+    z.fill(0)
+    step(3.0, 1.0)
+    assert _num_offloaded_tasks() < num_tasks
+    np.testing.assert_allclose(y.to_numpy(), np.arange(n) * 3.0)
+    np.testing.assert_allclose(z.to_numpy(), np.arange(n) * 3.0 + 3.0)
+
+
+@test_utils.test(arch=[qd.cpu, qd.cuda, qd.amdgpu])
+def test_fuse_ndarrays():
+    @qd.kernel
+    def square(a: qd.types.NDArray[qd.f32, 1], b: qd.types.NDArray[qd.f32, 1]):
+        for i in range(b.shape[0]):
+            b[i] = a[i] * a[i]
+
+    @qd.kernel
+    def accumulate(b: qd.types.NDArray[qd.f32, 1], c: qd.types.NDArray[qd.f32, 1]):
+        for i in range(b.shape[0]):
+            c[i] += b[i]
+
+    a = qd.ndarray(qd.f32, (64,))
+    b = qd.ndarray(qd.f32, (64,))
+    c = qd.ndarray(qd.f32, (64,))
+    a.from_numpy(np.arange(64, dtype=np.float32))
+    square(a, b)
+    num_tasks = _num_offloaded_tasks()
+    accumulate(b, c)
+    num_tasks += _num_offloaded_tasks()
+
+    step = qd.fuse(square, accumulate)
+    c.fill(0)
+    for _ in range(3):
+        step(a, b, c)
+    assert _num_offloaded_tasks() < num_tasks
+    np.testing.assert_allclose(c.to_numpy(), np.arange(64) ** 2 * 3.0)
+
+
+@test_utils.test()
+def test_fuse_keeps_cross_iteration_dependencies():
+    n = 16
+    x = qd.field(qd.i32, shape=n)
+    y = qd.field(qd.i32, shape=n)
+
+    @qd.kernel
+    def fill():
+        for i in range(n):
+            x[i] = i
+
+    @qd.kernel
+    def rotate():
+        for i in range(n):
+            y[i] = x[(i + 1) % n]
+
+    fill()
+    num_tasks = _num_offloaded_tasks()
+    rotate()
+    num_tasks += _num_offloaded_tasks()
+
+    step = qd.fuse(fill, rotate)
+    x.fill(0)
+    step()
+    # Each iteration of rotate reads what another iteration of fill writes, so the loops are not fused.
+    assert _num_offloaded_tasks() == num_tasks
+    assert y.to_numpy().tolist() == [(i + 1) % n for i in range(n)]
+
+
+@test_utils.test()
+def test_fuse_aliased_ndarray_arguments():
+    n = 16
+
+    @qd.kernel
+    def fill(a: qd.types.NDArray[qd.i32, 1]):
+        for i in range(n):
+            a[i] = i
+
+    @qd.kernel
+    def rotate(b: qd.types.NDArray[qd.i32, 1], c: qd.types.NDArray[qd.i32, 1]):
+        for i in range(n):
+            c[i] = b[(i + 1) % n]
+
+    step = qd.fuse(fill, rotate)
+    x = qd.ndarray(qd.i32, (n,))
+    y = qd.ndarray(qd.i32, (n,))
+    # a and b are the same ndarray, so rotate reads elements written by other iterations of fill.
+    step(x, x, y)
+    assert y.to_numpy().tolist() == [(i + 1) % n for i in range(n)]
+
+
+@test_utils.test(arch=qd.cpu)
+def test_fuse_rejects_kernels_returning_values():
+    @qd.kernel
+    def total() -> qd.i32:
+        return 1
+
+    with pytest.raises(qd.QuadrantsSyntaxError, match="returning values"):
+        qd.fuse(total)
+
+
+@test_utils.test()
+def test_fuse_loops_within_kernel():
+    n = 32
+    x = qd.field(qd.f32, shape=n)
+    y = qd.field(qd.f32, shape=n)
+
+    @qd.kernel
+    def fused():
+        for i in range(n):
+            x[i] = i
+        for i in range(n):
+            y[i] = x[i] * 2.0
+
+    @qd.kernel
+    def not_fused():
+        for i in range(n):
+            x[i] = i
+        qd.loop_config(fuse=False)
+        for i in range(n):
+            y[i] = x[i] * 3.0
+
+    not_fused()
+    num_tasks = _num_offloaded_tasks()
+    np.testing.assert_allclose(y.to_numpy(), np.arange(n) * 3.0)
+    fused()
+    assert _num_offloaded_tasks() < num_tasks
+    np.testing.assert_allclose(y.to_numpy(), np.arange(n) * 2.0)
+
+
+@test_utils.test(fuse_loops=False)
+def test_fuse_loops_disabled():
+    n = 32
+    x = qd.field(qd.f32, shape=n)
+    y = qd.field(qd.f32, shape=n)
+
+    @qd.kernel
+    def two_loops():
+        for i in range(n):
+            x[i] = i
+        for i in range(n):
+            y[i] = x[i] * 2.0
+
+    two_loops()
+    assert _num_offloaded_tasks() >= 2
+    np.testing.assert_allclose(y.to_numpy(), np.arange(n) * 2.0)
+
+
+@test_utils.test()
+def test_fuse_loops_aliased_ndarray_arguments():
+    n = 16
+
+    @qd.kernel
+    def rotate(a: qd.types.NDArray[qd.i32, 1], b: qd.types.NDArray[qd.i32, 1], c: qd.types.NDArray[qd.i32, 1]):
+        for i in range(n):
+            a[i] = i
+        for i in range(n):
+            c[i] = b[(i + 1) % n]
+
+    x = qd.ndarray(qd.i32, (n,))
+    y = qd.ndarray(qd.i32, (n,))
+    # a and b are the same ndarray, so the second loop reads elements written by other iterations of the first one.
+    rotate(x, x, y)
+    assert y.to_numpy().tolist() == [(i + 1) % n for i in range(n)]
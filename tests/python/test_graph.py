@@ -30,7 +30,7 @@ def _graph_num_nodes():
 
 
 @pytest.mark.parametrize("tensor_type", [qd.ndarray, qd.field])
-@test_utils.test()
+@test_utils.test(fuse_loops=False)
 def test_graph_two_loops(tensor_type):
     """A kernel with two top-level for loops should be fused into a CUDA graph."""
     platform_supports_graph = _platform_supports_graph()
@@ -69,7 +69,7 @@ def test_graph_two_loops(tensor_type):
 
 
 @pytest.mark.parametrize("tensor_type", [qd.ndarray, qd.field])
-@test_utils.test()
+@test_utils.test(fuse_loops=False)
 def test_graph_three_loops(tensor_type):
     """A kernel with three top-level for loops."""
     platform_supports_graph = _platform_supports_graph()
@@ -119,7 +119,7 @@ def test_graph_three_loops(tensor_type):
 
 
 @pytest.mark.parametrize("tensor_type", [qd.ndarray, qd.field])
-@test_utils.test()
+@test_utils.test(fuse_loops=False)
 def test_graph_multi_func(tensor_type):
     """A kernel calling three funcs with 2, 4, and 3 top-level for loops."""
     platform_supports_graph = _platform_supports_graph()
@@ -231,7 +231,7 @@ def test_no_graph_annotation(tensor_type):
 
 
 @pytest.mark.parametrize("tensor_type", [qd.ndarray, qd.field])
-@test_utils.test()
+@test_utils.test(fuse_loops=False)
 def test_graph_changed_args(tensor_type):
     """Graph should produce correct results when called with different tensors."""
     platform_supports_graph = _platform_supports_graph()
@@ -289,7 +289,7 @@ def test_graph_changed_args(tensor_type):
 
 
 @pytest.mark.parametrize("tensor_type", [qd.ndarray, qd.field])
-@test_utils.test()
+@test_utils.test(fuse_loops=False)
 def test_graph_different_sizes(tensor_type):
     """Graph must produce correct results when called with different-sized arrays.
 
@@ -339,7 +339,7 @@ def test_graph_different_sizes(tensor_type):
 
 
 @pytest.mark.parametrize("tensor_type", [qd.ndarray, qd.field])
-@test_utils.test()
+@test_utils.test(fuse_loops=False)
 def test_graph_after_reset(tensor_type):
     """graph=True kernel must work correctly after qd.reset()."""
     platform_supports_graph = _platform_supports_graph()
@@ -385,7 +385,7 @@ def test_graph_after_reset(tensor_type):
 
 
 @pytest.mark.parametrize("tensor_type", [qd.ndarray, qd.field])
-@test_utils.test()
+@test_utils.test(fuse_loops=False)
 def test_graph_annotation_cross_platform(tensor_type):
     """graph=True should be a harmless no-op on non-CUDA backends."""
     platform_supports_graph = _platform_supports_graph()
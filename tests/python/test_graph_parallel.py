@@ -255,7 +255,7 @@ def test_graph_parallel_three_sections():
     np.testing.assert_allclose(c.to_numpy(), 3.0)
 
 
-@test_utils.test()
+@test_utils.test(fuse_loops=False)
 def test_graph_parallel_multi_loop_sections():
     """Each qd.graph.parallel section contains several loops; they must chain in order inside the
     qd.graph.parallel section while the two qd.graph.parallel sections run independently. qd.graph.parallel
@@ -0,0 +1,27 @@
+import quadrants as qd
+
+from tests import test_utils
+
+
+@test_utils.test()
+def test_launch_overhead() -> None:
+    @qd.kernel
+    def overhead_fill(a: qd.types.NDArray[qd.i32, 1], value: qd.i32) -> None:
+        for i in range(a.shape[0]):
+            a[i] = value
+
+    a = qd.ndarray(qd.i32, (4,))
+    with qd.profiler.launch_overhead() as overhead:
+        for i in range(3):
+            overhead_fill(a, i)
+    (kernel_overhead,) = [k for name, k in overhead.kernels.items() if name.endswith("overhead_fill")]
+    assert kernel_overhead.num_launches == 3
+    assert kernel_overhead.cpp_launch_ns > 0
+    assert kernel_overhead.template_mapping_ns > 0
+    assert kernel_overhead.compile_ns > 0
+    assert kernel_overhead.other_ns >= 0
+    assert "overhead_fill" in overhead.table()
+    assert a.to_numpy().tolist() == [2] * 4
+
+    overhead_fill(a, 5)
+    assert kernel_overhead.num_launches == 3
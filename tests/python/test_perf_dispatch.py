@@ -1,13 +1,18 @@
+import gc
+import json
+import threading
 from enum import IntEnum
 from typing import cast
 
 import pytest
 
 import quadrants as qd
-from quadrants.lang import _perf_dispatch
+from quadrants._test_tools import qd_init_same_arch
+from quadrants.lang import _perf_dispatch, _perf_dispatch_store
 from quadrants.lang._perf_dispatch import (
     DEFAULT_REPEAT_AFTER_COUNT,
     NUM_FIRST_WARMUP,
+    DispatchImpl,
     PerformanceDispatcher,
     _parse_force_map,
 )
@@ -611,3 +616,269 @@ def test_perf_dispatch_force_multiple_dispatchers(monkeypatch) -> None:
     assert len(called_b) == NUM_FIRST_WARMUP * 2 + 3
     assert all(c == "v2" for c in called_a)
     assert all(c == "v1" for c in called_b)
+
+
+def _make_persistent_dispatcher(called: list[str], with_impl_c: bool = False) -> PerformanceDispatcher:
+    @qd.perf_dispatch(get_geometry_hash=lambda a: hash(a.shape), repeat_after_seconds=0, persist=True)
+    def my_func(a: qd.types.NDArray[qd.i32, 1]): ...
+
+    @my_func.register
+    def impl_a(a: qd.types.NDArray[qd.i32, 1]) -> None:
+        called.append("impl_a")
+
+    @my_func.register
+    def impl_b(a: qd.types.NDArray[qd.i32, 1]) -> None:
+        called.append("impl_b")
+
+    if with_impl_c:
+
+        @my_func.register
+        def impl_c(a: qd.types.NDArray[qd.i32, 1]) -> None:
+            called.append("impl_c")
+
+    return cast(PerformanceDispatcher, my_func)
+
+
+@test_utils.test()
+def test_perf_dispatch_persist_reuses_winner(tmp_path) -> None:
+    qd_init_same_arch(offline_cache_file_path=str(tmp_path))
+    called = []
+    my_func = _make_persistent_dispatcher(called)
+    a = qd.ndarray(qd.i32, (4,))
+    for _ in range(2 * (NUM_FIRST_WARMUP + 1)):
+        my_func(a)
+    geometry = hash(a.shape)
+    winner = my_func._fastest_dispatch_impl_by_geometry_hash[geometry].get_implementation2().__name__
+
+    # qd.init writes the store; a new dispatcher then starts on the winner, as in a new process.
+    qd_init_same_arch(offline_cache_file_path=str(tmp_path))
+    called.clear()
+    my_func = _make_persistent_dispatcher(called)
+    a = qd.ndarray(qd.i32, (4,))
+    my_func(a)
+    my_func(a)
+    assert called == [winner, winner]
+    assert not my_func._trial_count_by_dispatch_impl_by_geometry_hash[geometry]
+
+    # Another set of implementations benchmarks again.
+    called.clear()
+    my_func = _make_persistent_dispatcher(called, with_impl_c=True)
+    for _ in range(3):
+        my_func(a)
+    assert sorted(called) == ["impl_a", "impl_b", "impl_c"]
+
+
+def test_perf_dispatch_store_concurrent_flushes_keep_all_winners(tmp_path) -> None:
+    # Each store stands for a process sharing the cache folder.
+    store_path = str(tmp_path / _perf_dispatch_store.STORE_FILENAME)
+    stores = [_perf_dispatch_store.PerfDispatchStore(store_path) for _ in range(8)]
+    for i, store in enumerate(stores):
+        store.set_winner(f"dispatcher_{i}", 0, "impl_a")
+    threads = [threading.Thread(target=store.flush) for store in stores]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    store = _perf_dispatch_store.PerfDispatchStore(store_path)
+    assert all(store.get_winner(f"dispatcher_{i}", 0) == "impl_a" for i in range(len(stores)))
+
+
+def test_perf_dispatch_store_keeps_most_recent_geometries(monkeypatch, tmp_path) -> None:
+    monkeypatch.setattr(_perf_dispatch_store, "MAX_GEOMETRIES_PER_DISPATCHER", 2)
+    store_path = str(tmp_path / _perf_dispatch_store.STORE_FILENAME)
+    for geometry_hash in [1, 2, 1, 3]:
+        store = _perf_dispatch_store.PerfDispatchStore(store_path)
+        store.set_winner("dispatcher", geometry_hash, "impl_a")
+        store.flush()
+    store = _perf_dispatch_store.PerfDispatchStore(store_path)
+    assert [store.get_winner("dispatcher", geometry_hash) for geometry_hash in [1, 2, 3]] == ["impl_a", None, "impl_a"]
+
+
+def _make_dispatcher_with_fake_timings(
+    timings: dict[str, list[float]], repeat_after_count: int = 0, **kwargs
+) -> PerformanceDispatcher:
+    """A dispatcher over impl_a and impl_b whose calls take, in turn, the durations listed in timings."""
+
+    @qd.perf_dispatch(
+        get_geometry_hash=lambda a: hash(a.shape), first_warmup=0, repeat_after_count=repeat_after_count, **kwargs
+    )
+    def my_func(a: qd.types.NDArray[qd.i32, 1]): ...
+
+    @my_func.register
+    def impl_a(a: qd.types.NDArray[qd.i32, 1]) -> None: ...
+
+    @my_func.register
+    def impl_b(a: qd.types.NDArray[qd.i32, 1]) -> None: ...
+
+    speed_checker = cast(PerformanceDispatcher, my_func)
+    num_calls: dict[str, int] = {"impl_a": 0, "impl_b": 0}
+
+    def timed_call(dispatch_impl, args, kwargs):
+        name = dispatch_impl.get_implementation2().__name__
+        durations = timings[name]
+        elapsed = durations[num_calls[name] % len(durations)]
+        num_calls[name] += 1
+        return dispatch_impl(*args, **kwargs), elapsed
+
+    speed_checker._timed_call = timed_call  # type: ignore[method-assign]
+    return speed_checker
+
+
+@test_utils.test(arch=qd.cpu)
+def test_perf_dispatch_robust_stops_once_separated() -> None:
+    my_func = _make_dispatcher_with_fake_timings({"impl_a": [1.0, 1.1], "impl_b": [2.0, 2.1]}, active=2, max_active=10)
+    a = qd.ndarray(qd.i32, (4,))
+    for _ in range(4):
+        my_func(a)
+    geometry = hash(a.shape)
+    assert my_func._fastest_dispatch_impl_by_geometry_hash[geometry].get_implementation2().__name__ == "impl_a"
+    assert sorted(my_func._trial_count_by_dispatch_impl_by_geometry_hash[geometry].values()) == [2, 2]
+
+
+@test_utils.test(arch=qd.cpu)
+def test_perf_dispatch_robust_samples_until_budget() -> None:
+    # The timings of impl_a and impl_b overlap, so they are timed max_active times each.
+    my_func = _make_dispatcher_with_fake_timings(
+        {"impl_a": [1.0, 2.0, 1.4], "impl_b": [1.5, 1.0, 2.0]}, active=2, max_active=6
+    )
+    a = qd.ndarray(qd.i32, (4,))
+    geometry = hash(a.shape)
+    for _ in range(11):
+        my_func(a)
+        assert geometry not in my_func._fastest_dispatch_impl_by_geometry_hash
+    my_func(a)
+    assert sorted(my_func._trial_count_by_dispatch_impl_by_geometry_hash[geometry].values()) == [6, 6]
+    assert my_func._fastest_dispatch_impl_by_geometry_hash[geometry].get_implementation2().__name__ == "impl_a"
+
+
+@test_utils.test(arch=qd.cpu)
+def test_perf_dispatch_explore_follows_drift() -> None:
+    timings = {"impl_a": [1.0], "impl_b": [2.0]}
+    my_func = _make_dispatcher_with_fake_timings(timings, explore=1.0)
+    a = qd.ndarray(qd.i32, (4,))
+    geometry = hash(a.shape)
+    for _ in range(2):
+        my_func(a)
+    assert my_func._fastest_dispatch_impl_by_geometry_hash[geometry].get_implementation2().__name__ == "impl_a"
+
+    timings["impl_a"] = [3.0]
+    for _ in range(50):
+        my_func(a)
+    assert my_func._fastest_dispatch_impl_by_geometry_hash[geometry].get_implementation2().__name__ == "impl_b"
+
+
+@test_utils.test(arch=qd.cpu)
+def test_perf_dispatch_explore_out_of_range() -> None:
+    with pytest.raises(ValueError, match="explore"):
+
+        @qd.perf_dispatch(get_geometry_hash=lambda a: 0, explore=2.0)
+        def my_func(a: qd.types.NDArray[qd.i32, 1]): ...
+
+
+@test_utils.test()
+def test_perf_dispatch_search_space() -> None:
+    search_space = {"block_dim": [32, 64], "tile": [1, 2]}
+
+    @qd.perf_dispatch(get_geometry_hash=lambda a: hash(a.shape), repeat_after_count=0, search_space=search_space)
+    def my_func(a: qd.types.NDArray[qd.i32, 1]): ...
+
+    @my_func.register
+    @qd.kernel
+    def impl_tiled(a: qd.types.NDArray[qd.i32, 1], block_dim: qd.template(), tile: qd.template()) -> None:
+        qd.loop_config(block_dim=block_dim)
+        for i in range(a.shape[0] // tile):
+            for j in qd.static(range(tile)):
+                a[i * tile + j] += 1
+
+    speed_checker = cast(PerformanceDispatcher, my_func)
+    assert [d.name for d in speed_checker._dispatch_impls] == [
+        "impl_tiled[block_dim=32;tile=1]",
+        "impl_tiled[block_dim=32;tile=2]",
+        "impl_tiled[block_dim=64;tile=1]",
+        "impl_tiled[block_dim=64;tile=2]",
+    ]
+    a = qd.ndarray(qd.i32, (64,))
+    assert my_func.get_best_config(a) is None
+    num_calls = 4 * (NUM_FIRST_WARMUP + 1) + 2
+    for _ in range(num_calls):
+        my_func(a)
+    assert (a.to_numpy() == num_calls).all()
+    assert my_func.get_best_config(a) in [
+        {"block_dim": block_dim, "tile": tile} for block_dim in [32, 64] for tile in [1, 2]
+    ]
+
+
+@test_utils.test(arch=qd.cpu)
+def test_perf_dispatch_search_space_unknown_parameter() -> None:
+    @qd.perf_dispatch(get_geometry_hash=lambda a: 0, search_space={"tile": [4, 8]})
+    def my_func(a: qd.types.NDArray[qd.i32, 1]): ...
+
+    with pytest.raises(QuadrantsSyntaxError, match="not in perf_dispatch function prototype"):
+
+        @my_func.register
+        def impl_a(a: qd.types.NDArray[qd.i32, 1], block_dim: int) -> None: ...
+
+
+@test_utils.test(arch=qd.cpu)
+def test_perf_dispatch_search_space_prototype_parameter() -> None:
+    with pytest.raises(ValueError, match="'block_dim' is also a prototype parameter"):
+
+        @qd.perf_dispatch(get_geometry_hash=lambda a: 0, search_space={"block_dim": [32, 64]})
+        def my_func(a: qd.types.NDArray[qd.i32, 1], block_dim: int): ...
+
+
+def test_perf_dispatch_impl_config_passed_as_argument() -> None:
+    def impl_a(a, **kwargs) -> None: ...
+
+    dispatch_impl = DispatchImpl(implementation1=impl_a, is_compatible=None, config={"tile": 4})
+    with pytest.raises(TypeError, match="'tile'"):
+        dispatch_impl(None, tile=8)
+
+
+@test_utils.test(arch=qd.cpu)
+def test_perf_dispatch_report() -> None:
+    my_func = _make_dispatcher_with_fake_timings({"impl_a": [1.0], "impl_b": [3.0]}, repeat_after_count=3)
+    a = qd.ndarray(qd.i32, (4,))
+    for _ in range(6):
+        my_func(a)
+
+    report = my_func.report()
+    assert report.name == "my_func"
+    assert report.implementations == ["impl_a", "impl_b"]
+    (geometry,) = report.geometries
+    assert geometry.geometry_hash == hash(a.shape)
+    assert geometry.winner == "impl_a"
+    assert geometry.speedup == pytest.approx(3.0)
+    assert geometry.num_benchmarks == 2
+    assert geometry.num_rebenchmarks == 1
+    assert geometry.benchmark_seconds == pytest.approx(8.0)
+    assert [(i.name, i.num_trials, i.times) for i in geometry.implementations] == [
+        ("impl_a", 1, [1.0]),
+        ("impl_b", 1, [3.0]),
+    ]
+    assert json.loads(report.to_json())["geometries"][0]["winner"] == "impl_a"
+    assert any(r.geometries == report.geometries for r in qd.perf_dispatch_report())
+
+
+@test_utils.test(arch=qd.cpu)
+def test_perf_dispatch_report_drops_collected_dispatchers() -> None:
+    gc.collect()
+    num_dispatchers = len(_perf_dispatch._dispatchers)
+    my_func = _make_dispatcher_with_fake_timings({"impl_a": [1.0], "impl_b": [3.0]})
+    assert len(_perf_dispatch._dispatchers) == num_dispatchers + 1
+    del my_func
+    gc.collect()
+    assert len(_perf_dispatch._dispatchers) == num_dispatchers
+
+
+@test_utils.test(arch=qd.cpu)
+def test_perf_dispatch_report_exploration() -> None:
+    my_func = _make_dispatcher_with_fake_timings({"impl_a": [1.0], "impl_b": [2.0]}, explore=1.0)
+    a = qd.ndarray(qd.i32, (4,))
+    for _ in range(12):
+        my_func(a)
+    (geometry,) = my_func.report().geometries
+    assert geometry.num_explorations == 10
+    assert geometry.benchmark_seconds == pytest.approx(3.0)
+    assert 10.0 <= geometry.exploration_seconds <= 20.0
+    assert my_func.report().exploration_seconds == geometry.exploration_seconds
@@ -0,0 +1,143 @@
+import pathlib
+
+import pytest
+
+import quadrants as qd
+from quadrants._test_tools import qd_init_same_arch
+
+from tests import test_utils
+
+
+def _make_kernels(num_kernels: int) -> list:
+    kernels = []
+    for k in range(num_kernels):
+
+        @qd.kernel
+        def fill(a: qd.types.NDArray[qd.i32, 1], offset: qd.template()) -> None:
+            for i in range(a.shape[0]):
+                a[i] = i + offset
+
+        kernels.append((fill, k))
+    return kernels
+
+
+@test_utils.test()
+def test_precompile() -> None:
+    kernels = _make_kernels(6)
+    a = qd.ndarray(qd.i32, (4,))
+    results = qd.precompile([(fill, (a, offset)) for fill, offset in kernels])
+    assert len(results) == len(kernels)
+    for result in results:
+        assert result.name == "fill"
+        assert result.materialize_time > 0
+
+    for fill, offset in kernels:
+        fill(a, offset)
+        assert fill._primal.launch_observations.found_kernel_in_materialize_cache
+        assert a.to_numpy().tolist() == [i + offset for i in range(4)]
+
+
+@test_utils.test()
+def test_precompile_specializations_and_duplicates() -> None:
+    fill, _offset = _make_kernels(1)[0]
+    a = qd.ndarray(qd.i32, (4,))
+    results = qd.precompile([(fill, (a, 1)), (fill, (a, 2)), (fill, (a, 1))], num_threads=2)
+    assert len(results) == 3
+    assert len(fill._primal.compiled_kernel_data_by_key) == 2
+
+    fill(a, 2)
+    assert fill._primal.launch_observations.found_kernel_in_materialize_cache
+    assert a.to_numpy().tolist() == [2, 3, 4, 5]
+
+
+@test_utils.test()
+def test_precompile_data_oriented() -> None:
+    @qd.data_oriented
+    class Filler:
+        def __init__(self) -> None:
+            self.value = 3
+
+        @qd.kernel
+        def fill(self, a: qd.types.NDArray[qd.i32, 1]) -> None:
+            for i in range(a.shape[0]):
+                a[i] = self.value
+
+    filler = Filler()
+    a = qd.ndarray(qd.i32, (4,))
+    qd.precompile([(filler.fill, (a,))])
+    filler.fill(a)
+    assert Filler.fill._primal.launch_observations.found_kernel_in_materialize_cache
+    assert a.to_numpy().tolist() == [3, 3, 3, 3]
+
+
+@test_utils.test()
+def test_precompile_rejects_non_kernels() -> None:
+    with pytest.raises(TypeError):
+        qd.precompile([(lambda: None, ())])
+
+
+@test_utils.test(arch=qd.cpu)
+def test_precompile_stores_fastcache(tmp_path: pathlib.Path) -> None:
+    qd_init_same_arch(offline_cache_file_path=str(tmp_path), offline_cache=True)
+
+    @qd.kernel(fastcache=True)
+    def k1(a: qd.types.NDArray[qd.i32, 1]) -> None:
+        for i in range(a.shape[0]):
+            a[i] = i
+
+    a = qd.ndarray(qd.i32, (4,))
+    (result,) = qd.precompile([(k1, (a,))])
+    assert not result.src_ll_cache_hit
+    assert k1._primal.src_ll_cache_observations.cache_stored
+
+    qd_init_same_arch(offline_cache_file_path=str(tmp_path), offline_cache=True)
+    a = qd.ndarray(qd.i32, (4,))
+    (result,) = qd.precompile([(k1, (a,))])
+    assert result.src_ll_cache_hit
+    k1(a)
+    assert a.to_numpy().tolist() == [0, 1, 2, 3]
+
+
+@test_utils.test()
+def test_compile_async() -> None:
+    fill, _offset = _make_kernels(1)[0]
+    a = qd.ndarray(qd.i32, (4,))
+    future = fill.compile_async(a, 5)
+    result = future.result()
+    assert result.name == "fill"
+    assert result.materialize_time > 0
+    assert len(fill._primal.compiled_kernel_data_by_key) == 1
+    assert fill.compile_async(a, 5).done()
+
+    fill(a, 5)
+    assert fill._primal.launch_observations.found_kernel_in_materialize_cache
+    assert a.to_numpy().tolist() == [5, 6, 7, 8]
+
+
+@test_utils.test()
+def test_compile_async_launch_waits() -> None:
+    fill, _offset = _make_kernels(1)[0]
+    a = qd.ndarray(qd.i32, (4,))
+    future = fill.compile_async(a, 1)
+    # Waits for the background compile, if still running.
+    fill(a, 1)
+    assert a.to_numpy().tolist() == [1, 2, 3, 4]
+    assert future.result().name == "fill"
+    assert not fill._primal.pending_compiles
+
+
+@test_utils.test()
+def test_compile_async_data_oriented() -> None:
+    @qd.data_oriented
+    class Filler:
+        @qd.kernel
+        def fill(self, a: qd.types.NDArray[qd.i32, 1]) -> None:
+            for i in range(a.shape[0]):
+                a[i] = 7
+
+    filler = Filler()
+    a = qd.ndarray(qd.i32, (4,))
+    filler.fill.compile_async(a).result()
+    filler.fill(a)
+    assert Filler.fill._primal.launch_observations.found_kernel_in_materialize_cache
+    assert a.to_numpy().tolist() == [7, 7, 7, 7]
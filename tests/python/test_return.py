@@ -360,3 +360,27 @@ def test_ret_4k():
     ret = foo()
     for i in range(1024):
         assert ret[i] == i
+
+
+@test_utils.test()
+def test_async_return():
+    @qd.kernel(async_return=True)
+    def total(a: qd.types.NDArray[qd.f32, 1], scale: qd.f32) -> qd.f32:
+        s = 0.0
+        for i in range(a.shape[0]):
+            s += a[i] * scale
+        return s
+
+    @qd.kernel(async_return=True)
+    def two() -> Tuple[qd.i32, qd.f32]:
+        return 1, 2.5
+
+    a = qd.ndarray(qd.f32, (8,))
+    a.fill(1.0)
+    futures = [total(a, float(i)) for i in range(4)]
+    assert all(isinstance(future, qd.KernelFuture) for future in futures)
+    assert [future.result() for future in futures] == [approx(8.0 * i) for i in range(4)]
+    assert futures[0].done()
+    # The result is read back once.
+    assert futures[1].result() == approx(8.0)
+    assert two().result() == (1, approx(2.5))
@@ -0,0 +1,62 @@
+import pathlib
+
+import quadrants as qd
+from quadrants._test_tools import qd_init_same_arch
+
+from tests import test_utils
+
+
+@test_utils.test(arch=qd.cpu)
+def test_tiered_compilation(tmp_path: pathlib.Path) -> None:
+    qd_init_same_arch(offline_cache_file_path=str(tmp_path), offline_cache=True, tiered_compilation=True)
+
+    @qd.kernel
+    def fill(a: qd.types.NDArray[qd.i32, 1]) -> None:
+        for i in range(a.shape[0]):
+            a[i] = i * 2
+
+    a = qd.ndarray(qd.i32, (4,))
+    fill(a)
+    assert a.to_numpy().tolist() == [0, 2, 4, 6]
+    ((key, quick_build),) = fill._primal.compiled_kernel_data_by_key.items()
+
+    qd.sync_tiered_compilation()
+    optimized_build = fill._primal.compiled_kernel_data_by_key[key]
+    assert optimized_build is not quick_build
+    a.fill(0)
+    fill(a)
+    assert a.to_numpy().tolist() == [0, 2, 4, 6]
+
+    # The optimized build was written to the offline cache, so a new program starts from it.
+    qd_init_same_arch(offline_cache_file_path=str(tmp_path), offline_cache=True, tiered_compilation=True)
+    a = qd.ndarray(qd.i32, (4,))
+    fill(a)
+    assert a.to_numpy().tolist() == [0, 2, 4, 6]
+    assert fill._primal.fe_ll_cache_observations.cache_hit
+
+
+@test_utils.test(arch=qd.cpu)
+def test_tiered_compilation_per_kernel(tmp_path: pathlib.Path) -> None:
+    qd_init_same_arch(offline_cache_file_path=str(tmp_path), offline_cache=True)
+    qd.cache.reset_stats()
+
+    @qd.kernel(tiered=True)
+    def tiered(a: qd.types.NDArray[qd.f32, 1]) -> None:
+        for i in range(a.shape[0]):
+            a[i] += 1.0
+
+    @qd.kernel
+    def not_tiered(a: qd.types.NDArray[qd.f32, 1]) -> None:
+        for i in range(a.shape[0]):
+            a[i] += 1.0
+
+    a = qd.ndarray(qd.f32, (4,))
+    tiered(a)
+    not_tiered(a)
+    assert a.to_numpy().tolist() == [2.0] * 4
+    ((key, compiled_kernel_data),) = not_tiered._primal.compiled_kernel_data_by_key.items()
+    qd.sync_tiered_compilation()
+    # Only the optimized builds are compiled through the offline cache.
+    assert tiered._primal.cache_stats.offline_cache_misses == 1
+    assert not_tiered._primal.cache_stats.offline_cache_misses == 1
+    assert not_tiered._primal.compiled_kernel_data_by_key[key] is compiled_kernel_data